@@ -1,6 +1,7 @@
 from managers.database_manager import DatabaseManager
+from managers.config_manager import ConfigManager
 from actions.fix import fix
-import yaml
+from managers.rank_tiers import RankTiers
 from datetime import datetime
 import time
 from bson import Timestamp
@@ -10,8 +11,7 @@ async def elocal(bot, discordid, result, ismvp, gameid, player_stats):
     
     try:
         
-        with open('configs/config.yml', 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
+        config = ConfigManager().data
         
         
         guild_id = config['bot']['guildid']
@@ -31,7 +31,7 @@ async def elocal(bot, discordid, result, ismvp, gameid, player_stats):
         loosestreak = user.get('loosestreak', 0)
         highstwinstreak = user.get('highstwinstreak', 0)
         current_mvp_count = user.get('mvp_count', 0)        
-        rank = db_manager.find_one('elos', {'minelo': {'$lte': current_elo}, 'maxelo': {'$gte': current_elo}})
+        rank = RankTiers().get_tier(current_elo)
         if not rank:
             print(f'Rank not found for elo {current_elo}.')
             return
@@ -64,16 +64,11 @@ async def elocal(bot, discordid, result, ismvp, gameid, player_stats):
             elo_change += rank.get('winelo', 0)
             
             
-            booster_doc = db_manager.find_one('booster', {})
-            if booster_doc:
-                try:
-                    multiplier = float(booster_doc.get('multiplier', '1'))
-                    if multiplier > 1:
-                        original_elo = elo_change
-                        elo_change = int(round(elo_change * multiplier))
-                        print(f"Applied booster {multiplier}x: Win ELO {original_elo} → {elo_change}")
-                except (ValueError, TypeError) as e:
-                    print(f"Error applying booster multiplier: {e}")
+            multiplier = bot.settings_cache.booster_multiplier()
+            if multiplier > 1:
+                original_elo = elo_change
+                elo_change = int(round(elo_change * multiplier))
+                print(f"Applied booster {multiplier}x: Win ELO {original_elo} → {elo_change}")
             
             exp_gain += 10
         elif result == 'lose':
@@ -1,29 +1,16 @@
 
-import yaml
 import discord
 import asyncio
-import re
 from managers.database_manager import DatabaseManager
+from managers.config_manager import ConfigManager
+from managers.rank_tiers import RankTiers
 from managers.workermanager import WorkerManager
 
-def extract_role_id(raw_id):
-    if isinstance(raw_id, int):
-        return raw_id
-    if isinstance(raw_id, str):
-        match = re.match(r'<@&(\d+)>', raw_id)
-        if match:
-            return int(match.group(1))
-        try:
-            return int(raw_id)
-        except Exception:
-            pass
-    raise ValueError(f"Invalid roleid: {raw_id}")
-
 async def update_member_roles(member, roles_to_add, roles_to_remove, reason):
     
     
     worker_manager = getattr(getattr(member, 'bot', None), 'worker_manager', None)
-    if worker_manager and worker_manager.enabled:
+    if worker_manager and worker_manager.available:
         try:
             
             bot = worker_manager.worker_bots[0] if worker_manager.worker_bots else None
@@ -50,7 +37,7 @@ async def update_member_roles(member, roles_to_add, roles_to_remove, reason):
 async def reset_member_nickname(member, reason):
     
     worker_manager = getattr(getattr(member, 'bot', None), 'worker_manager', None)
-    if worker_manager and worker_manager.enabled:
+    if worker_manager and worker_manager.available:
         try:
             bot = worker_manager.worker_bots[0] if worker_manager.worker_bots else None
             if bot:
@@ -73,7 +60,7 @@ async def reset_member_nickname(member, reason):
 async def update_member_nickname(member, new_nick, reason):
     
     worker_manager = getattr(getattr(member, 'bot', None), 'worker_manager', None)
-    if worker_manager and worker_manager.enabled:
+    if worker_manager and worker_manager.available:
         try:
             bot = worker_manager.worker_bots[0] if worker_manager.worker_bots else None
             if bot:
@@ -115,27 +102,18 @@ async def fix(bot, discordid, guild_id):
             print(f"[fix] User with ID {discordid} not found in guild {guild_id}.")
             return
 
-        try:
-            with open('configs/config.yml', 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-        except Exception as e:
-            print(f"[fix] Failed to load config: {e}")
-            return
+        config = ConfigManager().data
 
         try:
             user = db_manager.find_one('users', {'discordid': str(discordid)})
         except Exception as e:
             print(f"[fix] DB error fetching user: {e}")
             user = None
+        rank_tiers = RankTiers()
         try:
-            elos = db_manager.find('elos', {})
-        except Exception as e:
-            print(f"[fix] DB error fetching elos: {e}")
-            elos = []
-        try:
-            elo_role_ids = [extract_role_id(elo_entry['roleid']) for elo_entry in elos]
+            elo_role_ids = rank_tiers.role_ids()
         except Exception as e:
-            print(f"[fix] Error extracting ELO role IDs: {e}")
+            print(f"[fix] Error loading ELO role IDs: {e}")
             elo_role_ids = []
         try:
             current_roles = set(role.id for role in getattr(member, 'roles', []))
@@ -220,17 +198,9 @@ async def fix(bot, discordid, guild_id):
         
         correct_role = None
         try:
-            for elo_entry in elos:
-                try:
-                    minelo = elo_entry.get('minelo', float('-inf'))
-                    maxelo = elo_entry.get('maxelo', float('inf'))
-                    roleid = extract_role_id(elo_entry['roleid'])
-                except Exception as e:
-                    print(f"[fix] Error parsing elo_entry: {e}")
-                    continue
-                if minelo <= elo <= maxelo:
-                    correct_role = discord.Object(id=roleid)
-                    break
+            correct_role_id = rank_tiers.get_role_id(elo)
+            if correct_role_id is not None:
+                correct_role = discord.Object(id=correct_role_id)
         except Exception as e:
             print(f"[fix] Error determining correct ELO role: {e}")
         roles_to_add = []
@@ -1,8 +1,9 @@
 from PIL import Image, ImageDraw, ImageFont
 import os
 import requests
-import yaml
 from managers.database_manager import DatabaseManager
+from managers.config_manager import ConfigManager
+from managers.rank_tiers import RankTiers
 import discord
 
 db_manager = DatabaseManager()
@@ -66,10 +67,9 @@ class ScoreImage:
                   font=ImageFont.truetype(font_paths["PoppinsLight"], size=54))
 
         
-        with open("configs/config.yml", "r") as config_file:
-            config = yaml.safe_load(config_file)
-            servername = config['server']['servername']
-            invitelink = config['server']['invitelink']
+        config = ConfigManager().data
+        servername = config['server']['servername']
+        invitelink = config['server']['invitelink']
 
         draw.text((120, 952), f"{servername}", fill="#757474",
                   font=ImageFont.truetype(font_paths["PoppinsLight"], size=54))
@@ -227,8 +227,8 @@ class ScoreImage:
 
     @staticmethod
     def get_rank_from_elo(elo):
-        elos = list(db_manager.find('elos', {}, limit=None))
-        if not elos:
+        rank_tiers = RankTiers()
+        if not rank_tiers.all():
             
             if elo < 100:
                 return "coal"
@@ -245,10 +245,7 @@ class ScoreImage:
             else:
                 return "obsidian"
         
-        elos.sort(key=lambda x: x.get('minelo', 0))
-        for rank in elos:
-            minelo = rank.get('minelo', 0)
-            maxelo = rank.get('maxelo', 0)
-            if minelo <= elo <= maxelo:
-                return rank.get('rankname', 'unknown')
+        rank = rank_tiers.get_tier(elo)
+        if rank:
+            return rank.get('rankname', 'unknown')
         return "unknown"
@@ -1,23 +1,18 @@
 
-import yaml
-import asyncio
 import discord
-import os
 import time
 from bson import Timestamp
 from managers.database_manager import DatabaseManager
+from managers.config_manager import ConfigManager
 from actions.elocal import elocal
-from utils.discord_utils import delete_channel
-from utils.embed_builder import EmbedBuilder
-from actions.transcript_creator import create_transcript
-from actions.scoreimage import ScoreImage
+from managers.metrics_manager import MetricsManager
 
+@MetricsManager().scoring_duration.timed()
 async def scoring(bot, gameid, winningteamnumber, mvp_ids, bedbreaker_ids=None, player_stats=None, iscasual=False, scoredby=None):
     db_manager = DatabaseManager()
-    embed_builder = EmbedBuilder()
+    embed_builder = bot.services.embed_builder
     try:
-        with open('configs/config.yml', 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
+        config = ConfigManager().data
         guild_id = int(config['bot']['guildid'])
         exp_gain = config.get('guild', {}).get('guildwinexp', 10)
 
@@ -131,24 +126,19 @@ async def scoring(bot, gameid, winningteamnumber, mvp_ids, bedbreaker_ids=None,
             text_channel = bot.get_channel(int(text_channel_id))
             if text_channel:
                 await text_channel.send(embed=embed)
-            await asyncio.sleep(30)
-            try:
-                waiting_vc_id = int(config['channels']['waitingvc'])
-                waiting_vc = bot.get_channel(waiting_vc_id)
-                for channel_id in [game_channels.get('team1voicechannelid'), game_channels.get('team2voicechannelid')]:
-                    if channel_id:
-                        channel = bot.get_channel(int(channel_id))
-                        if channel and isinstance(channel, discord.VoiceChannel):
-                            for member in channel.members:
-                                await member.move_to(waiting_vc)
-                if text_channel_id:
-                    await delete_channel(int(text_channel_id), bot.get_guild(guild_id))
-                for vc_key in ['team1voicechannelid', 'team2voicechannelid']:
-                    vc_id = game_channels.get(vc_key)
-                    if vc_id:
-                        await delete_channel(int(vc_id), bot.get_guild(guild_id))
-            except Exception as e:
-                print(f'Error during channel cleanup: {e}')
+            voice_channel_ids = [game_channels.get('team1voicechannelid'), game_channels.get('team2voicechannelid')]
+            bot.job_queue.enqueue(
+                'move_members',
+                {
+                    'voice_channel_ids': [channel_id for channel_id in voice_channel_ids if channel_id],
+                    'target_channel_id': str(config['channels']['waitingvc'])
+                },
+                delay=30,
+                then=[bot.job_queue.job('delete_channels', {
+                    'guild_id': guild_id,
+                    'channel_ids': [text_channel_id] + voice_channel_ids
+                })]
+            )
             return
 
         
@@ -180,9 +170,7 @@ async def scoring(bot, gameid, winningteamnumber, mvp_ids, bedbreaker_ids=None,
                 player_stats_data = {'bedbroke': is_bedbreaker}
                 
                 
-                with open('configs/config.yml', 'r', encoding='utf-8') as file:
-                    config = yaml.safe_load(file)
-                    websocket_enabled = config.get('websocket', {}).get('enabled', False)
+                websocket_enabled = config.get('websocket', {}).get('enabled', False)
                 
                 if websocket_enabled and isinstance(player_stats, dict) and user.get('ign') in player_stats:
                     stats = player_stats[user.get('ign')]
@@ -282,34 +270,29 @@ async def scoring(bot, gameid, winningteamnumber, mvp_ids, bedbreaker_ids=None,
                     ismvp = player_id in mvp_ids
                     await elocal(bot, player_id, result, ismvp, gameid, player_stats)
 
+        websocket_manager = getattr(bot, 'websocket_manager', None)
+        if websocket_manager:
+            websocket_manager.api_manager.invalidate_players(team1_ids + team2_ids)
         
-        os.makedirs('temp', exist_ok=True)
-        output_path = ScoreImage.generate_score_image(gameid, winningteamnumber, mvp_ids)
-        scoring_channel = bot.get_channel(int(config['channels']['scoring']))
-        if scoring_channel:
-            with open(output_path, 'rb') as image_file:
-                await scoring_channel.send(content=all_mentions, file=discord.File(image_file))
-        text_channel = bot.get_channel(int(text_channel_id))
-        if text_channel:
-            with open(output_path, 'rb') as image_file:
-                await text_channel.send(file=discord.File(image_file))
-
-        
-        warning_embed = embed_builder.build_warning(
-            title="Channel Deletion Warning",
-            description="This channel will be deleted in 30 seconds."
+        bot.job_queue.enqueue(
+            'score_image',
+            {
+                'gameid': gameid,
+                'winningteamnumber': winningteamnumber,
+                'mvp_ids': mvp_ids,
+                'mentions': all_mentions,
+                'scoring_channel_id': str(config['channels']['scoring']),
+                'text_channel_id': str(text_channel_id),
+                'deletion_notice': 30
+            },
+            then=[bot.job_queue.job('transcript', {
+                'channel_id': str(text_channel_id),
+                'title': f"Game #{gameid} Transcript"
+            }, delay=30, then=[bot.job_queue.job('delete_channels', {
+                'guild_id': guild_id,
+                'channel_ids': [text_channel_id]
+            })])]
         )
-        if text_channel:
-            await text_channel.send(embed=warning_embed)
-        await asyncio.sleep(30)
-        try:
-            try:
-                await create_transcript(bot, int(text_channel_id), f"Game #{gameid} Transcript")
-            except Exception as transcript_error:
-                print(f'Error creating transcript for game {gameid}: {str(transcript_error)}')
-            await delete_channel(int(text_channel_id), bot.get_guild(guild_id))
-        except Exception as e:
-            print(f'Error during channel cleanup: {e}')
     except PermissionError as e:
         print(f"Permission error while creating or accessing the file: {e}")
     except Exception as e:
@@ -0,0 +1,72 @@
+import asyncio
+import os
+import discord
+from utils.discord_utils import delete_channel
+from actions.transcript_creator import create_transcript
+
+
+async def post_score_image(bot, payload):
+    from actions.scoreimage import ScoreImage
+
+    os.makedirs('temp', exist_ok=True)
+    output_path = await asyncio.to_thread(
+        ScoreImage.generate_score_image,
+        payload['gameid'],
+        payload['winningteamnumber'],
+        payload['mvp_ids']
+    )
+
+    scoring_channel = bot.get_channel(int(payload['scoring_channel_id']))
+    if scoring_channel:
+        with open(output_path, 'rb') as image_file:
+            await scoring_channel.send(content=payload.get('mentions', ''), file=discord.File(image_file))
+
+    text_channel = bot.get_channel(int(payload['text_channel_id']))
+    if text_channel:
+        with open(output_path, 'rb') as image_file:
+            await text_channel.send(file=discord.File(image_file))
+
+        if payload.get('deletion_notice'):
+            warning_embed = bot.services.embed_builder.build_warning(
+                title="Channel Deletion Warning",
+                description=f"This channel will be deleted in {payload['deletion_notice']} seconds."
+            )
+            await text_channel.send(embed=warning_embed)
+
+
+async def transcribe_channel(bot, payload):
+    channel_id = int(payload['channel_id'])
+    if not bot.get_channel(channel_id):
+        print(f"Skipping transcript for channel {channel_id}, channel no longer exists")
+        return
+    if not await create_transcript(bot, channel_id, payload['title']):
+        raise RuntimeError(f"Transcript for channel {channel_id} was not created")
+
+
+async def move_members(bot, payload):
+    target_channel = bot.get_channel(int(payload['target_channel_id']))
+    moves = []
+    for channel_id in payload['voice_channel_ids']:
+        channel = bot.get_channel(int(channel_id))
+        if channel and isinstance(channel, discord.VoiceChannel):
+            moves.extend(member.move_to(target_channel) for member in channel.members)
+    results = await asyncio.gather(*moves, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Error moving member out of game channel: {result}")
+
+
+async def delete_channels(bot, payload):
+    guild = bot.get_guild(int(payload['guild_id']))
+    if not guild:
+        raise RuntimeError(f"Guild with ID {payload['guild_id']} not found")
+    for channel_id in payload['channel_ids']:
+        if channel_id:
+            await delete_channel(int(channel_id), guild)
+
+
+def register_teardown_jobs(job_queue):
+    job_queue.register('score_image', post_score_image)
+    job_queue.register('transcript', transcribe_channel)
+    job_queue.register('move_members', move_members)
+    job_queue.register('delete_channels', delete_channels)
@@ -1,14 +1,26 @@
+import asyncio
 import discord
-import yaml
 from datetime import datetime
+from collections import deque
+import gzip
 import io
-import chat_exporter
+import time
+from managers.config_manager import ConfigManager
+
+transcript_timings = deque(maxlen=100)
+
+
+def _encode_transcript(transcript: str, compress: bool) -> bytes:
+    data = transcript.encode()
+    if compress:
+        return gzip.compress(data, compresslevel=6)
+    return data
+
 
 async def create_transcript(bot, channel_id: int, title: str):
     try:
         
-        with open('configs/config.yml', 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
+        config = ConfigManager().data
         
         
         source_channel = bot.get_channel(channel_id)
@@ -23,7 +35,10 @@ async def create_transcript(bot, channel_id: int, title: str):
         if not transcript_channel:
             raise ValueError(f"Transcript channel with ID {transcript_channel_id} not found")
         
+        compress = config.get('transcripts', {}).get('compress', True)
+        
         
+        fetch_started = time.perf_counter()
         messages = []
         users = set()
         image_count = 0
@@ -34,11 +49,14 @@ async def create_transcript(bot, channel_id: int, title: str):
             
             image_count += len([a for a in message.attachments if a.content_type and 'image' in a.content_type])
             image_count += len([e for e in message.embeds if e.image or e.thumbnail])
+        fetch_time = time.perf_counter() - fetch_started
         
         
-        transcript = await chat_exporter.export(
+        render_started = time.perf_counter()
+        import chat_exporter
+        transcript = await chat_exporter.raw_export(
             source_channel,
-            limit=None,
+            messages,
             tz_info="UTC",
             military_time=True,
             bot=bot,
@@ -47,9 +65,13 @@ async def create_transcript(bot, channel_id: int, title: str):
         if transcript is None:
             return False
         
+        payload = await asyncio.to_thread(_encode_transcript, transcript, compress)
+        render_time = time.perf_counter() - render_started
+        
+        filename = f'transcript-{channel_id}.html.gz' if compress else f'transcript-{channel_id}.html'
         transcript_file = discord.File(
-            io.BytesIO(transcript.encode()),
-            filename=f'transcript-{channel_id}.html'
+            io.BytesIO(payload),
+            filename=filename
         )
         
         embed = discord.Embed(
@@ -64,13 +86,27 @@ async def create_transcript(bot, channel_id: int, title: str):
         embed.set_footer(text=f"Transcript created at")
         
         
+        upload_started = time.perf_counter()
         await transcript_channel.send(
             embed=embed,
             file=transcript_file
         )
+        upload_time = time.perf_counter() - upload_started
         
-        return True
+        transcript_timings.append({
+            'channelid': str(channel_id),
+            'title': title,
+            'messages': len(messages),
+            'bytes': len(payload),
+            'fetch': fetch_time,
+            'render': render_time,
+            'upload': upload_time
+        })
+        print(f"Transcript for {channel_id}: {len(messages)} messages, {len(payload)} bytes, "
+              f"fetch={fetch_time * 1000:.0f}ms render={render_time * 1000:.0f}ms upload={upload_time * 1000:.0f}ms")
         
+        return True
+
     except Exception as e:
         print(f"Error creating transcript: {e}")
         return False
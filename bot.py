@@ -2,21 +2,26 @@ import discord
 from discord.ext import commands
 import logging
 import sys
-import yaml
-import os
 from managers.command_manager import CommandManager
 from managers.database_manager import DatabaseManager
 from managers.event_manager import EventManager
-from utils.error_handler import ErrorHandler
-from utils.embed_builder import EmbedBuilder
-from managers.party_manager import PartyManager
+from utils.startup_timer import StartupTimer
 from managers.ban_manager import BanManager
+from managers.expiry_manager import ExpiryManager
+from managers.queue_registry import QueueRegistry
+from managers.job_queue import JobQueue
+from managers.analytics_manager import AnalyticsManager
+from managers.rank_tiers import RankTiers
+from managers.config_manager import ConfigManager
+from managers.settings_cache import SettingsCache
+from managers.leaderboard_manager import LeaderboardManager
+from managers.ign_resolver import IgnResolver
+from managers.metrics_manager import MetricsManager
+from managers.service_container import ServiceContainer
 from managers.strikes_manager import StrikesManager
 from managers.screenshare_manager import ScreenshareManager
 from utils.daily_elo_reset import DailyEloReset
 from utils.elo_decay import EloDecay
-from managers.permission_manager import PermissionManager
-from managers.mute_manager import MuteManager
 from managers.websocket_manager import WebSocketManager
 import asyncio
 from discord.ext import tasks
@@ -82,7 +87,7 @@ class Bot(commands.Bot):
         intents.message_content = True
         intents.members = True
 
-        self.config = self.load_config()
+        self.config_manager = ConfigManager()
 
         logging.basicConfig(
             level=logging.DEBUG,
@@ -101,19 +106,23 @@ class Bot(commands.Bot):
         )
 
         self.database_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(self)
+        self.queue_registry = QueueRegistry(self.database_manager)
+        self.job_queue = JobQueue(self)
+        self.analytics_manager = AnalyticsManager(self.database_manager)
+        self.rank_tiers = RankTiers(self.database_manager)
+        self.settings_cache = SettingsCache(self.database_manager)
+        self.leaderboard_manager = LeaderboardManager(self.database_manager)
+        self.ign_resolver = IgnResolver(self.database_manager)
+        self.metrics_manager = MetricsManager()
+        self.services = ServiceContainer(self)
         self.command_manager = CommandManager(self)
         self.event_manager = EventManager(self)
-        self.party_manager = PartyManager(
-            config_file="configs/config.yml", db_manager=self.database_manager
-        )
+        self.expiry_manager = ExpiryManager(self)
         self.ban_manager = BanManager(self)
         self.strikes_manager = StrikesManager(self)
-        self.permission_manager = PermissionManager()
-        self.mute_manager = MuteManager(self)
         self.screenshare_manager = ScreenshareManager(self)
         self.websocket_manager = WebSocketManager(self, self.config)
+        self.config_manager.subscribe(self._on_config_reload)
 
         self.worker_manager = None
         self.queue_processor = None
@@ -122,86 +131,133 @@ class Bot(commands.Bot):
 
         self._setup_signal_handlers()
 
+    @property
+    def config(self):
+        return self.config_manager.data
+
+    @property
+    def embed_builder(self):
+        return self.services.embed_builder
+
+    @property
+    def error_handler(self):
+        return self.services.error_handler
+
+    @property
+    def permission_manager(self):
+        return self.services.permission_manager
+
+    @property
+    def party_manager(self):
+        return self.services.party_manager
+
+    @property
+    def mute_manager(self):
+        return self.services.mute_manager
+
     def load_token(self) -> str:
-        config_path = os.path.join("configs", "config.yml")
-        try:
-            with open(config_path, "r", encoding="utf-8") as file:
-                config = yaml.safe_load(file)
-                return config["bot"]["bottoken"]
-        except Exception as e:
-            self.logger.error(f"Failed to load bot token: {e}")
-            raise
+        return self.config["bot"]["bottoken"]
 
-    def load_config(self) -> dict:
-        config_path = os.path.join("configs", "config.yml")
-        try:
-            with open(config_path, "r", encoding="utf-8") as file:
-                return yaml.safe_load(file)
-        except Exception as e:
-            self.logger.error(f"Failed to load configuration: {e}")
-            raise
+    def _on_config_reload(self, config):
+        self.embed_builder.server_name = self.embed_builder.load_server_name()
+        self.websocket_manager.config = config
 
     async def setup_hook(self):
+        timer = StartupTimer()
         self.logger.info("Initializing bot systems...")
 
+        with timer.phase("caches"):
+            await asyncio.gather(
+                asyncio.to_thread(self.queue_registry.load),
+                asyncio.to_thread(self.rank_tiers.load),
+                asyncio.to_thread(self.settings_cache.load),
+                asyncio.to_thread(self.leaderboard_manager.ensure_indexes),
+                asyncio.to_thread(self.ign_resolver.backfill),
+                asyncio.to_thread(self.party_manager.registry.load),
+            )
+        with timer.phase("watchers"):
+            await self.config_manager.start_watching()
+            await self.metrics_manager.start_loop_monitor()
+            await self.queue_registry.start_watching()
+
         from managers.workermanager import WorkerManager
 
         self.worker_manager = WorkerManager(self)
         if self.worker_manager.enabled:
-            await self.worker_manager.start_workers()
-            self.logger.info("Worker system: ✓")
+            await self.worker_manager.start_workers(wait=False)
+            self.loop.create_task(self._log_workers_ready(timer))
+            self.logger.info("Worker system: connecting in background")
 
-        self.command_manager.load_permissions()
-        await self.command_manager.load_commands()
-        await self.event_manager.setup_events()
-        self.logger.info("Core systems loaded: ✓")
+        with timer.phase("commands"):
+            self.command_manager.load_permissions()
+            await self.command_manager.load_commands()
+        with timer.phase("events"):
+            await self.event_manager.setup_events()
+            self.logger.info("Core systems loaded: ✓")
 
-        try:
-            from events.messagenuker import MessageNuker
-            from events.voicechannelnuker import VoiceChannelNuker
+            try:
+                from events.messagenuker import MessageNuker
+                from events.voicechannelnuker import VoiceChannelNuker
 
-            await self.add_cog(MessageNuker(self))
-            await self.add_cog(VoiceChannelNuker(self))
-            self.logger.info("Event handlers: ✓")
-        except Exception as e:
-            self.logger.error(f"Failed to load event handlers: {e}")
+                await self.add_cog(MessageNuker(self))
+                await self.add_cog(VoiceChannelNuker(self))
+                self.logger.info("Event handlers: ✓")
+            except Exception as e:
+                self.logger.error(f"Failed to load event handlers: {e}")
 
-        await self.ban_manager.start_auto_unban()
-        print("Auto-unban system initialized.")
+        with timer.phase("job queue"):
+            from actions.teardown import register_teardown_jobs
 
-        await self.mute_manager.start_auto_unmute()
-        print("Auto-unmute system initialized.")
+            register_teardown_jobs(self.job_queue)
+            await self.job_queue.start()
+            self.logger.info("Job queue: ✓")
 
-        await self.strikes_manager.start_strikes_checker()
-        print("Auto-remove strikes system initialized.")
+        with timer.phase("background tasks"):
+            await self.ban_manager.start_auto_unban()
+            print("Auto-unban system initialized.")
 
-        self.logger.info("Starting automatic tasks...")
+            await self.mute_manager.start_auto_unmute()
+            print("Auto-unmute system initialized.")
 
-        await self.party_manager.check_inactive_parties()
-        self.loop.create_task(self.auto_party_disband_task())
+            await self.strikes_manager.start_strikes_checker()
+            print("Auto-remove strikes system initialized.")
 
-        daily_elo_reset = DailyEloReset(self.database_manager)
-        self.loop.create_task(daily_elo_reset.reset_daily_elo_task())
+            self.logger.info("Starting automatic tasks...")
 
-        elo_decay = EloDecay(
-            self.database_manager, self.config, self, self.embed_builder
-        )
-        self.loop.create_task(elo_decay.elo_decay_task())
+            await self.party_manager.check_inactive_parties()
+            self.loop.create_task(self.auto_party_disband_task())
 
-        from managers.queue_processor import QueueProcessor
+            daily_elo_reset = DailyEloReset(self.database_manager)
+            self.loop.create_task(daily_elo_reset.reset_daily_elo_task())
 
-        self.queue_processor = QueueProcessor(self)
+            elo_decay = EloDecay(
+                self.database_manager, self.config, self, self.embed_builder
+            )
+            self.loop.create_task(elo_decay.elo_decay_task())
 
-        if self.websocket_manager.is_enabled():
-            await self.websocket_manager.start()
-            self.logger.info("WebSocket system: ✓")
-        else:
-            self.logger.info("WebSocket system: Disabled")
+        with timer.phase("queue processor"):
+            from managers.queue_processor import QueueProcessor
+
+            self.queue_processor = QueueProcessor(self)
+
+        with timer.phase("websocket"):
+            if self.websocket_manager.is_enabled():
+                await self.websocket_manager.start()
+                self.logger.info("WebSocket system: ✓")
+            else:
+                self.logger.info("WebSocket system: Disabled")
 
         self.cleanup_task = TeamVcCleanup(self)
         self.cleanup_task.cleanup_channels.start()
 
         self.logger.info("All systems initialized successfully.")
+        self.logger.info(timer.report())
+
+    async def _log_workers_ready(self, timer):
+        await self.worker_manager.ready.wait()
+        self.logger.info(
+            f"Worker system: ✓ ({len(self.worker_manager.worker_bots)} workers ready {timer.elapsed():.2f}s after startup began)"
+        )
 
     async def on_ready(self):
         self.logger.info("Zzzzzzzzz All systems are online!")
@@ -320,6 +376,34 @@ class Bot(commands.Bot):
             except Exception as e:
                 self.logger.error(f"Error cleaning up WebSocket manager: {e}")
 
+        if self.job_queue:
+            self.logger.info("Stopping job queue workers...")
+            try:
+                await self.job_queue.stop()
+            except Exception as e:
+                self.logger.error(f"Error stopping job queue: {e}")
+
+        if self.queue_registry:
+            try:
+                await self.queue_registry.stop_watching()
+            except Exception as e:
+                self.logger.error(f"Error stopping queue registry: {e}")
+
+        if self.config_manager:
+            await self.config_manager.stop_watching()
+
+        if self.expiry_manager:
+            self.logger.info("Stopping expiry manager...")
+            try:
+                await self.expiry_manager.stop()
+            except Exception as e:
+                self.logger.error(f"Error stopping expiry manager: {e}")
+
+        if self.analytics_manager:
+            self.analytics_manager.close()
+
+        await self.metrics_manager.stop_loop_monitor()
+
         if hasattr(self, "cleanup_task"):
             self.logger.info("Stopping TeamVcCleanup task...")
             try:
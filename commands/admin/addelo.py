@@ -1,15 +1,12 @@
 import discord
 from discord.ext import commands
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 
 class AddEloCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='addelo', help='Add a new ELO role configuration.')
     async def addelo(
@@ -85,6 +82,7 @@ class AddEloCommand(commands.Cog):
             }
 
             self.bot.database_manager.insert('elos', document)
+            self.bot.rank_tiers.load()
 
             embed = self.embed_builder.build_success(
                 title='ELO Configuration Added',
@@ -1,17 +1,14 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from managers.permission_manager import PermissionManager
-from utils.error_handler import ErrorHandler
 
 class AddQueue(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.embed_builder = EmbedBuilder()
+        self.embed_builder = bot.services.embed_builder
         self.database_manager = DatabaseManager()
-        self.error_handler = ErrorHandler(bot)
-        self.permission_manager = PermissionManager()  
+        self.error_handler = bot.services.error_handler
+        self.permission_manager = bot.services.permission_manager  
 
     @commands.command(name='addqueue', help='Add a new queue to the database.')
     async def add_queue(
@@ -47,7 +44,7 @@ class AddQueue(commands.Cog):
                 await ctx.reply(embed=embed)
                 return
 
-            existing_queue = self.database_manager.find_one('queues', {'channelid': str(channelid)})
+            existing_queue = self.bot.queue_registry.get(channelid)
             if existing_queue:
                 embed = self.embed_builder.build_error(
                     description=f'A queue for channel {channelid} already exists.'
@@ -63,7 +60,7 @@ class AddQueue(commands.Cog):
                 'iscasual': iscasual
             }
 
-            self.database_manager.insert('queues', document)
+            self.bot.queue_registry.add(document)
 
             embed = self.embed_builder.build_success(
                 title='Queue Added',
@@ -1,7 +1,6 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
 from typing import Optional
 
 class AdminGamesPaginator(discord.ui.View):
@@ -61,7 +60,7 @@ class AdminGamesCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name='admingames', help='View recently played games based on their state.')
     async def admingames(self, ctx, state: Optional[str] = "all"):
@@ -1,14 +1,8 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
-from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+import asyncio
 import io
-from typing import Optional
-from bson import Timestamp
-import mplcyberpunk
 
 
 class StateSelect(discord.ui.Select):
@@ -73,7 +67,7 @@ class GamesCountView(discord.ui.View):
         self.add_item(IntervalSelect(self, self.interval))
 
     async def update_graph(self, interaction: discord.Interaction):
-        file, embed = make_games_graph(
+        file, embed = await make_games_graph(
             self.db_manager, self.state, self.interval, self.bot
         )
         await interaction.response.edit_message(
@@ -81,61 +75,30 @@ class GamesCountView(discord.ui.View):
         )
 
 
-def make_games_graph(db_manager, state, interval, bot):
-    now = datetime.utcnow()
-    start_date = now - timedelta(days=interval)
-    start_timestamp = Timestamp(int(start_date.timestamp()), 1)
-    games = db_manager.find("games", {"date": {"$gte": start_timestamp}})
-
-    date_buckets = [
-        (start_date + timedelta(days=i)).date() for i in range(interval + 1)
-    ]
-    scored_counts = [0] * (interval + 1)
-    voided_counts = [0] * (interval + 1)
-    pending_counts = [0] * (interval + 1)
-
-    for game in games:
-        game_date = game.get("date")
-        if not game_date:
-            continue
-        if hasattr(game_date, "as_datetime"):
-            game_date = game_date.as_datetime().date()
-        elif hasattr(game_date, "time") and hasattr(game_date, "inc"):
-            game_date = datetime.utcfromtimestamp(game_date.time).date()
-        elif isinstance(game_date, datetime):
-            game_date = game_date.date()
-        else:
-            continue
-        if not game_date or game_date < start_date.date():
-            continue
-        idx = (game_date - start_date.date()).days
-        if idx < 0 or idx > interval:
-            continue
-        state_val = game.get("state", "unknown").lower()
-
-        match state_val:
-            case "scored":
-                scored_counts[idx] += 1
-            case "voided":
-                voided_counts[idx] += 1
-            case "pending":
-                pending_counts[idx] += 1
-            case _:
-                pass
-
-    if state != "all":
-        match state:
-            case "scored":
-                voided_counts = [0] * (interval + 1)
-                pending_counts = [0] * (interval + 1)
-            case "voided":
-                scored_counts = [0] * (interval + 1)
-                pending_counts = [0] * (interval + 1)
-            case "pending":
-                scored_counts = [0] * (interval + 1)
-                voided_counts = [0] * (interval + 1)
-            # case _:
-            # pass
+async def make_games_graph(db_manager, state, interval, bot):
+    analytics = bot.analytics_manager
+    data = await asyncio.to_thread(analytics.games_per_day, state, interval)
+    buf = await analytics.render(
+        render_games_graph,
+        data["days"],
+        data["counts"]["scored"],
+        data["counts"]["voided"],
+        data["counts"]["pending"],
+    )
+    file = discord.File(buf, filename="games_graph.png")
+    embed = bot.embed_builder.build_info(
+        title="Games Count Graph",
+        description=f"Showing {state.capitalize()} games for the last {interval} day(s). \n"
+        f"Scored: {sum(data['counts']['scored'])} Voided: {sum(data['counts']['voided'])} Pending: {sum(data['counts']['pending'])}",
+    )
+    embed.set_image(url="attachment://games_graph.png")
+    return file, embed
+
+
+def render_games_graph(date_buckets, scored_counts, voided_counts, pending_counts):
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    import mplcyberpunk
 
     plt.style.use("cyberpunk")
     fig, ax = plt.subplots(figsize=(12, 7))
@@ -161,21 +124,14 @@ def make_games_graph(db_manager, state, interval, bot):
     plt.savefig(buf, format="png", bbox_inches="tight", transparent=True)
     plt.close(fig)
     buf.seek(0)
-    file = discord.File(buf, filename="games_graph.png")
-    embed = bot.embed_builder.build_info(
-        title="Games Count Graph",
-        description=f"Showing {state.capitalize()} games for the last {interval} day(s). \n"
-        f"Scored: {sum(scored_counts)} Voided: {sum(voided_counts)} Pending: {sum(pending_counts)}",
-    )
-    embed.set_image(url="attachment://games_graph.png")
-    return file, embed
+    return buf
 
 
 class AdminGamesCount(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(
         name="gamescount", help="Show a graph of games count by state and interval."
@@ -190,7 +146,7 @@ class AdminGamesCount(commands.Cog):
             await ctx.reply(embed=embed)
             return
 
-        file, embed = make_games_graph(self.db_manager, "all", 5, self.bot)
+        file, embed = await make_games_graph(self.db_manager, "all", 5, self.bot)
         view = GamesCountView(self.bot, self.db_manager, state="all", interval=5)
         await ctx.reply(embed=embed, file=file, view=view)
 
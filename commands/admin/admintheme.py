@@ -3,13 +3,12 @@ from discord.ext import commands
 from typing import List
 import os
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
 
 class AdminThemeCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
+        self.embed_builder = bot.services.embed_builder
         self.themes_folder = os.path.join('themes')
 
     def get_available_themes(self) -> List[str]:
@@ -1,8 +1,5 @@
 import discord
 from discord.ext import commands
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 from managers.database_manager import DatabaseManager
 import re
 
@@ -10,9 +7,9 @@ class BanCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
     def parse_duration(self, duration_str):
         match = re.match(r"(\d+)([smhd])", duration_str)
@@ -1,17 +1,12 @@
 import discord
 from discord.ext import commands
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
-from managers.database_manager import DatabaseManager
 
 class BoosterCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='booster', help='Set the ELO and XP multiplier for queues.\nUsage: !booster <multiplier>\nExample: !booster 2.5')
     async def booster(self, ctx: commands.Context, multiplier: str = None):
@@ -44,17 +39,7 @@ class BoosterCommand(commands.Cog):
                 return
 
             booster_value = multiplier
-            existing_booster = self.db_manager.find_one('booster', {})
-
-            if existing_booster:
-                success = self.db_manager.update_one(
-                    'booster',
-                    {'_id': existing_booster['_id']},
-                    {'$set': {'multiplier': booster_value}}
-                )
-            else:
-                self.db_manager.insert('booster', {'multiplier': booster_value})
-                success = True
+            success = self.bot.settings_cache.set_booster(booster_value)
 
             if success:
                 embed = self.embed_builder.build_success(
@@ -1,8 +1,5 @@
 import discord
 from discord.ext import commands
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 from actions.transcript_creator import create_transcript
 import logging
 import asyncio
@@ -12,9 +9,9 @@ logger = logging.getLogger(__name__)
 class CloseScreenshare(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
-        self.permission_manager = PermissionManager()
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name='close', help='Close an active screenshare session.\nUsage: !close <result> [evidence_url]')
     async def close_screenshare(self, ctx: commands.Context, result: str = None, evidence_url: str = None):
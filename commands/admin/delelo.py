@@ -1,15 +1,12 @@
 import discord
 from discord.ext import commands
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 
 class DelEloCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='delelo', help='Delete an existing ELO role configuration. Usage: !delelo <roleid>')
     async def delelo(self, ctx, roleid: str):
@@ -32,6 +29,7 @@ class DelEloCommand(commands.Cog):
                 return
 
             self.bot.database_manager.delete('elos', {'roleid': str(roleid)})
+            self.bot.rank_tiers.load()
 
             embed = self.embed_builder.build_success(
                 title='ELO Configuration Deleted',
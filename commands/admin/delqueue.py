@@ -1,15 +1,13 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from managers.permission_manager import PermissionManager
 
 class DelQueue(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.embed_builder = EmbedBuilder()
+        self.embed_builder = bot.services.embed_builder
         self.database_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name='delqueue', help='Delete a queue from the database. Usage: !delqueue <channelid>')
     async def del_queue(self, ctx: commands.Context, channelid: str):
@@ -23,8 +21,7 @@ class DelQueue(commands.Cog):
                 await ctx.reply(embed=embed)
                 return
 
-            result = self.database_manager.db['queues'].delete_one({'channelid': str(channelid)})
-            if result.deleted_count > 0:
+            if self.bot.queue_registry.remove(channelid):
                 embed = self.embed_builder.build_success(
                     title='Queue Deleted',
                     description=f'Queue deleted successfully for channel ID: {channelid}'
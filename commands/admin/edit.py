@@ -1,8 +1,6 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 from actions.fix import fix
 
 EDITABLE_FIELDS = [
@@ -15,10 +13,10 @@ class EditUserCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
         from managers.permission_manager import PermissionManager
-        self.permission_manager = PermissionManager()
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name='edit', help='Edit a user stat. Usage: !edit <ign> <field> <value>')
     async def edit(self, ctx: commands.Context, ign: str, field: str, value: str):
@@ -40,7 +38,7 @@ class EditUserCommand(commands.Cog):
             return
 
         try:
-            user = self.db_manager.find_one('users', {'ign': ign})
+            user = self.bot.ign_resolver.find_user(ign)
             if not user:
                 embed = self.embed_builder.build_error(description=f'User with IGN `{ign}` not found.')
                 await ctx.reply(embed=embed)
@@ -58,7 +56,7 @@ class EditUserCommand(commands.Cog):
             if new_val < 0:
                 new_val = 0
 
-            self.db_manager.update_one('users', {'ign': ign}, {'$set': {field: new_val}})
+            self.db_manager.update_one('users', {'discordid': user['discordid']}, {'$set': {field: new_val}})
 
             
             await fix(self.bot, user['discordid'], ctx.guild.id)
@@ -1,8 +1,6 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
 from actions.fix import fix
 from bson.timestamp import Timestamp
 
@@ -10,8 +8,8 @@ class ForceRegister(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
 
     @commands.command(name="forceregister", help="Force register a user: !forceregister @user IGN")
     async def force_register(self, ctx: commands.Context, user: discord.User, ign: str):
@@ -25,8 +23,7 @@ class ForceRegister(commands.Cog):
             return
 
         
-        existing_ign = self.db_manager.find_one('users', {'ign': {'$regex': f'^{ign}$', '$options': 'i'}})
-        if existing_ign:
+        if self.bot.ign_resolver.is_taken(ign):
             embed = self.embed_builder.build_error(
                 title="IGN Taken",
                 description=f"The IGN `{ign}` is already taken by another user."
@@ -61,6 +58,7 @@ class ForceRegister(commands.Cog):
                 'latest_strike_reason': '',
                 'latest_strike_staff': '',
             })
+            self.bot.ign_resolver.remember(ign, user.id)
 
             self.db_manager.insert('settings', {
                 'discordid': str(user.id),
@@ -1,19 +1,18 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
 from actions.fix import fix
-import yaml
 
 class ForceRename(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        with open('configs/config.yml', 'r', encoding='utf-8') as file:
-            self.config = yaml.safe_load(file)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+
+    @property
+    def config(self):
+        return self.bot.config
 
     @commands.command(name='forcerename', help='Force rename a user: !forcerename @user NewIGN')
     async def force_rename(self, ctx: commands.Context, user: discord.User, new_ign: str):
@@ -37,10 +36,7 @@ class ForceRename(commands.Cog):
                 await ctx.reply(embed=embed)
                 return
 
-            existing_ign = self.db_manager.find_one(
-                'users', {'ign': {'$regex': f'^{new_ign}$', '$options': 'i'}}
-            )
-            if existing_ign and str(existing_ign.get('discordid')) != str(user.id):
+            if self.bot.ign_resolver.is_taken(new_ign, exclude_discord_id=user.id):
                 embed = self.embed_builder.build_error(
                     description=f'The IGN `{new_ign}` is already taken by another user.'
                 )
@@ -55,6 +51,10 @@ class ForceRename(commands.Cog):
                 {'$set': {'ign': new_ign}},
                 upsert=False
             )
+            if update_result:
+                if old_ign:
+                    self.bot.ign_resolver.forget(old_ign)
+                self.bot.ign_resolver.remember(new_ign, user.id)
 
             if hasattr(update_result, 'modified_count') and update_result.modified_count > 0:
                 await fix(self.bot, str(user.id), self.config['bot']['guildid'])
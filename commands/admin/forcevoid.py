@@ -1,13 +1,12 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
-from actions.voiding import void
+from actions.voiding import void_many
 
 class ForceVoidCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.permission_manager = PermissionManager()
+        self.permission_manager = bot.services.permission_manager
         self.db_manager = DatabaseManager()
 
     @commands.command(name='forcevoid', help='Force void the current game.')
@@ -44,7 +43,7 @@ class ForceVoidCommand(commands.Cog):
                 description=f'Game {game_id} has been successfully voided.'
             )
             await ctx.reply(embed=embed)
-            await void(self.bot, game_id, str(ctx.author.id))
+            await void_many(self.bot, [game_id], str(ctx.author.id))
 
         except Exception as e:
             await self.bot.error_handler.handle_error(e, 'force void command')
@@ -1,20 +1,18 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
-from managers.permission_manager import PermissionManager
+from managers.rank_tiers import RankTiers
 
 class LooseCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='loose', help='Give a loss and ELO change to a user by IGN.')
     async def loose(self, ctx: commands.Context, ign: str):
-        permission_manager = PermissionManager()
+        permission_manager = self.bot.services.permission_manager
         user_roles = [role.id for role in ctx.author.roles]
 
         if not permission_manager.has_permission('loose', user_roles):
@@ -26,7 +24,7 @@ class LooseCommand(commands.Cog):
             return
 
         try:
-            user = self.db_manager.find_one('users', {'ign': ign})
+            user = self.bot.ign_resolver.find_user(ign)
             if not user:
                 embed = self.embed_builder.build_error(description=f'User with IGN `{ign}` not found.')
                 await ctx.reply(embed=embed, delete_after=10)
@@ -39,10 +37,7 @@ class LooseCommand(commands.Cog):
             winstreak = user.get('winstreak', 0)
             daily_elo = user.get('dailyelo', 0)
 
-            rank = self.db_manager.find_one('elos', {
-                'minelo': {'$lte': current_elo},
-                'maxelo': {'$gte': current_elo}
-            })
+            rank = RankTiers().get_tier(current_elo)
             if not rank:
                 embed = self.embed_builder.build_error(description=f'Rank not found for ELO {current_elo}.')
                 await ctx.reply(embed=embed, delete_after=10)
@@ -1,7 +1,6 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
 import yaml
 import asyncio
 import os
@@ -10,7 +9,7 @@ class AdminNukeGameChannelsCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
+        self.permission_manager = bot.services.permission_manager
         self.load_config()
 
     def load_config(self):
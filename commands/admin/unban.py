@@ -1,15 +1,12 @@
 import discord
 from discord.ext import commands
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 
 class UnbanCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='unban', help='Unban a user from the server.\nUsage: !unban <user_id> <reason>')
     async def unban(self, ctx, user_id: int = None, *, reason: str = None):
@@ -1,27 +1,19 @@
 import discord
 from discord.ext import commands
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 from managers.database_manager import DatabaseManager
-from managers.mute_manager import MuteManager
-import yaml
-import os
 
 class UnmuteCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
-        self.mute_manager = MuteManager(bot)
-        self.config = self.load_config()
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
+        self.mute_manager = bot.services.mute_manager
 
-    def load_config(self):
-        config_path = os.path.join('configs', 'config.yml')
-        with open(config_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
+    @property
+    def config(self):
+        return self.bot.config
 
     @commands.command(name='unmute', help='Unmute a user in the server.\nUsage: !unmute <user_mention_or_id> [reason]')
     async def unmute(self, ctx, user: discord.User = None, *, reason: str = "No reason provided"):
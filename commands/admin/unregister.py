@@ -1,16 +1,14 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
 from actions.fix import fix
 
 class Unregister(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
 
     @commands.command(name="unregister", help="Unregister a user by mention or ID.")
     async def unregister(self, ctx: commands.Context, user: discord.User = None):
@@ -32,7 +30,10 @@ class Unregister(commands.Cog):
             return
 
         try:
+            player = self.db_manager.find_one('users', {'discordid': str(user.id)})
             self.db_manager.delete('users', {'discordid': str(user.id)})
+            if player and player.get('ign'):
+                self.bot.ign_resolver.forget(player['ign'])
             embed = self.embed_builder.build_success(
                 title="User Unregistered",
                 description=f"User {user.mention} has been unregistered."
@@ -1,20 +1,17 @@
 import discord
 from discord.ext import commands
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
-from actions.voiding import void  
+from actions.voiding import void_many
 
 class VoidCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = bot.database_manager
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
-    @commands.command(name='void', help='Void a game by providing the game ID.')
-    async def void(self, ctx, gameid: str):
+    @commands.command(name='void', help='Void one or more games by providing their game IDs.')
+    async def void(self, ctx, *gameids: str):
         try:
             if not ctx.guild:
                 return await ctx.reply("This command can only be used in a server.")
@@ -27,18 +24,31 @@ class VoidCommand(commands.Cog):
                 )
                 return await ctx.reply(embed=embed)
 
-            gameid = gameid.upper()
-            game = self.db_manager.find_one('games', {'gameid': gameid})
+            if not gameids:
+                embed = self.embed_builder.build_error(
+                    description='Please provide at least one game ID.'
+                )
+                return await ctx.reply(embed=embed)
+
+            gameids = list(dict.fromkeys(gameid.upper() for gameid in gameids))
 
             user_id = ctx.author.id
-            self.db_manager.increment('users', {'discordid': str(user_id)}, {'$inc': {'voided': 1}})
+            self.db_manager.increment('users', {'discordid': str(user_id)}, {'$inc': {'voided': len(gameids)}})
 
             embed = self.embed_builder.build_success(
-                title='Trying to void the game',
-                description=f'Processing elo cal for the {gameid}. Elo changes will be reverted if the game was able to void.'
+                title='Trying to void the game' if len(gameids) == 1 else f'Trying to void {len(gameids)} games',
+                description=f'Processing elo cal for {", ".join(gameids)}. Elo changes will be reverted if the game was able to void.'
             )
             await ctx.reply(embed=embed)
-            await void(self.bot, gameid, staffid=str(ctx.author.id))
+            voided = await void_many(self.bot, gameids, staffid=str(ctx.author.id))
+
+            if len(gameids) > 1:
+                skipped = [gameid for gameid in gameids if gameid not in voided]
+                embed = self.embed_builder.build_success(
+                    title='Voiding Complete',
+                    description=f'Voided {len(voided)} of {len(gameids)} games.' + (f'\nSkipped: {", ".join(skipped)}' if skipped else '')
+                )
+                await ctx.reply(embed=embed)
 
         except Exception as e:
             await self.error_handler.handle_error(e, 'void game')
@@ -1,17 +1,15 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
-from managers.permission_manager import PermissionManager
+from managers.rank_tiers import RankTiers
 
 class WinCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
-        self.permission_manager = PermissionManager()
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name='win', help='Give a win and elo change to a user by IGN.')
     async def win(self, ctx, *, ign: str):
@@ -28,7 +26,7 @@ class WinCommand(commands.Cog):
             return await ctx.reply(embed=embed)
 
         try:
-            user = self.db_manager.find_one('users', {'ign': ign})
+            user = self.bot.ign_resolver.find_user(ign)
             if not user:
                 embed = self.embed_builder.build_error(
                     description=f'User with IGN `{ign}` not found.'
@@ -43,10 +41,7 @@ class WinCommand(commands.Cog):
             daily_elo = user.get('dailyelo', 0)
 
             
-            rank = self.db_manager.find_one('elos', {
-                'minelo': {'$lte': current_elo},
-                'maxelo': {'$gte': current_elo}
-            })
+            rank = RankTiers().get_tier(current_elo)
 
             if not rank:
                 embed = self.embed_builder.build_error(
@@ -1,17 +1,14 @@
 import discord
 from discord.ext import commands
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 from managers.database_manager import DatabaseManager
 
 class WipeCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='wipe', help='Reset all stats for a specific player by IGN')
     async def wipe(self, ctx, *, ign: str):
@@ -28,7 +25,7 @@ class WipeCommand(commands.Cog):
                 return await ctx.reply(embed=embed)
 
             
-            user = self.db_manager.find_one('users', {'ign': ign})
+            user = self.bot.ign_resolver.find_user(ign)
             if not user:
                 embed = self.embed_builder.build_error(
                     description=f'User with IGN "{ign}" not found.'
@@ -58,7 +55,7 @@ class WipeCommand(commands.Cog):
             
             success = self.db_manager.update_one(
                 'users',
-                {'ign': ign},
+                {'discordid': user['discordid']},
                 {'$set': reset_stats}
             )
 
@@ -0,0 +1,68 @@
+import discord
+from discord.ext import commands
+from typing import Optional
+
+class DbProfileCommand(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
+
+    @commands.command(name='dbprofile', help='Show the slowest and most frequent database queries (developer only). Usage: =dbprofile [on|off|reset]')
+    async def dbprofile(self, ctx, action: Optional[str] = None):
+        try:
+            user_roles = [role.id for role in ctx.author.roles]
+            if not self.permission_manager.has_permission('developer', user_roles):
+                embed = self.embed_builder.build_error(
+                    title='Permission Denied',
+                    description='You do not have permission to use this command.'
+                )
+                return await ctx.reply(embed=embed)
+
+            profiler = self.bot.database_manager.profiler
+            if action in ('on', 'off'):
+                profiler.enabled = action == 'on'
+                return await ctx.reply(embed=self.embed_builder.build_success(
+                    description=f"Query profiling {'enabled' if profiler.enabled else 'disabled'}."
+                ))
+            if action == 'reset':
+                profiler.reset()
+                return await ctx.reply(embed=self.embed_builder.build_success(
+                    description='Query profile statistics cleared.'
+                ))
+
+            report = profiler.report(top_n=5)
+            embed = discord.Embed(
+                title='Database Query Profile',
+                description=f"Profiling is **{'on' if profiler.enabled else 'off'}**, slow query threshold `{profiler.slow_ms:g}ms`.",
+                color=discord.Color.blue()
+            )
+            for title, key in (('Slowest', 'slowest'), ('Most Total Time', 'most_time'), ('Most Frequent', 'most_frequent')):
+                embed.add_field(name=title, value=self._format_entries(report[key]), inline=False)
+            await ctx.reply(embed=embed)
+
+        except Exception as e:
+            await self.error_handler.handle_error(e, 'database profile')
+            await ctx.reply(
+                embed=self.embed_builder.build_error(
+                    description='An error occurred while building the database profile.'
+                )
+            )
+
+    def _format_entries(self, entries) -> str:
+        if not entries:
+            return 'No queries recorded.'
+        lines = []
+        for entry in entries:
+            shape = entry['shape'] if len(entry['shape']) <= 60 else entry['shape'][:57] + '...'
+            caller = entry['callers'][0] if entry['callers'] else 'unknown'
+            lines.append(
+                f"`{entry['operation']} {entry['collection']}` x{entry['count']} "
+                f"avg `{entry['avg_ms']}ms` max `{entry['max_ms']}ms`\n`{shape}` from `{caller}`"
+            )
+        value = '\n'.join(lines)
+        return value if len(value) <= 1024 else value[:1021] + '...'
+
+async def setup(bot):
+    await bot.add_cog(DbProfileCommand(bot))
@@ -1,17 +1,14 @@
 import discord
 from discord.ext import commands
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
-from managers.permission_manager import PermissionManager
 from managers.queue_processor import QueueProcessor
 import time
 
 class QueueStatusCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
-        self.permission_manager = PermissionManager()
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
+        self.permission_manager = bot.services.permission_manager
         self.queue_processor = QueueProcessor(bot)
         
     @commands.command(name='queuestatus', help='View the current status of all active queues.')
@@ -28,7 +25,7 @@ class QueueStatusCommand(commands.Cog):
                 )
                 return
                 
-            queues = self.queue_processor.db_manager.find('queues', {})
+            queues = self.bot.queue_registry.all()
             if not queues:
                 embed = self.embed_builder.build_info(
                     title='Queue Status',
@@ -0,0 +1,46 @@
+import asyncio
+import discord
+from discord.ext import commands
+
+class ReloadConfigCommand(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
+
+    @commands.command(name='reloadconfig', help='Reload configs/config.yml without restarting the bot (developer only)')
+    async def reloadconfig(self, ctx):
+        try:
+            user_roles = [role.id for role in ctx.author.roles]
+            if not self.permission_manager.has_permission('developer', user_roles):
+                embed = self.embed_builder.build_error(
+                    title='Permission Denied',
+                    description='You do not have permission to use this command.'
+                )
+                return await ctx.reply(embed=embed)
+
+            config_manager = self.bot.config_manager
+            await asyncio.to_thread(self.bot.settings_cache.load)
+            if config_manager.reload():
+                embed = self.embed_builder.build_success(
+                    title='Configuration Reloaded',
+                    description=f'Loaded configuration version `{config_manager.version}`.'
+                )
+            else:
+                embed = self.embed_builder.build_info(
+                    title='Configuration Unchanged',
+                    description=f'No changes found, still on version `{config_manager.version}`.'
+                )
+            await ctx.reply(embed=embed)
+
+        except Exception as e:
+            await self.error_handler.handle_error(e, 'reload configuration')
+            await ctx.reply(
+                embed=self.embed_builder.build_error(
+                    description='An error occurred while reloading the configuration.'
+                )
+            )
+
+async def setup(bot):
+    await bot.add_cog(ReloadConfigCommand(bot))
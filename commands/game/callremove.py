@@ -1,13 +1,12 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
 
 class CallRemoveCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name='callremove', help='Remove a user from a game voice channel.')
     async def callremove(self, ctx, targetuser: discord.User):
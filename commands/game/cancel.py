@@ -1,7 +1,6 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
 from actions.voiding import void
 
 class CancelGameView(discord.ui.View):
@@ -88,7 +87,7 @@ class CancelGameCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name="cancel", help="Start a vote to cancel a game. Optional game_id.")
     async def cancel(self, ctx, game_id: str = None):
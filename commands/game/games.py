@@ -1,7 +1,6 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
 
 class GamesPaginator(discord.ui.View):
     def __init__(self, bot, user_id, games, per_page=10):
@@ -76,7 +75,7 @@ class GameCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name='games')
     async def games(self, ctx, *, user: str = None):
@@ -98,10 +97,8 @@ class GameCommands(commands.Cog):
                 elif user.startswith('<@') and user.endswith('>'):
                     user_id = user.strip('<@!>')
                 else:
-                    user_doc = self.db_manager.find_one('users', {'ign': {'$regex': f'^{user}$', '$options': 'i'}})
-                    if user_doc:
-                        user_id = user_doc['discordid']
-                    else:
+                    user_id = self.bot.ign_resolver.get_discord_id(user)
+                    if not user_id:
                         embed = self.bot.embed_builder.build_error(
                             description=f'No user found with IGN or ID: {user}.'
                         )
@@ -1,17 +1,14 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from managers.permission_manager import PermissionManager
-from utils.error_handler import ErrorHandler
 
 class PlayerQueuesCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.database_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.permission_manager = PermissionManager()
-        self.error_handler = ErrorHandler(bot)
+        self.embed_builder = bot.services.embed_builder
+        self.permission_manager = bot.services.permission_manager
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='queues', help='Display available queues and their settings')
     async def queues_command(self, ctx: commands.Context):
@@ -25,7 +22,7 @@ class PlayerQueuesCommands(commands.Cog):
                 await ctx.reply(embed=embed)
                 return
 
-            queues = self.database_manager.find('queues', {})
+            queues = self.bot.queue_registry.all()
 
             if not queues:
                 await ctx.reply(
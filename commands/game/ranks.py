@@ -1,17 +1,14 @@
 import discord
 from discord.ext import commands
-from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from managers.permission_manager import PermissionManager
-from utils.error_handler import ErrorHandler
+from managers.rank_tiers import RankTiers
 
 class PlayerRanksCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.database_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.permission_manager = PermissionManager()
-        self.error_handler = ErrorHandler(bot)
+        self.rank_tiers = RankTiers()
+        self.embed_builder = bot.services.embed_builder
+        self.permission_manager = bot.services.permission_manager
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='ranks', help='Display available ELO ranks and their requirements')
     async def ranks_command(self, ctx: commands.Context):
@@ -26,8 +23,7 @@ class PlayerRanksCommands(commands.Cog):
                 return
 
             
-            elo_ranks = list(self.database_manager.find('elos', {}))
-            elo_ranks.sort(key=lambda x: x['minelo'])
+            elo_ranks = self.rank_tiers.all()
 
             if not elo_ranks:
                 await ctx.reply(
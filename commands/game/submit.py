@@ -1,15 +1,13 @@
 import discord
 from discord.ext import commands
-from utils.embed_builder import EmbedBuilder
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
 
 class SubmitGame(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.embed_builder = EmbedBuilder()
+        self.embed_builder = bot.services.embed_builder
         self.database_manager = DatabaseManager()
-        self.permission_manager = PermissionManager()
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name='submit')
     async def submit(self, ctx: commands.Context):
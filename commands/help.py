@@ -1,15 +1,13 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
 import os
 
 class HelpCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.embed_builder = EmbedBuilder()
-        self.permission_manager = PermissionManager()
+        self.embed_builder = bot.services.embed_builder
+        self.permission_manager = bot.services.permission_manager
 
     async def build_help_embed_and_view(self):
         
@@ -2,8 +2,6 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from discord.ui import Button, View
-from utils.embed_builder import EmbedBuilder
-import yaml
 
 class PartyInviteView(View):
     def __init__(self, party_manager, party_name: str, target_id: str):
@@ -53,7 +51,7 @@ class PartyInviteView(View):
 class PartyCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.embed_builder = EmbedBuilder()
+        self.embed_builder = bot.services.embed_builder
         self.logger = bot.logger if hasattr(bot, 'logger') else print
 
     @commands.group(name="party", invoke_without_command=True, aliases=['p'])
@@ -415,9 +413,7 @@ class PartyCommands(commands.Cog):
                     cant_move.append(member.mention)
 
         if cant_move:
-            with open('configs/config.yml', 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-            alerts_channel = self.bot.get_channel(int(config['channels']['alerts']))
+            alerts_channel = self.bot.get_channel(int(self.bot.config['channels']['alerts']))
 
             if alerts_channel:
                 alert_embed = self.embed_builder.build_warning(
@@ -459,11 +455,7 @@ class PartyCommands(commands.Cog):
             return
 
         try:
-            self.bot.database_manager.update_one(
-                'parties',
-                {'party_name': party['party_name']},
-                {'$set': {'autopartywarp': enabled}}
-            )
+            self.bot.party_manager.set_autowarp(party['party_name'], enabled)
 
             embed = self.embed_builder.build_success(
                 description=f"Auto party warp has been {'enabled' if enabled else 'disabled'}."
@@ -3,9 +3,7 @@ from discord.ext import commands
 from discord import ui
 from typing import Optional
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from managers.permission_manager import PermissionManager
-from utils.error_handler import ErrorHandler
+from managers.leaderboard_manager import resolve_field
 
 class LeaderboardView(ui.View):
     def __init__(self, bot, stat_type="elo", page=0, author=None):
@@ -15,27 +13,29 @@ class LeaderboardView(ui.View):
         self.page = page
         self.max_page = 0
         self.searched_player = None
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
         self._author = author
-        self.update_leaderboard()
-
-    def update_leaderboard(self):
-        db_manager = DatabaseManager()
-        self.all_players = db_manager.find('users', {})
-        self.leaderboard = sorted(self.all_players, key=lambda user: user.get(self.stat_type, 0), reverse=True)
-        
-        paginated = self.leaderboard[self.page * 10:(self.page + 1) * 10]
-        total = len(self.all_players)
-        self.max_page = (total - 1) // 10
+        self.page_data = None
+        self.update_leaderboard(position=page * 10 + 1 if page else None)
+
+    def update_leaderboard(self, cursor: Optional[str] = None, position: Optional[int] = None):
+        leaderboard_manager = self.bot.leaderboard_manager
+        field = resolve_field(self.stat_type)
+        if position is not None:
+            self.page_data = leaderboard_manager.get_page_at(field, position, 10)
+        else:
+            self.page_data = leaderboard_manager.get_page(field, 10, cursor)
+        self.page = self.page_data['page'] - 1
+        self.max_page = self.page_data['total_pages'] - 1
+        total = self.page_data['total_players']
     
         lines = []
-        for i, user in enumerate(paginated):
-            pos = i + (self.page * 10)
-            medal = self.get_medal(pos)
-            line = f"{medal} {user['ign']} -> {user.get(self.stat_type, 0)}"
-            if self.searched_player and user['ign'].lower() == self.searched_player.lower():
+        for player in self.page_data['players']:
+            medal = self.get_medal(player['rank'] - 1)
+            line = f"{medal} {player['ign']} -> {player.get(field, 0)}"
+            if self.searched_player and player['ign'].lower() == self.searched_player.lower():
                 line = f"**👉 {line}**"
             lines.append(line)
 
@@ -49,24 +49,19 @@ class LeaderboardView(ui.View):
         medals = ['🥇', '🥈', '🥉']
         return medals[pos] if pos < 3 else f"#{pos + 1}"
 
-    def get_page_for_position(self, pos: int) -> int:
-        return (pos - 1) // 10
-
-    def get_page_for_player(self, ign: str) -> int:
-        try:
-            idx = next(i for i, p in enumerate(self.leaderboard) if p['ign'].lower() == ign.lower())
-            return idx // 10
-        except StopIteration:
-            return 0
+    def get_position_for_player(self, ign: str) -> Optional[int]:
+        user = self.bot.ign_resolver.find_user(ign)
+        if not user:
+            return None
+        return self.bot.leaderboard_manager.get_rank(resolve_field(self.stat_type), user)
 
     @ui.button(label='<', style=discord.ButtonStyle.secondary)
     async def previous_page(self, interaction: discord.Interaction, button: ui.Button):
         if interaction.user != self._author:
             await interaction.response.send_message("You can't control this leaderboard.", ephemeral=True)
             return
-        if self.page > 0:
-            self.page -= 1
-            self.update_leaderboard()
+        if self.page_data['previous']:
+            self.update_leaderboard(self.page_data['previous'])
             await interaction.response.edit_message(embed=self.embed, view=self)
 
     @ui.button(label='>', style=discord.ButtonStyle.secondary)
@@ -74,9 +69,8 @@ class LeaderboardView(ui.View):
         if interaction.user != self._author:
             await interaction.response.send_message("You can't control this leaderboard.", ephemeral=True)
             return
-        if self.page < self.max_page:
-            self.page += 1
-            self.update_leaderboard()
+        if self.page_data['next']:
+            self.update_leaderboard(self.page_data['next'])
             await interaction.response.edit_message(embed=self.embed, view=self)
 
     @ui.button(label='⟳', style=discord.ButtonStyle.green)
@@ -84,7 +78,7 @@ class LeaderboardView(ui.View):
         if interaction.user != self._author:
             await interaction.response.send_message("You can't control this leaderboard.", ephemeral=True)
             return
-        self.update_leaderboard()
+        self.update_leaderboard(self.page_data['current'])
         await interaction.response.edit_message(embed=self.embed, view=self)
 
     @ui.button(emoji='🎯', style=discord.ButtonStyle.blurple)
@@ -105,8 +99,7 @@ class LeaderboardView(ui.View):
                     pos = int(self.position.value)
                     if pos < 1:
                         raise ValueError
-                    view.page = view.get_page_for_position(pos)
-                    view.update_leaderboard()
+                    view.update_leaderboard(position=pos)
                     await modal_interaction.response.edit_message(embed=view.embed, view=view)
                 except:
                     await modal_interaction.response.send_message("Please enter a valid position number.", ephemeral=True)
@@ -129,8 +122,7 @@ class LeaderboardView(ui.View):
             )
             async def on_submit(self, modal_interaction: discord.Interaction):
                 view.searched_player = self.ign.value
-                view.page = view.get_page_for_player(self.ign.value)
-                view.update_leaderboard()
+                view.update_leaderboard(position=view.get_position_for_player(self.ign.value))
                 await modal_interaction.response.edit_message(embed=view.embed, view=view)
 
         view = self
@@ -141,9 +133,9 @@ class PlayerLbCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.permission_manager = PermissionManager()
-        self.error_handler = ErrorHandler(bot)
+        self.embed_builder = bot.services.embed_builder
+        self.permission_manager = bot.services.permission_manager
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='leaderboard', aliases=['lb'])
     async def leaderboard(self, ctx, category: Optional[str] = 'elo', identifier: Optional[str] = None):
@@ -160,8 +152,7 @@ class PlayerLbCommands(commands.Cog):
             view = LeaderboardView(self.bot, stat_type=category, author=ctx.author)
             if identifier:
                 view.searched_player = identifier
-                view.page = view.get_page_for_player(identifier)
-                view.update_leaderboard()
+                view.update_leaderboard(position=view.get_position_for_player(identifier))
             await ctx.reply(embed=view.embed, view=view)
 
         except Exception as e:
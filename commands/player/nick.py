@@ -2,9 +2,6 @@
 import discord
 from discord.ext import commands
 from discord import ui
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 from actions.fix import fix
 
 class NicknameView(ui.View):
@@ -78,9 +75,9 @@ class NicknameModal(ui.Modal, title="Set Nickname"):
 class Nickname(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.embed_builder = EmbedBuilder()
-        self.permission_manager = PermissionManager()
-        self.error_handler = ErrorHandler(bot)
+        self.embed_builder = bot.services.embed_builder
+        self.permission_manager = bot.services.permission_manager
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='nick', help='Manage your nickname')
     async def nick(self, ctx: commands.Context):
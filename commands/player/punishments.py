@@ -1,8 +1,6 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
 from datetime import datetime
 import bson
 
@@ -10,8 +8,8 @@ class Punishments(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.database_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.permission_manager = PermissionManager()
+        self.embed_builder = bot.services.embed_builder
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name='punishments', help='View your ban history or the history of a specific player by IGN or ID.')
     async def punishments(self, ctx, ign: str = None):
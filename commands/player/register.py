@@ -3,16 +3,11 @@ from discord import app_commands
 from discord.ext import commands
 from discord import ui
 from typing import Optional, Dict, Any, Union, Callable
-import yaml
-import os
 import random
 import string
 import asyncio
 from bson.timestamp import Timestamp
 
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 from actions.fix import fix
 
 
@@ -48,10 +43,9 @@ class VerificationView(ui.View):
 class RegisterCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
-        self.config = self.load_config()
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
         
         
         self.websocket_enabled = self.config.get('websocket', {}).get('enabled', False)
@@ -60,15 +54,10 @@ class RegisterCommands(commands.Cog):
         
         self.pending_verifications = {}  
 
-    def load_config(self) -> Dict[str, Any]:
-        config_path = os.path.join('configs', 'config.yml')
-        try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
-        except Exception as e:
-            self.bot.logger.error(f"Failed to load configuration: {e}")
-            raise
-    
+    @property
+    def config(self):
+        return self.bot.config
+
     def generate_verification_code(self) -> str:
         return ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
     
@@ -287,6 +276,7 @@ class RegisterCommands(commands.Cog):
             }
 
             self.bot.database_manager.insert('users', document)
+            self.bot.ign_resolver.remember(ign, user.id)
             self.bot.database_manager.insert('settings', {
                 'discordid': str(user.id),
                 'isprefixtoggled': False,
@@ -372,8 +362,7 @@ class RegisterCommands(commands.Cog):
                 return
 
             
-            existing_ign = self.bot.database_manager.find_one('users', {'ign': {'$regex': f'^{ign}$', '$options': 'i'}})
-            if existing_ign:
+            if self.bot.ign_resolver.is_taken(ign):
                 await interaction.response.send_message(
                     embed=self.embed_builder.build_error(
                         title='IGN Taken',
@@ -418,8 +407,7 @@ class RegisterCommands(commands.Cog):
                 return
 
             
-            existing_ign = self.bot.database_manager.find_one('users', {'ign': {'$regex': f'^{ign}$', '$options': 'i'}})
-            if existing_ign:
+            if self.bot.ign_resolver.is_taken(ign):
                 await ctx.reply(embed=self.embed_builder.build_error(
                     title='IGN Taken',
                     description=f'The IGN `{ign}` is already taken by another user.'
@@ -2,14 +2,9 @@ import discord
 from discord.ext import commands
 from discord import ui
 from typing import Dict, Any, Callable
-import yaml
-import os
 import random
 import string
 import asyncio
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 from actions.fix import fix
 
 class VerificationModal(ui.Modal, title="Verify Minecraft Account"):
@@ -43,10 +38,9 @@ class VerificationView(ui.View):
 class RenameCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
-        self.config = self.load_config()
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
         
         
         self.websocket_enabled = self.config.get('websocket', {}).get('enabled', False)
@@ -55,15 +49,10 @@ class RenameCommands(commands.Cog):
         
         self.pending_verifications = {}  
 
-    def load_config(self) -> Dict[str, Any]:
-        config_path = os.path.join('configs', 'config.yml')
-        try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
-        except Exception as e:
-            self.bot.logger.error(f"Failed to load configuration: {e}")
-            raise
-            
+    @property
+    def config(self):
+        return self.bot.config
+
     def generate_verification_code(self) -> str:
         return ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
     
@@ -149,6 +138,9 @@ class RenameCommands(commands.Cog):
         update_result = self.bot.database_manager.update_player_ign(user_id, old_ign, new_ign)
         
         if update_result:
+            if old_ign:
+                self.bot.ign_resolver.forget(old_ign)
+            self.bot.ign_resolver.remember(new_ign, user_id)
             await fix(self.bot, user_id, interaction.guild_id)
             success_embed = self.embed_builder.build_success(
                 title='Rename Complete',
@@ -250,10 +242,7 @@ class RenameCommands(commands.Cog):
             user_id = str(ctx.author.id)
             guild_id = str(ctx.guild.id)
 
-            existing_ign = self.bot.database_manager.find_one(
-                'users', {'ign': {'$regex': f'^{new_ign}$', '$options': 'i'}}
-            )
-            if existing_ign and str(existing_ign.get('discordid')) != user_id:
+            if self.bot.ign_resolver.is_taken(new_ign, exclude_discord_id=user_id):
                 embed = self.embed_builder.build_error(
                     title='IGN Taken',
                     description=f'The IGN `{new_ign}` is already taken by another user.'
@@ -281,6 +270,9 @@ class RenameCommands(commands.Cog):
             update_result = self.bot.database_manager.update_player_ign(user_id, old_ign, new_ign)
 
             if update_result:
+                if old_ign:
+                    self.bot.ign_resolver.forget(old_ign)
+                self.bot.ign_resolver.remember(new_ign, user_id)
                 await fix(self.bot, user_id, guild_id)
                 embed = self.embed_builder.build_success(
                     title='Rename Complete',
@@ -339,10 +331,7 @@ class RenameCommands(commands.Cog):
             await ctx.reply(embed=embed)
             return
 
-        existing_ign = self.bot.database_manager.find_one(
-            'users', {'ign': {'$regex': f'^{new_ign}$', '$options': 'i'}}
-        )
-        if existing_ign and str(existing_ign.get('discordid')) != str(ctx.author.id):
+        if self.bot.ign_resolver.is_taken(new_ign, exclude_discord_id=ctx.author.id):
             embed = self.embed_builder.build_error(
                 title='IGN Taken',
                 description=f'The IGN `{new_ign}` is already taken by another user.'
@@ -3,15 +3,9 @@ from discord.ext import commands
 from discord import ui
 from typing import Optional
 from datetime import datetime
-import yaml
-import os
 import asyncio
 import logging
 
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
-
 logger = logging.getLogger(__name__)
 
 class FreezeButton(ui.Button):
@@ -24,7 +18,7 @@ class FreezeButton(ui.Button):
         self.target_id = target_id
 
     async def callback(self, interaction: discord.Interaction):
-        if not PermissionManager().has_permission('screensharer', [role.id for role in interaction.user.roles]):
+        if not interaction.client.services.permission_manager.has_permission('screensharer', [role.id for role in interaction.user.roles]):
             await interaction.response.send_message(
                 embed=interaction.client.embed_builder.build_error(
                     description='You do not have permission to freeze users.'
@@ -34,8 +28,7 @@ class FreezeButton(ui.Button):
             return
 
         try:
-            with open('configs/config.yml', 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
+            config = interaction.client.config
 
             frozen_role_id = config['roles']['frozen']
             category_id = config['categories']['screenshare']
@@ -139,9 +132,9 @@ class FreezeButton(ui.Button):
 class PlayerSSCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='screenshare', aliases=['ss'])
     async def screenshare(self, ctx: commands.Context, target: discord.Member, *, reason: str = None):
@@ -188,8 +181,7 @@ class PlayerSSCommands(commands.Cog):
                 )
                 return
 
-            with open('configs/config.yml', 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
+            config = self.bot.config
 
             channel_id = config['channels']['screenshare']
             screensharer_role_id = config['roles'].get('screensharer')
@@ -1,17 +1,12 @@
 import discord
 from discord.ext import commands
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
-import os
 
 class SeasonInfoCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
-        self.config_path = 'configs/seasoninfo.yml'
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='seasoninfo', help='View current season rules and information', alliases=['ruleset', 'rules'])
     async def seasoninfo(self, ctx: commands.Context):
@@ -25,24 +20,15 @@ class SeasonInfoCommands(commands.Cog):
             return
 
         try:
-            if not os.path.exists(self.config_path):
+            season_info = self.bot.settings_cache.season_info()
+            if not season_info:
                 embed = self.embed_builder.build_error(
                     description='Season information is not available at this time.'
                 )
                 await ctx.reply(embed=embed, mention_author=False)
                 return
-            
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                content = file.read()
 
-            
-            content = content.replace(':rbw_yes:', '✅')
-            content = content.replace(':rbw_maybe:', '⚠️')
-            content = content.replace(':rbw_no:', '❌')
-
-            lines = content.strip().split('\n')
-            title = lines[0]
-            description = '\n'.join(lines[1:])
+            title, description = season_info
 
             embed = self.embed_builder.build_info(
                 title=title,
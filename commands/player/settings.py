@@ -1,9 +1,6 @@
 import discord
 from discord.ext import commands
 from discord import ui
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 from actions.fix import fix
 
 class SettingsDropdown(ui.Select):
@@ -119,9 +116,9 @@ class SettingsView(ui.View):
 class PlayerSettings(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='settings', help='Manage your player settings')
     async def settings(self, ctx: commands.Context):
@@ -3,9 +3,6 @@ from discord import app_commands
 from discord.ext import commands
 from typing import Optional, List
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
-from managers.permission_manager import PermissionManager
 import io
 import importlib
 import os
@@ -16,9 +13,9 @@ class PlayerImageStats(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.database_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
-        self.permission_manager = PermissionManager()
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
+        self.permission_manager = bot.services.permission_manager
 
 
     def _calculate_player_position(self, discord_id: str) -> int:
@@ -1,17 +1,14 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
-from managers.permission_manager import PermissionManager
 
 class PlayerStats(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.database_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
-        self.permission_manager = PermissionManager()
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name='statsembed', help='View player statistics')
     async def statsembed(self, ctx: commands.Context, *, identifier: str = None):
@@ -35,9 +32,8 @@ class PlayerStats(commands.Cog):
                 elif identifier.isdigit():
                     user_id = identifier
                 else:
-                    query = {'ign': {'$regex': f'^{identifier}$', '$options': 'i'}}
-                    player = self.database_manager.find_one('users', query)
-                    if not player:
+                    user_id = self.bot.ign_resolver.get_discord_id(identifier)
+                    if not user_id:
                         await ctx.reply(
                             embed=self.embed_builder.build_error(
                                 title='Player Not Found',
@@ -46,7 +42,6 @@ class PlayerStats(commands.Cog):
                             mention_author=False
                         )
                         return
-                    user_id = player['discordid']
             else:
                 user_id = str(ctx.author.id)
 
@@ -2,17 +2,14 @@ import discord
 from discord.ext import commands
 import psutil
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
-from managers.permission_manager import PermissionManager
 
 class StatusCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.database_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
-        self.permission_manager = PermissionManager()
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
+        self.permission_manager = bot.services.permission_manager
 
     @commands.command(name='status', help='View the bot\'s current status and system information')
     async def status(self, ctx):
@@ -52,7 +49,7 @@ class StatusCommands(commands.Cog):
                 uptime_str = "?"
 
             
-            queues = self.database_manager.find('queues', {})
+            queues = self.bot.queue_registry.all()
             queue_lines = []
             for queue in queues:
                 name = queue.get('name', queue.get('channelid', 'Unknown'))
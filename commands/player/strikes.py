@@ -1,8 +1,6 @@
 import discord
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from utils.embed_builder import EmbedBuilder
-from managers.permission_manager import PermissionManager
 import bson.timestamp
 from datetime import datetime
 
@@ -10,8 +8,8 @@ class Strikes(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.database_manager = DatabaseManager()
-        self.embed_builder = EmbedBuilder()
-        self.permission_manager = PermissionManager()
+        self.embed_builder = bot.services.embed_builder
+        self.permission_manager = bot.services.permission_manager
 
     def format_value(self, value):
         if isinstance(value, bson.timestamp.Timestamp):
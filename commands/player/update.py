@@ -1,16 +1,13 @@
 import discord
 from discord.ext import commands
 from actions.fix import fix
-from managers.permission_manager import PermissionManager
-from utils.embed_builder import EmbedBuilder
-from utils.error_handler import ErrorHandler
 
 class PlayerFixCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.permission_manager = PermissionManager()
-        self.embed_builder = EmbedBuilder()
-        self.error_handler = ErrorHandler(bot)
+        self.permission_manager = bot.services.permission_manager
+        self.embed_builder = bot.services.embed_builder
+        self.error_handler = bot.services.error_handler
 
     @commands.command(name='fix', help='Fix roles and nickname for yourself or another user.', aliases=['update'])
     async def fix_command(self, ctx, member: discord.Member = None):
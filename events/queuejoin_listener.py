@@ -2,9 +2,6 @@ import discord
 import asyncio
 from discord.ext import commands
 from managers.database_manager import DatabaseManager
-from managers.party_manager import PartyManager
-import yaml
-import os
 from utils.embed_builder import EmbedBuilder  
 from managers.queue_processor import QueueProcessor
 
@@ -12,9 +9,8 @@ class QueueJoinListener(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.database_manager = DatabaseManager()
-        self.party_manager = PartyManager(config_file='configs/config.yml', db_manager=self.database_manager)
-        self.config = self.load_config()
-        self.embed_builder = EmbedBuilder()  
+        self.party_manager = bot.services.party_manager
+        self.embed_builder = bot.services.embed_builder  
         
         self._queue_processor = None
         
@@ -23,14 +19,9 @@ class QueueJoinListener(commands.Cog):
         self.ws_manager = getattr(bot, 'websocket_manager', None) if self.websocket_enabled else None
         self.bot.logger.info(f"QueueJoinListener initialized with WebSocket enabled: {self.websocket_enabled}")
 
-    def load_config(self) -> dict:
-        config_path = os.path.join('configs', 'config.yml')
-        try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
-        except Exception as e:
-            self.bot.logger.error(f"Failed to load configuration: {e}")
-            raise
+    @property
+    def config(self):
+        return self.bot.config
 
     @property
     def queue_processor(self):
@@ -107,7 +98,7 @@ class QueueJoinListener(commands.Cog):
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
         
         if before.channel:
-            old_queue = self.database_manager.find_one('queues', {'channelid': str(before.channel.id)})
+            old_queue = self.bot.queue_registry.get(before.channel.id)
             if old_queue:
                 
                 new_channel_id = after.channel.id if after.channel else None
@@ -117,15 +108,18 @@ class QueueJoinListener(commands.Cog):
         if after.channel:
             
             try:
-                queue = self.database_manager.find_one('queues', {'channelid': str(after.channel.id)})
+                queue = self.bot.queue_registry.get(after.channel.id)
                 if not queue:
                     return
+
+                await self.bot.party_manager.handle_voice_state_update(
+                    member, before, after, worker_manager=self.bot.worker_manager
+                )
                 
                 
                 is_ranked = not queue.get('iscasual', False)
                 queuetype = 'ranked' if is_ranked else 'casual'
-                queuestats = self.database_manager.find_one('queuestats', {'queuetype': queuetype})
-                if queuestats and not queuestats.get('stats', True):
+                if not self.bot.settings_cache.queue_stats_enabled(queuetype):
                     await self.move_to_waiting_vc(member, reason=f"This queue is currently disabled.")
                     return
                 
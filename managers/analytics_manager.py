@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from bson import Timestamp
+
+from managers.database_manager import DatabaseManager
+
+
+class AnalyticsManager:
+    GAME_STATES = ('scored', 'voided', 'pending')
+
+    def __init__(self, db_manager: DatabaseManager, cache_ttl: float = 60.0):
+        self.db_manager = db_manager
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+        self._render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chart-render')
+
+    def aggregate_cached(self, key: Hashable, collection_name: str, pipeline: List[Dict[str, Any]], ttl: float = None) -> List[Dict[str, Any]]:
+        cached = self._cache.get(key)
+        now = time.monotonic()
+        if cached and cached[0] > now:
+            return cached[1]
+
+        self.db_manager.ensure_connection()
+        result = list(self.db_manager.db[collection_name].aggregate(pipeline))
+        self._cache[key] = (now + (ttl if ttl is not None else self.cache_ttl), result)
+        return result
+
+    def invalidate(self, prefix: Hashable = None) -> None:
+        if prefix is None:
+            self._cache.clear()
+            return
+        for key in list(self._cache):
+            if isinstance(key, tuple) and key and key[0] == prefix:
+                self._cache.pop(key, None)
+
+    async def render(self, render_fn: Callable[..., Any], *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._render_executor, render_fn, *args)
+
+    def games_per_day(self, state: str, interval: int) -> Dict[str, Any]:
+        start_date = datetime.utcnow() - timedelta(days=interval)
+        start_timestamp = Timestamp(int(start_date.timestamp()), 1)
+
+        pipeline = [
+            {'$match': {'date': {'$gte': start_timestamp}}},
+            {'$project': {'_id': 0, 'date': 1, 'state': {'$toLower': '$state'}}},
+        ]
+        if state != 'all':
+            pipeline.append({'$match': {'state': state}})
+        pipeline.append({'$group': {
+            '_id': {
+                'day': {'$dateToString': {'format': '%Y-%m-%d', 'date': {'$toDate': '$date'}}},
+                'state': '$state'
+            },
+            'count': {'$sum': 1}
+        }})
+        rows = self.aggregate_cached(('games_per_day', state, interval), 'games', pipeline)
+
+        days = [(start_date + timedelta(days=i)).date() for i in range(interval + 1)]
+        day_index = {day.isoformat(): index for index, day in enumerate(days)}
+        counts = {game_state: [0] * (interval + 1) for game_state in self.GAME_STATES}
+        for row in rows:
+            index = day_index.get(row['_id']['day'])
+            game_state = row['_id'].get('state')
+            if index is None or game_state not in counts:
+                continue
+            counts[game_state][index] += row['count']
+
+        logging.debug(f"games_per_day({state}, {interval}) aggregated {len(rows)} buckets")
+        return {'days': days, 'counts': counts}
+
+    def close(self) -> None:
+        self._render_executor.shutdown(wait=False)
@@ -1,10 +1,17 @@
 import asyncio
 import logging
 import json
-from typing import List, Optional, Dict, Any
+import gzip
+import hashlib
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from aiohttp import web, WSMsgType
 from aiohttp.web import Request, Response
 from managers.database_manager import DatabaseManager
+from managers.ign_resolver import IgnResolver
+from managers.leaderboard_manager import LeaderboardManager, resolve_field
 
 
 class Player:
@@ -39,6 +46,70 @@ class Player:
         }
 
 
+PLAYER_FIELD_SOURCES = {
+    'discord_id': ['discordid'],
+    'ign': ['ign'],
+    'elo': ['elo'],
+    'wins': ['wins'],
+    'losses': ['losses'],
+    'games_played': ['gamesplayed'],
+    'win_streak': ['winstreak'],
+    'highest_elo': ['highest_elo'],
+    'highest_win_streak': ['highstwinstreak'],
+    'beds_broken': ['bedsbroken'],
+    'mvps': ['mvps'],
+    'final_kills': ['finalkills'],
+    'kills': ['kills'],
+    'deaths': ['deaths'],
+    'diamonds': ['diamonds'],
+    'irons': ['irons'],
+    'gold': ['gold'],
+    'emeralds': ['emeralds'],
+    'blocks_placed': ['blocksplaced'],
+    'mvp_rate': ['mvps', 'gamesplayed'],
+    'win_rate': ['wins', 'gamesplayed'],
+    'kd_ratio': ['kills', 'deaths']
+}
+
+
+def build_player(user: Dict[str, Any]) -> Player:
+    games_played = user.get('gamesplayed', 0)
+    wins = user.get('wins', 0)
+    losses = user.get('losses', 0)
+    mvps = user.get('mvps', 0)
+    kills = user.get('kills', 0)
+    deaths = user.get('deaths', 0)
+    
+    mvp_rate = (mvps / games_played * 100) if games_played > 0 else 0
+    win_rate = (wins / games_played * 100) if games_played > 0 else 0
+    kd_ratio = (kills / deaths) if deaths > 0 else kills
+    
+    return Player(
+        discord_id=user.get('discordid', ''),
+        ign=user.get('ign', ''),
+        elo=user.get('elo', 0),
+        wins=wins,
+        losses=losses,
+        games_played=games_played,
+        win_streak=user.get('winstreak', 0),
+        highest_elo=user.get('highest_elo', 0),
+        highest_win_streak=user.get('highstwinstreak', 0),
+        beds_broken=user.get('bedsbroken', 0),
+        mvps=mvps,
+        final_kills=user.get('finalkills', 0),
+        kills=kills,
+        deaths=deaths,
+        diamonds=user.get('diamonds', 0),
+        irons=user.get('irons', 0),
+        gold=user.get('gold', 0),
+        emeralds=user.get('emeralds', 0),
+        blocks_placed=user.get('blocksplaced', 0),
+        mvp_rate=round(mvp_rate, 2),
+        win_rate=round(win_rate, 2),
+        kd_ratio=round(kd_ratio, 2)
+    )
+
+
 async def get_player_data(discord_id: str) -> Optional[Player]:
     try:
         db_manager = DatabaseManager()
@@ -47,132 +118,152 @@ async def get_player_data(discord_id: str) -> Optional[Player]:
         if not user:
             return None
         
-        games_played = user.get('gamesplayed', 0)
-        wins = user.get('wins', 0)
-        losses = user.get('losses', 0)
-        mvps = user.get('mvps', 0)
-        kills = user.get('kills', 0)
-        deaths = user.get('deaths', 0)
-        
-        mvp_rate = (mvps / games_played * 100) if games_played > 0 else 0
-        win_rate = (wins / games_played * 100) if games_played > 0 else 0
-        kd_ratio = (kills / deaths) if deaths > 0 else kills
-        
-        return Player(
-            discord_id=user.get('discordid', ''),
-            ign=user.get('ign', ''),
-            elo=user.get('elo', 0),
-            wins=wins,
-            losses=losses,
-            games_played=games_played,
-            win_streak=user.get('winstreak', 0),
-            highest_elo=user.get('highest_elo', 0),
-            highest_win_streak=user.get('highstwinstreak', 0),
-            beds_broken=user.get('bedsbroken', 0),
-            mvps=mvps,
-            final_kills=user.get('finalkills', 0),
-            kills=kills,
-            deaths=deaths,
-            diamonds=user.get('diamonds', 0),
-            irons=user.get('irons', 0),
-            gold=user.get('gold', 0),
-            emeralds=user.get('emeralds', 0),
-            blocks_placed=user.get('blocksplaced', 0),
-            mvp_rate=round(mvp_rate, 2),
-            win_rate=round(win_rate, 2),
-            kd_ratio=round(kd_ratio, 2)
-        )
+        return build_player(user)
     except Exception as e:
         logging.error(f"Error fetching player {discord_id}: {e}")
         return None
 
 
-async def get_leaderboard_data(mode: Optional[str] = None, page: int = 1, limit: int = 10):
+async def get_players_data(identifiers: List[str], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    fields = fields or list(PLAYER_FIELD_SOURCES)
+    unknown_fields = [field for field in fields if field not in PLAYER_FIELD_SOURCES]
+    if unknown_fields:
+        raise ValueError(f"Unknown fields: {unknown_fields}. Use any of: {list(PLAYER_FIELD_SOURCES)}")
+
+    discord_ids = [identifier for identifier in identifiers if identifier.isdigit()]
+    igns = identifiers
+    conditions = []
+    if discord_ids:
+        conditions.append({'discordid': {'$in': discord_ids}})
+    if igns:
+        conditions.append({'ign_lower': {'$in': [IgnResolver.normalize(ign) for ign in igns]}})
+    if not conditions:
+        return {'fields': fields, 'players': [], 'not_found': []}
+
+    projection = {'_id': 0, 'discordid': 1, 'ign': 1}
+    for field in fields:
+        for source in PLAYER_FIELD_SOURCES[field]:
+            projection[source] = 1
+
+    db_manager = DatabaseManager()
+    users = await asyncio.to_thread(
+        lambda: list(db_manager.db['users'].find({'$or': conditions}, projection))
+    )
+
+    found = set()
+    players = []
+    for user in users:
+        found.add(user.get('discordid'))
+        found.add(IgnResolver.normalize(user.get('ign', '')))
+        player = build_player(user).to_dict()
+        players.append([player[field] for field in fields])
+
+    return {
+        'fields': fields,
+        'players': players,
+        'not_found': [
+            identifier for identifier in identifiers
+            if identifier not in found and IgnResolver.normalize(identifier) not in found
+        ]
+    }
+
+
+async def get_leaderboard_data(mode: Optional[str] = None, page: int = 1, limit: int = 10, cursor: Optional[str] = None,
+                               leaderboard_manager: Optional[LeaderboardManager] = None):
     try:
-        db_manager = DatabaseManager()
-        
-        # Interpret mode as the stat field to sort by. Default to ELO when not provided
-        # Supported fields are keys present in users documents
-        field_aliases = {
-            'elo': 'elo',
-            'wins': 'wins',
-            'losses': 'losses',
-            'games': 'gamesplayed',
-            'gamesplayed': 'gamesplayed',
-            'winstreak': 'winstreak',
-            'highest_elo': 'highest_elo',
-            'highestelo': 'highest_elo',
-            'highest_win_streak': 'highstwinstreak',
-            'highstwinstreak': 'highstwinstreak',
-            'beds': 'bedsbroken',
-            'bedsbroken': 'bedsbroken',
-            'mvps': 'mvps',
-            'finalkills': 'finalkills',
-            'kills': 'kills',
-            'deaths': 'deaths',
-            'diamonds': 'diamonds',
-            'irons': 'irons',
-            'gold': 'gold',
-            'emeralds': 'emeralds',
-            'blocks': 'blocksplaced',
-            'blocksplaced': 'blocksplaced',
-            'dailyelo': 'dailyelo'
-        }
-        sort_field = 'elo'
-        if mode is not None and str(mode).strip() != '':
-            key = str(mode).lower().strip()
-            if key not in field_aliases:
-                raise ValueError(
-                    f"Invalid mode/stat. Use one of: {sorted(list(field_aliases.keys()))} or omit for 'elo'"
-                )
-            sort_field = field_aliases[key]
+        leaderboard_manager = leaderboard_manager or LeaderboardManager()
+        sort_field = resolve_field(mode)
         
-        query = {}
-        
-        total_players = db_manager.db['users'].count_documents(query)
-        total_pages = (total_players + limit - 1) // limit
+        if cursor:
+            return await asyncio.to_thread(leaderboard_manager.get_page, sort_field, limit, cursor)
         
+        total_pages = (leaderboard_manager.total_players() + limit - 1) // limit
         if page < 1 or page > total_pages:
             page = 1
         
-        skip = (page - 1) * limit
-        
-        players_cursor = db_manager.db['users'].find(
-            query,
-            {
-                'discordid': 1, 'ign': 1, 'elo': 1, 'wins': 1, 'losses': 1,
-                'gamesplayed': 1, 'winstreak': 1, 'highest_elo': 1,
-                'highstwinstreak': 1, 'bedsbroken': 1, 'mvps': 1,
-                'finalkills': 1, 'kills': 1, 'deaths': 1, 'diamonds': 1,
-                'irons': 1, 'gold': 1, 'emeralds': 1, 'blocksplaced': 1, 'dailyelo': 1
-            }
-        ).sort(sort_field, -1).skip(skip).limit(limit)
-        
-        players = list(players_cursor)
-        
-        leaderboard_entries = []
-        for i, player in enumerate(players):
-            rank = skip + i + 1
-            entry = {
-                'rank': rank,
-                'discord_id': player.get('discordid', ''),
-                'ign': player.get('ign', '')
-            }
-            entry[sort_field] = player.get(sort_field, 0)
-            leaderboard_entries.append(entry)
-        
-        return {
-            'mode': sort_field,
-            'page': page,
-            'total_pages': total_pages,
-            'players': leaderboard_entries
-        }
+        if page == 1:
+            return await asyncio.to_thread(leaderboard_manager.get_page, sort_field, limit)
+        return await asyncio.to_thread(leaderboard_manager.get_page_at, sort_field, (page - 1) * limit + 1, limit)
         
     except Exception as e:
         logging.error(f"Error fetching leaderboard: {e}")
         raise
 
 
+class ResponseCache:
+    def __init__(self, ttl: float = 30.0, gzip_min_size: int = 1024, max_entries: int = 1000):
+        self.ttl = ttl
+        self.gzip_min_size = gzip_min_size
+        self.max_entries = max_entries
+        self._entries: Dict[str, OrderedDict] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def get(self, route: str, key: Tuple) -> Optional[Dict[str, Any]]:
+        stats = self._stats.setdefault(route, {'hits': 0, 'misses': 0, 'not_modified': 0})
+        entries = self._entries.get(route, {})
+        entry = entries.get(key)
+        if entry and entry['expires'] > time.monotonic():
+            entries.move_to_end(key)
+            stats['hits'] += 1
+            return entry
+        stats['misses'] += 1
+        return None
+
+    def put(self, route: str, key: Tuple, payload: Any) -> Dict[str, Any]:
+        body = json.dumps(payload).encode()
+        entry = {
+            'body': body,
+            'gzip': gzip.compress(body, compresslevel=6) if len(body) >= self.gzip_min_size else None,
+            'etag': f'"{hashlib.sha1(body).hexdigest()}"',
+            'last_modified': formatdate(time.time(), usegmt=True),
+            'expires': time.monotonic() + self.ttl
+        }
+        entries = self._entries.setdefault(route, OrderedDict())
+        now = time.monotonic()
+        for expired in [cached for cached, value in entries.items() if value['expires'] <= now]:
+            del entries[expired]
+        entries[key] = entry
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, route: Optional[str] = None, keys: Optional[Iterable[Tuple]] = None) -> None:
+        if route is None:
+            self._entries.clear()
+        elif keys is None:
+            self._entries.pop(route, None)
+        else:
+            entries = self._entries.get(route, {})
+            for key in keys:
+                entries.pop(key, None)
+
+    def respond(self, request: Request, route: str, entry: Dict[str, Any]) -> Response:
+        headers = {
+            'ETag': entry['etag'],
+            'Last-Modified': entry['last_modified'],
+            'Cache-Control': 'no-cache',
+            'Vary': 'Accept-Encoding'
+        }
+        if_none_match = request.headers.get('If-None-Match', '')
+        if entry['etag'] in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*':
+            self._stats.setdefault(route, {'hits': 0, 'misses': 0, 'not_modified': 0})['not_modified'] += 1
+            return web.Response(status=304, headers=headers)
+
+        body = entry['body']
+        if entry['gzip'] is not None and 'gzip' in request.headers.get('Accept-Encoding', ''):
+            body = entry['gzip']
+            headers['Content-Encoding'] = 'gzip'
+        return web.Response(body=body, content_type='application/json', headers=headers)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        report = {}
+        for route, stats in self._stats.items():
+            lookups = stats['hits'] + stats['misses']
+            report[route] = dict(stats, hit_rate=round(stats['hits'] / lookups, 4) if lookups else 0.0)
+        return report
+
+
 class APIManager:
     def __init__(self, bot, config: dict):
         self.bot = bot
@@ -182,6 +273,13 @@ class APIManager:
         api_config = config.get('api', {})
         self.enabled = api_config.get('enabled', True)
         self.path = api_config.get('path', '/rbw/api')
+        self.response_cache = ResponseCache(
+            ttl=api_config.get('cache_ttl', 30.0),
+            gzip_min_size=api_config.get('gzip_min_size', 1024),
+            max_entries=api_config.get('cache_max_entries', 1000)
+        )
+        self.max_page_size = api_config.get('max_page_size', 100)
+        self.bulk_limit = api_config.get('bulk_limit', 100)
         
         self.logger.info(f"API Manager initialized - Enabled: {self.enabled}")
         if self.enabled:
@@ -211,38 +309,94 @@ class APIManager:
         
         async def get_player_rest(request):
             discord_id = request.match_info['discord_id']
-            player = await get_player_data(discord_id)
-            if not player:
-                return web.json_response(
-                    {"error": "Player not found"}, 
-                    status=404
-                )
-            return web.json_response(player.to_dict())
+            key = (str(discord_id),)
+            entry = self.response_cache.get('player', key)
+            if entry is None:
+                player = await get_player_data(discord_id)
+                if not player:
+                    return web.json_response(
+                        {"error": "Player not found"}, 
+                        status=404
+                    )
+                entry = self.response_cache.put('player', key, player.to_dict())
+            return self.response_cache.respond(request, 'player', entry)
         
         async def get_leaderboard_rest(request):
             mode = request.match_info['mode']
-            page = int(request.query.get('page', 1))
-            limit = int(request.query.get('limit', 10))
+            cursor = request.query.get('cursor') or None
             
             try:
-                leaderboard = await get_leaderboard_data(mode, page, limit)
-                return web.json_response(leaderboard)
+                page = int(request.query.get('page', 1))
+                limit = min(max(int(request.query.get('limit', 10)), 1), self.max_page_size)
+                key = (resolve_field(mode), None if cursor else max(page, 1), limit, cursor)
+                entry = self.response_cache.get('leaderboard', key)
+                if entry is None:
+                    leaderboard = await get_leaderboard_data(mode, page, limit, cursor, self.bot.leaderboard_manager)
+                    entry = self.response_cache.put('leaderboard', key, leaderboard)
+                return self.response_cache.respond(request, 'leaderboard', entry)
+            except ValueError as e:
+                return web.json_response({"error": str(e)}, status=400)
             except Exception as e:
                 return web.json_response(
                     {"error": str(e)}, 
                     status=500
                 )
         
+        async def get_players_rest(request):
+            if request.method == 'POST':
+                try:
+                    body = await request.json()
+                except json.JSONDecodeError:
+                    return web.json_response({"error": "Request body must be JSON"}, status=400)
+                if not isinstance(body, dict):
+                    return web.json_response({"error": "Request body must be a JSON object"}, status=400)
+                identifiers = body.get('ids', [])
+                fields = body.get('fields')
+            else:
+                identifiers = [part for part in request.query.get('ids', '').split(',') if part]
+                fields = [part for part in request.query.get('fields', '').split(',') if part] or None
+
+            if not isinstance(identifiers, list) or not identifiers:
+                return web.json_response({"error": "Provide a non-empty list of ids"}, status=400)
+            if any(isinstance(identifier, bool) or not isinstance(identifier, (str, int)) for identifier in identifiers):
+                return web.json_response({"error": "ids must be strings or integers"}, status=400)
+            if fields is not None and (not isinstance(fields, list) or not all(isinstance(field, str) for field in fields)):
+                return web.json_response({"error": "fields must be a list of strings"}, status=400)
+            if len(identifiers) > self.bulk_limit:
+                return web.json_response(
+                    {"error": f"At most {self.bulk_limit} ids can be requested at once"},
+                    status=400
+                )
+
+            try:
+                players = await get_players_data([str(identifier).strip() for identifier in identifiers], fields)
+                return web.json_response(players)
+            except ValueError as e:
+                return web.json_response({"error": str(e)}, status=400)
+            except Exception as e:
+                logging.error(f"Error fetching players: {e}")
+                return web.json_response(
+                    {"error": str(e)}, 
+                    status=500
+                )
+        
         app.router.add_get(f"{self.path}/player/{{discord_id}}", get_player_rest)
+        app.router.add_get(f"{self.path}/players", get_players_rest)
+        app.router.add_post(f"{self.path}/players", get_players_rest)
         app.router.add_get(f"{self.path}/leaderboard/{{mode}}", get_leaderboard_rest)
         
         self.logger.info(f"API routes registered at {self.path}")
     
+    def invalidate_players(self, discord_ids: Iterable[Any]) -> None:
+        self.response_cache.invalidate('player', [(str(discord_id),) for discord_id in discord_ids])
+        self.response_cache.invalidate('leaderboard')
+
     def is_enabled(self) -> bool:
         return self.enabled
     
     def get_status(self) -> dict:
         return {
             'enabled': self.enabled,
-            'path': self.path
+            'path': self.path,
+            'cache': self.response_cache.stats()
         }
@@ -1,4 +1,3 @@
-import asyncio
 import discord
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
@@ -10,7 +9,7 @@ class BanManager:
     def __init__(self, bot):
         self.bot = bot
         self.db = bot.database_manager
-        self.auto_unban_task = None
+        self.auto_unban_enabled = False
         self.embed_builder = bot.embed_builder
         self.punishment_channel_id = int(bot.config["channels"]["punishments"])
 
@@ -47,33 +46,40 @@ class BanManager:
         return current_time + int(delta.total_seconds())
 
     async def start_auto_unban(self):
-        if self.auto_unban_task is None:
-            self.auto_unban_task = asyncio.create_task(self._auto_unban_loop())
+        if not self.auto_unban_enabled:
+            expiry_manager = self.bot.expiry_manager
+            expiry_manager.register("ban", self._expire_ban)
 
-    async def stop_auto_unban(self):
-        if self.auto_unban_task:
-            self.auto_unban_task.cancel()
-            self.auto_unban_task = None
+            banned_users = self.db.find("users", {"banned": True})
+            for user in banned_users:
+                if "ban_expiry" in user:
+                    expiry_manager.schedule(
+                        "ban", str(user["discordid"]), user["ban_expiry"].time
+                    )
 
-    async def _auto_unban_loop(self):
-        while True:
-            try:
-                current_time = Timestamp(int(datetime.now().timestamp()), 1)
+            await expiry_manager.start()
+            self.auto_unban_enabled = True
 
-                banned_users = self.db.find("users", {"banned": True})
+    async def stop_auto_unban(self):
+        if self.auto_unban_enabled:
+            self.bot.expiry_manager.unregister("ban")
+            self.auto_unban_enabled = False
 
-                for user in banned_users:
-                    if "ban_expiry" in user and user["ban_expiry"] < current_time:
-                        await self.unban_user(
-                            discord_id=str(user["discordid"]),
-                            unban_reason="Ban duration expired",
-                            unbanned_by="System",
-                        )
+    async def _expire_ban(self, discord_id: str):
+        user_data = self.db.find_one("users", {"discordid": str(discord_id)})
+        if not user_data or not user_data.get("banned"):
+            return
+
+        ban_expiry = user_data.get("ban_expiry")
+        if ban_expiry and ban_expiry.time > int(datetime.now().timestamp()):
+            self.bot.expiry_manager.schedule("ban", str(discord_id), ban_expiry.time)
+            return
 
-                await asyncio.sleep(1)
-            except Exception as e:
-                self.bot.logger.error(f"Error in auto unban loop: {e}")
-                await asyncio.sleep(1)
+        await self.unban_user(
+            discord_id=str(discord_id),
+            unban_reason="Ban duration expired",
+            unbanned_by="System",
+        )
 
     async def ban_user(
         self, discord_id: str, reason: str, duration: str, staffid: str
@@ -109,6 +115,7 @@ class BanManager:
                 "unbanned": False,
             }
             self.db.insert("bans", ban_data)
+            self.bot.expiry_manager.schedule("ban", str(discord_id), ban_duration)
 
             guild = self.bot.get_guild(int(self.bot.config["bot"]["guildid"]))
             if not guild:
@@ -172,6 +179,7 @@ class BanManager:
             result = self.db.update_one(
                 "users", {"discordid": str(discord_id)}, {"$set": update_data}
             )
+            self.bot.expiry_manager.cancel("ban", str(discord_id))
 
             self.db.update_one(
                 "bans",
@@ -1,5 +1,7 @@
 import os
+import asyncio
 import importlib.util
+import traceback
 import yaml
 from typing import Optional
 from discord.ext import commands
@@ -95,52 +97,70 @@ class CommandManager:
 
     
 
+    def _module_files(self, directory: str) -> list:
+        file_paths = []
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for file in sorted(files):
+                if file.endswith('.py') and not file.startswith('_'):
+                    file_paths.append(os.path.join(root, file))
+        return file_paths
+
+    def _import_module(self, file_path: str):
+        relative_path = os.path.relpath(file_path, start=os.getcwd())
+        module_path = os.path.splitext(relative_path)[0].replace(os.sep, '.')
+        spec = importlib.util.spec_from_file_location(module_path, file_path)
+        if not spec or not spec.loader:
+            return None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    async def _register_module(self, module) -> None:
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if isinstance(attr, type) and issubclass(attr, commands.Cog) and attr != commands.Cog:
+                try:
+                    if attr_name in self.bot.cogs:
+                        continue
+                    cog_instance = attr(self.bot)
+                    cog_commands = self.extract_command_names(cog_instance)
+                    await self.bot.add_cog(cog_instance)
+                    self.loaded_commands.update(cog_commands)
+                except Exception as e:
+                    self.bot.logger.error(traceback.format_exc())
+
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if isinstance(attr, commands.Command):
+                try:
+                    await self.bot.add_command(attr)
+                    self.loaded_commands.add(attr.name)
+                except Exception as e:
+                    self.bot.logger.error(traceback.format_exc())
+
     async def load_command_modules(self, directory: str) -> None:
         if not os.path.exists(directory):
             os.makedirs(directory)
             return
 
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith('.py') and not file.startswith('_'):
-                    try:
-                        file_path = os.path.join(root, file)
-                        relative_path = os.path.relpath(file_path, start=os.getcwd())
-                        module_path = os.path.splitext(relative_path)[0].replace(os.sep, '.')
-
-
-                        spec = importlib.util.spec_from_file_location(module_path, file_path)
-                        if spec and spec.loader:
-                            module = importlib.util.module_from_spec(spec)
-                            spec.loader.exec_module(module)
-
-                            
-                            for attr_name in dir(module):
-                                attr = getattr(module, attr_name)
-                                if isinstance(attr, type) and issubclass(attr, commands.Cog) and attr != commands.Cog:
-                                    try:
-                                        if attr_name in self.bot.cogs:
-                                            continue
-                                        cog_instance = attr(self.bot)
-                                        cog_commands = self.extract_command_names(cog_instance)
-                                        await self.bot.add_cog(cog_instance)
-                                        self.loaded_commands.update(cog_commands)
-                                    except Exception as e:
-                                        import traceback
-                                        self.bot.logger.error(traceback.format_exc())
-                            
-                            for attr_name in dir(module):
-                                attr = getattr(module, attr_name)
-                                if isinstance(attr, commands.Command):
-                                    try:
-                                        await self.bot.add_command(attr)
-                                        self.loaded_commands.add(attr.name)
-                                    except Exception as e:
-                                        import traceback
-                                        self.bot.logger.error(traceback.format_exc())
-                    except Exception as e:
-                        import traceback
-                        self.bot.logger.error(traceback.format_exc())
+        file_paths = self._module_files(directory)
+        modules = await asyncio.gather(
+            *(asyncio.to_thread(self._import_module, file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+        for file_path, module in zip(file_paths, modules):
+            if isinstance(module, BaseException):
+                self.bot.logger.error(
+                    f"Failed to import {file_path}:\n" + ''.join(traceback.format_exception(type(module), module, module.__traceback__))
+                )
+                continue
+            if module is None:
+                continue
+            try:
+                await self._register_module(module)
+            except Exception as e:
+                self.bot.logger.error(traceback.format_exc())
 
     async def reload_all_commands(self) -> None:
         try:
@@ -149,6 +169,7 @@ class CommandManager:
             
             
             self.loaded_commands.clear()
+            self.bot.services.reset()
             
             await self.load_commands()
         except Exception as e:
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import os
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, List, Mapping, Optional
+
+import yaml
+
+
+def freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class ConfigManager:
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, config_path: str = os.path.join('configs', 'config.yml')):
+        if cls._instance is None:
+            cls._instance = super(ConfigManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, config_path: str = os.path.join('configs', 'config.yml')):
+        if self._initialized:
+            return
+        self.config_path = config_path
+        self.version = 1
+        self._data: Mapping[str, Any] = MappingProxyType({})
+        self._mtime: Optional[float] = None
+        self._subscribers: List[Callable[[Mapping[str, Any]], None]] = []
+        self._watch_task = None
+        self._initialized = True
+        self._load()
+
+    @property
+    def data(self) -> Mapping[str, Any]:
+        return self._data
+
+    def section(self, name: str) -> Mapping[str, Any]:
+        section = self._data.get(name)
+        return section if isinstance(section, Mapping) else MappingProxyType({})
+
+    def get(self, *keys: str, default: Any = None) -> Any:
+        value: Any = self._data
+        for key in keys:
+            if not isinstance(value, Mapping) or key not in value:
+                return default
+            value = value[key]
+        return value
+
+    def _load(self) -> None:
+        with self._lock:
+            mtime = os.path.getmtime(self.config_path)
+            with open(self.config_path, 'r', encoding='utf-8') as file:
+                data = yaml.safe_load(file) or {}
+            if not isinstance(data, dict):
+                raise ValueError(f"{self.config_path} must contain a mapping")
+            if os.path.getmtime(self.config_path) != mtime:
+                raise RuntimeError(f"{self.config_path} changed while it was being read")
+            self._data = freeze(data)
+            self._mtime = mtime
+
+    def reload(self) -> bool:
+        previous = self._data
+        self._load()
+        if self._data == previous:
+            return False
+        self.version += 1
+        logging.info(f"Configuration reloaded (version {self.version})")
+        self._notify()
+        return True
+
+    def subscribe(self, callback: Callable[[Mapping[str, Any]], None]) -> None:
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Mapping[str, Any]], None]) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _notify(self) -> None:
+        for callback in list(self._subscribers):
+            try:
+                callback(self._data)
+            except Exception as e:
+                logging.error(f"Configuration subscriber failed: {e}")
+
+    async def start_watching(self, poll_interval: float = 5.0) -> None:
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self._watch_loop(poll_interval))
+
+    async def stop_watching(self) -> None:
+        if self._watch_task:
+            self._watch_task.cancel()
+            self._watch_task = None
+
+    async def _watch_loop(self, poll_interval: float) -> None:
+        while True:
+            await asyncio.sleep(poll_interval)
+            try:
+                mtime = os.path.getmtime(self.config_path)
+            except OSError as e:
+                logging.warning(f"Could not stat {self.config_path}: {e}")
+                continue
+            if mtime != self._mtime:
+                try:
+                    self.reload()
+                except Exception as e:
+                    logging.error(f"Failed to reload configuration from {self.config_path}: {e}")
@@ -7,6 +7,8 @@ import bson
 import threading
 from urllib.parse import quote_plus
 from datetime import datetime
+from managers.metrics_manager import MetricsManager
+from managers.query_profiler import QueryProfiler
 
 
 
@@ -27,6 +29,7 @@ class DatabaseManager:
             self.db = None
             self._is_connected = False
             self.config = self._load_yaml_config(config_path)
+            self.profiler = QueryProfiler.from_config(self.config.get('database', {}).get('profiling'))
             self._connect_and_init_db()
             DatabaseManager._initialized = True
 
@@ -87,7 +90,8 @@ class DatabaseManager:
                             connectTimeoutMS=5000,
                             socketTimeoutMS=5000,
                             maxPoolSize=50,
-                            retryWrites=True
+                            retryWrites=True,
+                            event_listeners=[MetricsManager().mongo_listener, self.profiler]
                         )
                     else:
                         uri = f"mongodb://{username}:{password}@{host}:{port}/?authSource=admin"
@@ -97,7 +101,8 @@ class DatabaseManager:
                             connectTimeoutMS=5000,
                             socketTimeoutMS=5000,
                             maxPoolSize=50,
-                            retryWrites=True
+                            retryWrites=True,
+                            event_listeners=[MetricsManager().mongo_listener, self.profiler]
                         )
                     
                     
@@ -140,6 +145,7 @@ class DatabaseManager:
                     'properties': {
                         'discordid': {'bsonType': 'string'},
                         'ign': {'bsonType': 'string'},
+                        'ign_lower': {'bsonType': 'string'},
                         'exp': {'bsonType': 'int'},
                         'totalexp': {'bsonType': 'int'},
                         'level': {'bsonType': 'int'},
@@ -476,6 +482,8 @@ class DatabaseManager:
             })
             for counter in ['gameid', 'recentgames', 'screenshareid', 'banid', 'muteid', 'strikeid', 'punishmentid', 'gameschannels']:
                 self.db['counters'].insert_one({'_id': counter, 'seq': 0})
+
+        self._ensure_indexes()
             
 
         
@@ -487,11 +495,34 @@ class DatabaseManager:
         
             
 
+    def _ensure_indexes(self) -> None:
+        indexes = (
+            ('games', 'gameid', {'unique': True, 'name': 'gameid_unique_idx'}),
+            ('games', [('date', 1), ('state', 1)], {'name': 'date_state_idx'}),
+            ('users', 'discordid', {'name': 'discordid_idx'}),
+            ('users', 'ign_lower', {'name': 'ign_lower_idx'}),
+            ('jobs', [('status', 1), ('run_at', 1)], {'name': 'status_run_at_idx'}),
+        )
+        for collection_name, keys, options in indexes:
+            try:
+                self.db[collection_name].create_index(keys, **options)
+            except errors.PyMongoError as e:
+                logging.warning(f"Could not ensure index {options['name']} on {collection_name}: {e}")
+
+
+    @staticmethod
+    def _set_ign_lower(fields: Dict[str, Any]) -> None:
+        if isinstance(fields.get('ign'), str):
+            fields['ign_lower'] = fields['ign'].lower()
+
+
     def insert(self, collection_name: str, document: Dict[str, Any]) -> Any:
         self.ensure_connection()
         try:
             collection = self.db[collection_name]
             
+            if collection_name == 'users':
+                self._set_ign_lower(document)
             if collection_name in ['banid', 'muteid', 'screenshareid', 'strikeid', 'punishmentid', 'gameschannels', 'gamesid', 'recentgames']:
                 if '_id' not in document:
                     document['_id'] = str(self.get_next_sequence(collection_name))
@@ -507,6 +538,32 @@ class DatabaseManager:
             raise
 
 
+    def insert_many(self, collection_name: str, documents: list[Dict[str, Any]]) -> list[Any]:
+        self.ensure_connection()
+        if not documents:
+            return []
+        try:
+            collection = self.db[collection_name]
+            
+            if collection_name in ['banid', 'muteid', 'screenshareid', 'strikeid', 'punishmentid', 'gameschannels', 'gamesid', 'recentgames']:
+                missing_ids = [document for document in documents if '_id' not in document]
+                if missing_ids:
+                    sequence = self.reserve_sequence_block(collection_name, len(missing_ids))
+                    for document, seq in zip(missing_ids, sequence):
+                        document['_id'] = str(seq)
+                for document in documents:
+                    for field in ['date', 'duration', 'unbannedate', 'unmutedate']:
+                        if field in document and isinstance(document[field], (int, float)):
+                            document[field] = bson.timestamp.Timestamp(document[field], 0)
+            result = collection.insert_many(documents)
+            logging.debug(f"Inserted {len(result.inserted_ids)} documents into {collection_name}")
+            return result.inserted_ids
+        except Exception as e:
+            logging.error(f"Error in insert_many operation on {collection_name}: {e}")
+            self.ensure_connection()  
+            raise
+
+
     def find(self, collection_name: str, query: Dict[str, Any], limit: int = None) -> list[Dict[str, Any]]:
         self.ensure_connection()
         try:
@@ -597,10 +654,28 @@ class DatabaseManager:
             raise
 
 
+    def reserve_sequence_block(self, name: str, count: int) -> range:
+        self.ensure_connection()
+        try:
+            counter = self.db['counters'].find_one_and_update(
+                {'_id': name},
+                {'$inc': {'seq': count}},
+                upsert=True,
+                return_document=True
+            )
+            return range(counter['seq'] - count + 1, counter['seq'] + 1)
+        except Exception as e:
+            logging.error(f"Error in reserve_sequence_block operation for {name}: {e}")
+            self.ensure_connection()  
+            raise
+
+
     def update_one(self, collection_name: str, filter_query: Dict[str, Any], update_query: Dict[str, Any], upsert: bool = False) -> bool:
         self.ensure_connection()
         try:
             collection = self.db[collection_name]
+            if collection_name == 'users' and isinstance(update_query.get('$set'), dict):
+                self._set_ign_lower(update_query['$set'])
             result = collection.update_one(filter_query, update_query, upsert=upsert)
             logging.debug(f"Updated one in {collection_name} where {filter_query} with {update_query}, modified_count={result.modified_count}")
             return result.modified_count > 0 or (upsert and result.upserted_id is not None)
@@ -610,6 +685,19 @@ class DatabaseManager:
             raise
 
 
+    def update_many(self, collection_name: str, filter_query: Dict[str, Any], update_query: Dict[str, Any]) -> int:
+        self.ensure_connection()
+        try:
+            collection = self.db[collection_name]
+            result = collection.update_many(filter_query, update_query)
+            logging.debug(f"Updated many in {collection_name} where {filter_query} with {update_query}, modified_count={result.modified_count}")
+            return result.modified_count
+        except Exception as e:
+            logging.error(f"Error in update_many operation on {collection_name}: {e}")
+            self.ensure_connection()  
+            raise
+
+
     def calculate_mvp_rate(self, mvps: int, games_played: int) -> int:
         if games_played == 0:
             return 0
@@ -649,7 +737,7 @@ class DatabaseManager:
         updated = False
         user_result = self.db['users'].update_one(
             {'discordid': str(discord_id)},
-            {'$set': {'ign': new_ign}}
+            {'$set': {'ign': new_ign, 'ign_lower': new_ign.lower()}}
         )
         updated = updated or user_result.modified_count > 0
         owner_result = self.db['guilds'].update_one(
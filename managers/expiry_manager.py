@@ -0,0 +1,94 @@
+import asyncio
+import heapq
+import itertools
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class ExpiryManager:
+    def __init__(self, bot):
+        self.bot = bot
+        self._heap: List[Tuple[int, int, str, str]] = []
+        self._deadlines: Dict[Tuple[str, str], int] = {}
+        self._handlers: Dict[str, Callable[[str], Awaitable[None]]] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self.expiry_task = None
+
+    def register(self, kind: str, handler: Callable[[str], Awaitable[None]]) -> None:
+        self._handlers[kind] = handler
+
+    def unregister(self, kind: str) -> None:
+        self._handlers.pop(kind, None)
+
+    def schedule(self, kind: str, key: str, deadline: int) -> None:
+        key = str(key)
+        deadline = int(deadline)
+        self._deadlines[(kind, key)] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), kind, key))
+        self._wakeup.set()
+
+    def cancel(self, kind: str, key: str) -> None:
+        self._deadlines.pop((kind, str(key)), None)
+
+    def get_deadline(self, kind: str, key: str) -> Optional[int]:
+        return self._deadlines.get((kind, str(key)))
+
+    def pending(self, kind: Optional[str] = None) -> int:
+        if kind is None:
+            return len(self._deadlines)
+        return sum(1 for entry_kind, _ in self._deadlines if entry_kind == kind)
+
+    async def start(self):
+        if self.expiry_task is None:
+            self.expiry_task = asyncio.create_task(self._expiry_loop())
+
+    async def stop(self):
+        if self.expiry_task:
+            self.expiry_task.cancel()
+            self.expiry_task = None
+
+    def _pop_due(self, now: float) -> List[Tuple[str, str]]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, _, kind, key = heapq.heappop(self._heap)
+            if self._deadlines.get((kind, key)) != deadline:
+                continue
+            del self._deadlines[(kind, key)]
+            due.append((kind, key))
+        return due
+
+    def _next_delay(self, now: float) -> Optional[float]:
+        while self._heap and self._deadlines.get(self._heap[0][2:]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        return max(0, self._heap[0][0] - now)
+
+    async def _expiry_loop(self):
+        while True:
+            try:
+                now = datetime.now().timestamp()
+                for kind, key in self._pop_due(now):
+                    handler = self._handlers.get(kind)
+                    if handler is None:
+                        self.bot.logger.warning(f"No expiry handler registered for {kind}")
+                        continue
+                    try:
+                        await handler(key)
+                    except Exception as e:
+                        self.bot.logger.error(f"Error expiring {kind} for {key}: {e}")
+
+                self._wakeup.clear()
+                delay = self._next_delay(datetime.now().timestamp())
+                if delay == 0:
+                    continue
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.bot.logger.error(f"Error in expiry loop: {e}")
+                await asyncio.sleep(1)
@@ -0,0 +1,58 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Deque
+
+from managers.database_manager import DatabaseManager
+
+
+class GameIdAllocator:
+    ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    ID_LENGTH = 6
+    ID_SPACE = 36 ** ID_LENGTH
+    SCRAMBLE = 1_679_609_813
+
+    def __init__(self, db_manager: DatabaseManager, counter_name: str = 'gameid', block_size: int = 50, low_water: int = 10):
+        self.db_manager = db_manager
+        self.counter_name = counter_name
+        self.block_size = block_size
+        self.low_water = low_water
+        self._reserved: Deque[str] = deque()
+        self._refill_task = None
+
+    def encode(self, value: int) -> str:
+        value = (value * self.SCRAMBLE) % self.ID_SPACE
+        chars = []
+        for _ in range(self.ID_LENGTH):
+            value, remainder = divmod(value, 36)
+            chars.append(self.ALPHABET[remainder])
+        return ''.join(reversed(chars))
+
+    def _reserve_block(self) -> None:
+        block = self.db_manager.reserve_sequence_block(self.counter_name, self.block_size)
+        self._reserved.extend(self.encode(value) for value in block)
+        logging.debug(f"Reserved game IDs {block.start}-{block.stop - 1} from counter {self.counter_name}")
+
+    async def prefetch(self) -> None:
+        if len(self._reserved) < self.low_water:
+            await asyncio.to_thread(self._reserve_block)
+
+    def _schedule_refill(self) -> None:
+        if len(self._reserved) >= self.low_water:
+            return
+        if self._refill_task is not None and not self._refill_task.done():
+            return
+        self._refill_task = asyncio.create_task(self.prefetch())
+
+    async def next_id(self) -> str:
+        while not self._reserved:
+            if self._refill_task is not None and not self._refill_task.done():
+                await asyncio.shield(self._refill_task)
+            else:
+                await asyncio.to_thread(self._reserve_block)
+        game_id = self._reserved.popleft()
+        self._schedule_refill()
+        return game_id
+
+    def remaining(self) -> int:
+        return len(self._reserved)
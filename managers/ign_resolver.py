@@ -0,0 +1,83 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from managers.database_manager import DatabaseManager
+
+
+class IgnResolver:
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, db_manager: Optional[DatabaseManager] = None, cache_size: int = 10000):
+        if cls._instance is None:
+            cls._instance = super(IgnResolver, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, cache_size: int = 10000):
+        if self._initialized:
+            return
+        self.db_manager = db_manager or DatabaseManager()
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._initialized = True
+
+    @staticmethod
+    def normalize(ign: str) -> str:
+        return str(ign).strip().lower()
+
+    def backfill(self) -> int:
+        result = self.db_manager.db['users'].update_many(
+            {'ign': {'$type': 'string'}, 'ign_lower': {'$exists': False}},
+            [{'$set': {'ign_lower': {'$toLower': '$ign'}}}]
+        )
+        if result.modified_count:
+            logging.info(f"Backfilled ign_lower on {result.modified_count} users")
+        return result.modified_count
+
+    def remember(self, ign: str, discord_id: Any) -> None:
+        key = self.normalize(ign)
+        with self._lock:
+            self._cache[key] = str(discord_id)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def forget(self, ign: str) -> None:
+        with self._lock:
+            self._cache.pop(self.normalize(ign), None)
+
+    def _cached(self, key: str) -> Optional[str]:
+        with self._lock:
+            discord_id = self._cache.get(key)
+            if discord_id is not None:
+                self._cache.move_to_end(key)
+            return discord_id
+
+    def find_user(self, ign: str) -> Optional[Dict[str, Any]]:
+        key = self.normalize(ign)
+        discord_id = self._cached(key)
+        if discord_id is not None:
+            user = self.db_manager.find_one('users', {'discordid': discord_id})
+            if user and self.normalize(user.get('ign', '')) == key:
+                return user
+            self.forget(key)
+        user = self.db_manager.find_one('users', {'ign_lower': key})
+        if user:
+            self.remember(user['ign'], user['discordid'])
+        return user
+
+    def get_discord_id(self, ign: str) -> Optional[str]:
+        discord_id = self._cached(self.normalize(ign))
+        if discord_id is not None:
+            return discord_id
+        user = self.find_user(ign)
+        return user['discordid'] if user else None
+
+    def is_taken(self, ign: str, exclude_discord_id: Any = None) -> bool:
+        query: Dict[str, Any] = {'ign_lower': self.normalize(ign)}
+        if exclude_discord_id is not None:
+            query['discordid'] = {'$ne': str(exclude_discord_id)}
+        return self.db_manager.find_one('users', query) is not None
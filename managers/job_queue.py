@@ -0,0 +1,169 @@
+import asyncio
+import logging
+import time
+import traceback
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pymongo import ReturnDocument
+
+from managers.database_manager import DatabaseManager
+
+
+class JobQueue:
+    COLLECTION = 'jobs'
+
+    def __init__(self, bot, db_manager: Optional[DatabaseManager] = None):
+        self.bot = bot
+        self.db_manager = db_manager or bot.database_manager
+        jobs_config = bot.config.get('jobs', {})
+        self.worker_count = jobs_config.get('workers', 4)
+        self.max_attempts = jobs_config.get('max_attempts', 5)
+        self.retry_base_delay = jobs_config.get('retry_base_delay', 5.0)
+        self.poll_interval = jobs_config.get('poll_interval', 5.0)
+        self._handlers: Dict[str, Callable[[Any, Dict[str, Any]], Awaitable[None]]] = {}
+        self._workers: List[asyncio.Task] = []
+        self._wakeups: List[asyncio.Event] = []
+
+    def register(self, job_type: str, handler: Callable[[Any, Dict[str, Any]], Awaitable[None]]) -> None:
+        self._handlers[job_type] = handler
+
+    def _job_document(self, job_type: str, payload: Dict[str, Any], delay: float = 0, then: Optional[List[Dict[str, Any]]] = None,
+                      max_attempts: Optional[int] = None) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            'type': job_type,
+            'payload': payload,
+            'status': 'pending',
+            'run_at': now + delay,
+            'attempts': 0,
+            'max_attempts': max_attempts or self.max_attempts,
+            'then': then or [],
+            'created_at': now,
+            'updated_at': now
+        }
+
+    def _wake(self) -> None:
+        for wakeup in self._wakeups:
+            wakeup.set()
+
+    def enqueue(self, job_type: str, payload: Dict[str, Any], delay: float = 0, then: Optional[List[Dict[str, Any]]] = None,
+                max_attempts: Optional[int] = None) -> Any:
+        job_id = self.db_manager.insert(self.COLLECTION, self._job_document(job_type, payload, delay, then, max_attempts))
+        self._wake()
+        logging.debug(f"Enqueued {job_type} job {job_id} to run in {delay}s")
+        return job_id
+
+    @staticmethod
+    def job(job_type: str, payload: Dict[str, Any], delay: float = 0, then: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        return {'type': job_type, 'payload': payload, 'delay': delay, 'then': then or []}
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        resumed = self.db_manager.update_many(
+            self.COLLECTION,
+            {'status': 'running'},
+            {'$set': {'status': 'pending', 'updated_at': time.time()}}
+        )
+        if resumed:
+            logging.info(f"Resuming {resumed} jobs interrupted by the last shutdown")
+        self._wakeups = [asyncio.Event() for _ in range(self.worker_count)]
+        self._workers = [asyncio.create_task(self._worker_loop(index)) for index in range(self.worker_count)]
+        logging.info(f"Job queue started with {self.worker_count} workers")
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        self._workers = []
+        self._wakeups = []
+
+    def _claim_next(self) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        return self.db_manager.db[self.COLLECTION].find_one_and_update(
+            {'status': 'pending', 'run_at': {'$lte': now}},
+            {'$set': {'status': 'running', 'updated_at': now}, '$inc': {'attempts': 1}},
+            sort=[('run_at', 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    def _seconds_until_next(self) -> float:
+        upcoming = self.db_manager.db[self.COLLECTION].find_one(
+            {'status': 'pending'},
+            sort=[('run_at', 1)],
+            projection={'run_at': 1}
+        )
+        if not upcoming:
+            return self.poll_interval
+        return min(self.poll_interval, max(0.0, upcoming['run_at'] - time.time()))
+
+    async def _worker_loop(self, index: int) -> None:
+        await self.bot.wait_until_ready()
+        wakeup = self._wakeups[index]
+        while True:
+            try:
+                wakeup.clear()
+                job = await asyncio.to_thread(self._claim_next)
+                if job is None:
+                    timeout = await asyncio.to_thread(self._seconds_until_next)
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                await self._run(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"Job worker {index} error: {e}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _run(self, job: Dict[str, Any]) -> None:
+        handler = self._handlers.get(job['type'])
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for job type {job['type']}")
+            await handler(self.bot, job['payload'])
+        except Exception as e:
+            error = ''.join(traceback.format_exception(type(e), e, e.__traceback__))[-1000:]
+            if job['attempts'] < job['max_attempts']:
+                delay = self.retry_base_delay * (2 ** (job['attempts'] - 1))
+                await asyncio.to_thread(
+                    self.db_manager.update_one,
+                    self.COLLECTION,
+                    {'_id': job['_id']},
+                    {'$set': {'status': 'pending', 'run_at': time.time() + delay, 'last_error': error, 'updated_at': time.time()}}
+                )
+                logging.warning(f"{job['type']} job {job['_id']} failed (attempt {job['attempts']}), retrying in {delay}s: {e}")
+                return
+            await self._enqueue_follow_ups(job)
+            await asyncio.to_thread(
+                self.db_manager.update_one,
+                self.COLLECTION,
+                {'_id': job['_id']},
+                {'$set': {'status': 'failed', 'last_error': error, 'updated_at': time.time()}}
+            )
+            logging.error(f"{job['type']} job {job['_id']} failed permanently after {job['attempts']} attempts: {e}")
+        else:
+            await self._enqueue_follow_ups(job)
+            await asyncio.to_thread(self.db_manager.delete, self.COLLECTION, {'_id': job['_id']})
+
+    def _insert_follow_ups(self, job: Dict[str, Any]) -> None:
+        for follow_up in job['then']:
+            document = self._job_document(follow_up['type'], follow_up['payload'], follow_up.get('delay', 0), follow_up.get('then'))
+            self.db_manager.insert(self.COLLECTION, document)
+
+    async def _enqueue_follow_ups(self, job: Dict[str, Any]) -> None:
+        if not job.get('then'):
+            return
+        await asyncio.to_thread(self._insert_follow_ups, job)
+        self._wake()
+
+    def get_stats(self) -> Dict[str, int]:
+        pipeline = [{'$group': {'_id': '$status', 'count': {'$sum': 1}}}]
+        counts = {row['_id']: row['count'] for row in self.db_manager.db[self.COLLECTION].aggregate(pipeline)}
+        return {status: counts.get(status, 0) for status in ('pending', 'running', 'failed')}
@@ -0,0 +1,186 @@
+import base64
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from pymongo import DESCENDING, errors
+
+from managers.database_manager import DatabaseManager
+
+
+FIELD_ALIASES = {
+    'elo': 'elo',
+    'wins': 'wins',
+    'losses': 'losses',
+    'games': 'gamesplayed',
+    'gamesplayed': 'gamesplayed',
+    'winstreak': 'winstreak',
+    'highest_elo': 'highest_elo',
+    'highestelo': 'highest_elo',
+    'highest_win_streak': 'highstwinstreak',
+    'highstwinstreak': 'highstwinstreak',
+    'beds': 'bedsbroken',
+    'bedsbroken': 'bedsbroken',
+    'mvps': 'mvps',
+    'finalkills': 'finalkills',
+    'kills': 'kills',
+    'deaths': 'deaths',
+    'diamonds': 'diamonds',
+    'irons': 'irons',
+    'gold': 'gold',
+    'emeralds': 'emeralds',
+    'blocks': 'blocksplaced',
+    'blocksplaced': 'blocksplaced',
+    'dailyelo': 'dailyelo'
+}
+
+
+def resolve_field(mode: Optional[str]) -> str:
+    if mode is None or str(mode).strip() == '':
+        return 'elo'
+    key = str(mode).lower().strip()
+    if key not in FIELD_ALIASES:
+        raise ValueError(
+            f"Invalid mode/stat. Use one of: {sorted(list(FIELD_ALIASES.keys()))} or omit for 'elo'"
+        )
+    return FIELD_ALIASES[key]
+
+
+def encode_cursor(field: str, value: Any, discord_id: str, rank: int, direction: str) -> str:
+    raw = json.dumps({'f': field, 'v': value, 'id': discord_id, 'r': rank, 'd': direction}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        cursor = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not isinstance(cursor, dict) or cursor.get('d') not in ('next', 'previous', 'at') or not {'f', 'v', 'id', 'r'} <= set(cursor):
+        raise ValueError("Invalid cursor")
+    if not isinstance(cursor['f'], str) or not isinstance(cursor['id'], str):
+        raise ValueError("Invalid cursor")
+    if cursor['v'] is not None and not isinstance(cursor['v'], (int, float, str)):
+        raise ValueError("Invalid cursor")
+    if isinstance(cursor['r'], bool) or not isinstance(cursor['r'], int) or cursor['r'] < 1:
+        raise ValueError("Invalid cursor")
+    return cursor
+
+
+class LeaderboardManager:
+    PROJECTION = {'_id': 0, 'discordid': 1, 'ign': 1}
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, count_ttl: float = 60.0):
+        self.db_manager = db_manager or DatabaseManager()
+        self.count_ttl = count_ttl
+        self._total = 0
+        self._total_expires = 0.0
+
+    def ensure_indexes(self) -> None:
+        collection = self.db_manager.db['users']
+        try:
+            for field in sorted(set(FIELD_ALIASES.values())):
+                collection.create_index(
+                    [(field, DESCENDING), ('discordid', DESCENDING)],
+                    name=f'lb_{field}_idx'
+                )
+        except errors.PyMongoError as e:
+            logging.warning(f"Could not ensure leaderboard indexes: {e}")
+
+    def total_players(self) -> int:
+        now = time.monotonic()
+        if now >= self._total_expires:
+            self._total = self.db_manager.db['users'].estimated_document_count()
+            self._total_expires = now + self.count_ttl
+        return self._total
+
+    @staticmethod
+    def _after(field: str, value: Any, discord_id: str, inclusive: bool = False) -> Dict[str, Any]:
+        id_condition = {'$lte' if inclusive else '$lt': discord_id}
+        if value is None:
+            return {field: None, 'discordid': id_condition}
+        return {'$or': [
+            {field: {'$lt': value}},
+            {field: value, 'discordid': id_condition},
+            {field: None}
+        ]}
+
+    @staticmethod
+    def _before(field: str, value: Any, discord_id: str) -> Dict[str, Any]:
+        if value is None:
+            return {'$or': [
+                {field: {'$ne': None}},
+                {field: None, 'discordid': {'$gt': discord_id}}
+            ]}
+        return {'$or': [
+            {field: {'$gt': value}},
+            {field: value, 'discordid': {'$gt': discord_id}}
+        ]}
+
+    def _find(self, field: str, query: Dict[str, Any], order: int, limit: int, skip: int = 0) -> List[Dict[str, Any]]:
+        projection = dict(self.PROJECTION, **{field: 1})
+        cursor = self.db_manager.db['users'].find(query, projection).sort([(field, order), ('discordid', order)])
+        if skip:
+            cursor = cursor.skip(skip)
+        return list(cursor.limit(limit))
+
+    def _build_page(self, field: str, players: List[Dict[str, Any]], first_rank: int, has_next: bool, limit: int) -> Dict[str, Any]:
+        entries = [
+            {
+                'rank': first_rank + index,
+                'discord_id': player.get('discordid', ''),
+                'ign': player.get('ign', ''),
+                field: player.get(field, 0)
+            }
+            for index, player in enumerate(players)
+        ]
+        total = self.total_players()
+        page = {
+            'mode': field,
+            'page': (first_rank - 1) // limit + 1,
+            'total_pages': max(1, (total + limit - 1) // limit),
+            'total_players': total,
+            'players': entries,
+            'next': None,
+            'previous': None,
+            'current': None
+        }
+        if entries:
+            first, last = players[0], players[-1]
+            page['current'] = encode_cursor(field, first.get(field), first.get('discordid', ''), first_rank, 'at')
+            if has_next:
+                page['next'] = encode_cursor(field, last.get(field), last.get('discordid', ''), entries[-1]['rank'], 'next')
+            if first_rank > 1:
+                page['previous'] = encode_cursor(field, first.get(field), first.get('discordid', ''), first_rank, 'previous')
+        return page
+
+    def get_page(self, field: str, limit: int = 10, cursor: Optional[str] = None) -> Dict[str, Any]:
+        if cursor is None:
+            players = self._find(field, {}, -1, limit + 1)
+            return self._build_page(field, players[:limit], 1, len(players) > limit, limit)
+
+        position = decode_cursor(cursor)
+        if position['f'] != field:
+            raise ValueError("Cursor belongs to a different leaderboard")
+
+        if position['d'] == 'previous':
+            players = self._find(field, self._before(field, position['v'], position['id']), 1, limit)
+            players.reverse()
+            return self._build_page(field, players, max(1, position['r'] - len(players)), True, limit)
+
+        inclusive = position['d'] == 'at'
+        players = self._find(field, self._after(field, position['v'], position['id'], inclusive), -1, limit + 1)
+        first_rank = position['r'] if inclusive else position['r'] + 1
+        return self._build_page(field, players[:limit], first_rank, len(players) > limit, limit)
+
+    def get_page_at(self, field: str, position: int, limit: int = 10) -> Dict[str, Any]:
+        offset = max(0, (position - 1) // limit * limit)
+        players = self._find(field, {}, -1, limit + 1, skip=offset)
+        return self._build_page(field, players[:limit], offset + 1, len(players) > limit, limit)
+
+    def get_rank(self, field: str, user: Dict[str, Any]) -> int:
+        value = user.get(field)
+        discord_id = user.get('discordid', '')
+        return self.db_manager.db['users'].count_documents(self._before(field, value, discord_id)) + 1
@@ -0,0 +1,176 @@
+import asyncio
+import bisect
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pymongo import monitoring
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+WAIT_BUCKETS = (5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def timed(self, **labels):
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with self.time(**labels):
+                    return await func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            series = sorted((key, [list(counts), total, count]) for key, (counts, total, count) in self._series.items())
+        for key, (counts, total, count) in series:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{_format_labels(dict(labels, le=repr(bound)))} {cumulative}')
+            lines.append(f'{self.name}_bucket{_format_labels(dict(labels, le="+Inf"))} {count}')
+            lines.append(f'{self.name}_sum{_format_labels(labels)} {total}')
+            lines.append(f'{self.name}_count{_format_labels(labels)} {count}')
+        return lines
+
+
+class MongoLatencyListener(monitoring.CommandListener):
+    IGNORED_COMMANDS = {'hello', 'ismaster', 'isMaster', 'ping', 'saslStart', 'saslContinue', 'endSessions'}
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+        self._collections: Dict[Tuple[int, object], str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name in self.IGNORED_COMMANDS:
+            return
+        collection = event.command.get(event.command_name)
+        self._collections[(event.request_id, event.connection_id)] = collection if isinstance(collection, str) else ''
+
+    def _finish(self, event) -> None:
+        collection = self._collections.pop((event.request_id, event.connection_id), None)
+        if collection is None:
+            return
+        self.histogram.observe(event.duration_micros / 1_000_000, collection=collection, operation=event.command_name)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event)
+
+
+class MetricsManager:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(MetricsManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self.queue_wait = Histogram(
+            'rbw_queue_wait_seconds', 'Time from queue join to game start.', ('queue',), WAIT_BUCKETS
+        )
+        self.game_stage = Histogram(
+            'rbw_game_creation_stage_seconds', 'Duration of each game creation stage.', ('stage',)
+        )
+        self.scoring_duration = Histogram(
+            'rbw_scoring_duration_seconds', 'Duration of scoring a game.'
+        )
+        self.db_latency = Histogram(
+            'rbw_db_operation_seconds', 'MongoDB command latency.', ('collection', 'operation'),
+            (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+        )
+        self.ws_roundtrip = Histogram(
+            'rbw_websocket_roundtrip_seconds', 'Round-trip latency of websocket requests.', ('type',)
+        )
+        self.loop_lag = Histogram(
+            'rbw_event_loop_lag_seconds', 'Delay of scheduled wakeups on the bot event loop.',
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+        )
+        self.histograms = [
+            self.queue_wait, self.game_stage, self.scoring_duration,
+            self.db_latency, self.ws_roundtrip, self.loop_lag
+        ]
+        self.mongo_listener = MongoLatencyListener(self.db_latency)
+        self._loop_monitor: Optional[asyncio.Task] = None
+        self._initialized = True
+
+    def render(self) -> str:
+        lines = []
+        for histogram in self.histograms:
+            lines.extend(histogram.render())
+        return '\n'.join(lines) + '\n'
+
+    async def start_loop_monitor(self, interval: float = 0.5) -> None:
+        if self._loop_monitor and not self._loop_monitor.done():
+            return
+        self._loop_monitor = asyncio.create_task(self._monitor_loop(interval))
+
+    async def stop_loop_monitor(self) -> None:
+        if self._loop_monitor:
+            self._loop_monitor.cancel()
+            try:
+                await self._loop_monitor
+            except asyncio.CancelledError:
+                pass
+            self._loop_monitor = None
+
+    async def _monitor_loop(self, interval: float) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            lag = max(0.0, loop.time() - expected)
+            self.loop_lag.observe(lag)
+            if lag > 1.0:
+                logging.warning(f"Event loop lagged by {lag:.2f}s")
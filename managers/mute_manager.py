@@ -1,4 +1,3 @@
-import asyncio
 import re
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
@@ -10,7 +9,7 @@ class MuteManager:
     def __init__(self, bot):
         self.bot = bot
         self.db = bot.database_manager
-        self.auto_unmute_task = None
+        self.auto_unmute_enabled = False
         self.embed_builder = bot.embed_builder
         self.punishment_channel_id = int(bot.config["channels"]["punishments"])
 
@@ -42,33 +41,39 @@ class MuteManager:
         return current_time + int(delta.total_seconds())
 
     async def start_auto_unmute(self):
-        if self.auto_unmute_task is None:
-            self.auto_unmute_task = asyncio.create_task(self._auto_unmute_loop())
+        if not self.auto_unmute_enabled:
+            expiry_manager = self.bot.expiry_manager
+            expiry_manager.register("mute", self._expire_mute)
 
-    async def stop_auto_unmute(self):
-        if self.auto_unmute_task:
-            self.auto_unmute_task.cancel()
-            self.auto_unmute_task = None
+            active_mutes = self.db.find("mutes", {"unmuted": False})
+            for mute in active_mutes:
+                discord_id = str(mute["discordid"])
+                deadline = mute["duration"].time
+                current = expiry_manager.get_deadline("mute", discord_id)
+                if current is None or deadline > current:
+                    expiry_manager.schedule("mute", discord_id, deadline)
 
-    async def _auto_unmute_loop(self):
-        while True:
-            try:
-                current_time = Timestamp(int(datetime.now().timestamp()), 1)
-                expired_mutes = self.db.find(
-                    "mutes", {"duration": {"$lt": current_time}, "unmuted": False}
-                )
+            await expiry_manager.start()
+            self.auto_unmute_enabled = True
 
-                for mute in expired_mutes:
-                    await self.unmute_user(
-                        discord_id=mute["discordid"],
-                        unmute_reason="Mute duration expired",
-                        unmuted_by="System",
-                    )
+    async def stop_auto_unmute(self):
+        if self.auto_unmute_enabled:
+            self.bot.expiry_manager.unregister("mute")
+            self.auto_unmute_enabled = False
 
-                await asyncio.sleep(1)
-            except Exception as e:
-                self.bot.logger.error(f"Error in auto unmute loop: {e}")
-                await asyncio.sleep(1)
+    async def _expire_mute(self, discord_id: str):
+        active_mute = await self.is_muted(discord_id)
+        if active_mute:
+            self.bot.expiry_manager.schedule(
+                "mute", str(discord_id), active_mute["duration"].time
+            )
+            return
+
+        await self.unmute_user(
+            discord_id=str(discord_id),
+            unmute_reason="Mute duration expired",
+            unmuted_by="System",
+        )
 
     async def mute_user(
         self, discord_id: str, reason: str, duration: str, staffid: str
@@ -91,6 +96,7 @@ class MuteManager:
                 "unmuted": False,
             }
             self.db.insert("mutes", mute_data)
+            self.bot.expiry_manager.schedule("mute", str(discord_id), mute_duration)
             guild = self.bot.get_guild(int(self.bot.config["bot"]["guildid"]))
             if not guild:
                 raise ValueError("Could not find the configured guild")
@@ -138,6 +144,7 @@ class MuteManager:
                 {"discordid": str(discord_id), "unmuted": False},
                 {"$set": update_data},
             )
+            self.bot.expiry_manager.cancel("mute", str(discord_id))
             guild = self.bot.get_guild(int(self.bot.config["bot"]["guildid"]))
             if guild:
                 member = await guild.fetch_member(int(discord_id))
@@ -190,6 +197,22 @@ class MuteManager:
             self.bot.logger.error(f"Error checking mute status for {discord_id}: {e}")
             return None
 
+    async def get_muted_ids(self, discord_ids) -> set:
+        try:
+            current_time = Timestamp(int(datetime.now().timestamp()), 1)
+            active_mutes = self.db.find(
+                "mutes",
+                {
+                    "discordid": {"$in": [str(discord_id) for discord_id in discord_ids]},
+                    "unmuted": False,
+                    "duration": {"$gt": current_time},
+                },
+            )
+            return {str(mute["discordid"]) for mute in active_mutes}
+        except Exception as e:
+            self.bot.logger.error(f"Error checking mute status for {len(discord_ids)} users: {e}")
+            return set()
+
     async def get_mute_info(self, discord_id: str) -> Optional[Dict[str, Any]]:
         try:
             mute_data = self.db.find_one("mutes", {"discordid": str(discord_id)})
@@ -1,8 +1,9 @@
-import yaml
-import os
 from typing import List, Dict, Optional
 from managers.database_manager import DatabaseManager
+from managers.config_manager import ConfigManager
+from managers.party_registry import PartyRegistry
 from datetime import datetime
+import asyncio
 import discord
 from bson import Timestamp
 
@@ -10,27 +11,18 @@ class PartyManager:
     def __init__(self, config_file: str = 'configs/config.yml', db_manager: DatabaseManager = None, logger=None):
         self.db_manager = db_manager
         self.logger = logger if logger else print
-        self.config = self._load_config(config_file)
-        self.inactive_timeout = self.config.get('party', {}).get('inactive_timeout', 1800)
+        self.config_manager = ConfigManager(config_file)
+        self.registry = PartyRegistry(db_manager)
         
         self.autowarp_enabled = True
 
-    def _load_config(self, config_file: str) -> dict:
-        try:
-            if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as file:
-                    config = yaml.safe_load(file) or {}
-                    if hasattr(self.logger, 'info'):
-                        self.logger.info(f"Successfully loaded config from {config_file}")
-                    else:
-                        self.logger(f"Successfully loaded config from {config_file}")
-                    return config
-        except Exception as e:
-            if hasattr(self.logger, 'error'):
-                self.logger.error(f"Failed to load config from {config_file}: {e}")
-            else:
-                self.logger(f"Failed to load config from {config_file}: {e}")
-        return {}
+    @property
+    def config(self):
+        return self.config_manager.data
+
+    @property
+    def inactive_timeout(self) -> int:
+        return self.config.get('party', {}).get('inactive_timeout', 1800)
 
     def create_party(self, leader_id: str, party_name: str) -> bool:
         if hasattr(self.logger, 'info'):
@@ -66,6 +58,7 @@ class PartyManager:
 
         try:
             self.db_manager.insert('parties', party_data)
+            self.registry.put(party_data)
             if hasattr(self.logger, 'info'):
                 self.logger.info(f"Successfully created party {party_name}")
             else:
@@ -112,6 +105,7 @@ class PartyManager:
                     }
                 )
                 if success:
+                    self.registry.refresh(party_name)
                     if hasattr(self.logger, 'info'):
                         self.logger.info(f"Successfully invited {member_id} to party {party_name}")
                     else:
@@ -161,8 +155,8 @@ class PartyManager:
                         self.logger(f"Successfully kicked {member_id} from party {party_name}")
                     
                     
-                    updated_party = self.get_party(party_name)
-                    if not updated_party['members']:
+                    updated_party = self.registry.refresh(party_name)
+                    if updated_party and not updated_party['members']:
                         self.disband_party(party_name)
                     return True
                 return False
@@ -201,6 +195,10 @@ class PartyManager:
                     }
                 )
                 if success:
+                    self.registry.update(party_name, {
+                        'leader': member_id,
+                        'last_activity': Timestamp(int(datetime.now().timestamp()), 1)
+                    })
                     if hasattr(self.logger, 'info'):
                         self.logger.info(f"Successfully promoted {member_id} to leader in party {party_name}")
                     else:
@@ -231,6 +229,7 @@ class PartyManager:
         try:
             success = self.db_manager.delete('parties', {'party_name': party_name})
             if success:
+                self.registry.discard(party_name)
                 if hasattr(self.logger, 'info'):
                     self.logger.info(f"Successfully disbanded party {party_name}")
                 else:
@@ -280,8 +279,8 @@ class PartyManager:
                         self.logger(f"Successfully removed {member_id} from party {party_name}")
 
                     
-                    updated_party = self.get_party(party_name)
-                    if not updated_party['members']:
+                    updated_party = self.registry.refresh(party_name)
+                    if updated_party and not updated_party['members']:
                         self.disband_party(party_name)
                     return True
                 return False
@@ -319,6 +318,10 @@ class PartyManager:
                 }
             )
             if success:
+                self.registry.update(party_name, {
+                    'is_private': is_private,
+                    'last_activity': Timestamp(int(datetime.now().timestamp()), 1)
+                })
                 if hasattr(self.logger, 'info'):
                     self.logger.info(f"Successfully updated privacy for party {party_name}")
                 else:
@@ -339,7 +342,7 @@ class PartyManager:
                 self.logger("DatabaseManager not initialized")
             return None
             
-        return self.db_manager.find_one('parties', {'party_name': str(party_name)})
+        return self.registry.get(party_name)
 
     def get_party_members(self, party_name: str) -> Optional[List[str]]:
         party = self.get_party(str(party_name))
@@ -374,17 +377,29 @@ class PartyManager:
 
     def update_party_activity(self, party_name: str) -> None:
         try:
-            self.db_manager.update_one(
+            last_activity = Timestamp(int(datetime.now().timestamp()), 1)
+            if self.db_manager.update_one(
                 'parties',
                 {'party_name': party_name}, 
-                {'$set': {'last_activity': Timestamp(int(datetime.now().timestamp()), 1)}}
-            )
+                {'$set': {'last_activity': last_activity}}
+            ):
+                self.registry.update(party_name, {'last_activity': last_activity})
         except Exception as e:
             if hasattr(self.logger, 'error'):
                 self.logger.error(f"Failed to update party activity: {e}")
             else:
                 self.logger(f"Failed to update party activity: {e}")
 
+    def set_autowarp(self, party_name: str, enabled: bool) -> bool:
+        success = self.db_manager.update_one(
+            'parties',
+            {'party_name': party_name},
+            {'$set': {'autopartywarp': enabled}}
+        )
+        if success:
+            self.registry.update(party_name, {'autopartywarp': enabled})
+        return success
+
     async def check_inactive_parties(self) -> None:
         if not self.db_manager:
             self.logger.warning("DatabaseManager not initialized")
@@ -474,9 +489,10 @@ class PartyManager:
                 self.logger("DatabaseManager not initialized")
             return None
             
-        return self.db_manager.find_one('parties', {'members': str(member_id)})
+        return self.registry.get_by_member(member_id)
 
-    async def handle_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+    async def handle_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState,
+                                        worker_manager=None):
         if not after.channel or before.channel == after.channel:
             return  
 
@@ -489,27 +505,45 @@ class PartyManager:
         if not party.get('autopartywarp', False):
             return  
 
-        cant_move = []
         target_channel = after.channel
-
-        
+        party_members = []
         for member_id in party.get('members', []):
             if member_id == str(member.id):  
                 continue
 
             party_member = member.guild.get_member(int(member_id))
-            if party_member:
-                try:
-                    await party_member.move_to(target_channel)
-                except:
-                    cant_move.append(party_member.mention)
+            if party_member and not (party_member.voice and party_member.voice.channel == target_channel):
+                party_members.append(party_member)
+
+        if not party_members:
+            return
+
+        member_ids = [str(party_member.id) for party_member in party_members]
+        warp = self.registry.begin_warp(member_ids)
+        try:
+            if worker_manager and worker_manager.available:
+                failed = await worker_manager.move_players([
+                    {'player_id': party_member.id, 'channel_id': target_channel.id}
+                    for party_member in party_members
+                ])
+            else:
+                results = await asyncio.gather(
+                    *(party_member.move_to(target_channel) for party_member in party_members),
+                    return_exceptions=True
+                )
+                failed = [
+                    party_member.id for party_member, result in zip(party_members, results)
+                    if isinstance(result, Exception)
+                ]
+        finally:
+            self.registry.end_warp(member_ids, warp)
+
+        cant_move = [party_member.mention for party_member in party_members if party_member.id in failed]
 
         
         if cant_move:
             try:
-                with open('configs/config.yml', 'r', encoding='utf-8') as file:
-                    config = yaml.safe_load(file)
-                alerts_channel = member.guild.get_channel(int(config['channels']['alerts']))
+                alerts_channel = member.guild.get_channel(int(self.config['channels']['alerts']))
                 
                 if alerts_channel:
                     alert_embed = discord.Embed(
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from managers.database_manager import DatabaseManager
+
+
+class PartyRegistry:
+    _instance = None
+    _lock = threading.RLock()
+
+    def __new__(cls, db_manager: Optional[DatabaseManager] = None):
+        if cls._instance is None:
+            cls._instance = super(PartyRegistry, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        if self._initialized:
+            return
+        self.db_manager = db_manager or DatabaseManager()
+        self._parties: Dict[str, Dict[str, Any]] = {}
+        self._members: Dict[str, str] = {}
+        self._loaded = False
+        self._warps: Dict[str, asyncio.Event] = {}
+        self._initialized = True
+
+    def load(self) -> None:
+        parties = self.db_manager.find('parties', {})
+        with self._lock:
+            self._parties.clear()
+            self._members.clear()
+            for party in parties:
+                self._put(party)
+            self._loaded = True
+        logging.info(f"Loaded {len(self._parties)} parties into the party registry")
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    @staticmethod
+    def _copy(party: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if party is None:
+            return None
+        return dict(party, members=list(party.get('members', [])))
+
+    def _put(self, party: Dict[str, Any]) -> None:
+        party_name = party.get('party_name')
+        if not party_name:
+            return
+        previous = self._parties.get(party_name)
+        if previous:
+            for member_id in previous.get('members', []):
+                if self._members.get(member_id) == party_name:
+                    del self._members[member_id]
+        party = self._copy(party)
+        self._parties[party_name] = party
+        for member_id in party['members']:
+            self._members[str(member_id)] = party_name
+
+    def _discard(self, party_name: str) -> None:
+        party = self._parties.pop(party_name, None)
+        if party:
+            for member_id in party.get('members', []):
+                if self._members.get(member_id) == party_name:
+                    del self._members[member_id]
+
+    def put(self, party: Dict[str, Any]) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            self._put(party)
+
+    def discard(self, party_name: str) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            self._discard(str(party_name))
+
+    def update(self, party_name: str, fields: Dict[str, Any]) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            party = self._parties.get(str(party_name))
+            if party:
+                party.update(fields)
+
+    def refresh(self, party_name: str) -> Optional[Dict[str, Any]]:
+        party = self.db_manager.find_one('parties', {'party_name': str(party_name)})
+        with self._lock:
+            self._ensure_loaded()
+            if party:
+                self._put(party)
+            else:
+                self._discard(str(party_name))
+        return self._copy(party)
+
+    def get(self, party_name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._ensure_loaded()
+            return self._copy(self._parties.get(str(party_name)))
+
+    def get_by_member(self, member_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._ensure_loaded()
+            party_name = self._members.get(str(member_id))
+            return self._copy(self._parties.get(party_name)) if party_name else None
+
+    def all(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._ensure_loaded()
+            return [self._copy(party) for party in self._parties.values()]
+
+    def begin_warp(self, member_ids: List[str]) -> asyncio.Event:
+        event = asyncio.Event()
+        for member_id in member_ids:
+            self._warps[str(member_id)] = event
+        return event
+
+    def end_warp(self, member_ids: List[str], event: asyncio.Event) -> None:
+        for member_id in member_ids:
+            if self._warps.get(str(member_id)) is event:
+                del self._warps[str(member_id)]
+        event.set()
+
+    async def wait_for_warp(self, member_id: str, timeout: float = 10.0) -> None:
+        event = self._warps.get(str(member_id))
+        if event is None:
+            return
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logging.warning(f"Timed out waiting for party warp of member {member_id}")
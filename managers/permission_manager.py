@@ -1,6 +1,12 @@
 import yaml
 import os
-from typing import List
+import threading
+from typing import Dict, List, Tuple
+
+
+_parsed_files: Dict[str, Tuple[float, dict]] = {}
+_parsed_files_lock = threading.Lock()
+
 
 class PermissionManager:
     def __init__(self, permissions_file: str = 'configs/permissions.yml'):
@@ -12,8 +18,15 @@ class PermissionManager:
     def load_permissions(self) -> dict:
         try:
             if os.path.exists(self.permissions_file):
-                with open(self.permissions_file, 'r') as file:
-                    return yaml.safe_load(file) or {}
+                modified = os.path.getmtime(self.permissions_file)
+                with _parsed_files_lock:
+                    cached = _parsed_files.get(self.permissions_file)
+                    if cached and cached[0] == modified:
+                        return cached[1]
+                    with open(self.permissions_file, 'r') as file:
+                        permissions = yaml.safe_load(file) or {}
+                    _parsed_files[self.permissions_file] = (modified, permissions)
+                    return permissions
         except Exception as e:
             print(f'Failed to load permissions: {e}')
         return {}
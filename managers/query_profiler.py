@@ -0,0 +1,148 @@
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import monitoring
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def query_shape(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = []
+        for item in value:
+            shape = query_shape(item)
+            if shape not in shapes:
+                shapes.append(shape)
+        return shapes
+    return '?'
+
+
+class QueryStats:
+    __slots__ = ('count', 'total', 'max', 'callers')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.callers: Dict[str, int] = {}
+
+    def add(self, duration: float, caller: str) -> None:
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.callers[caller] = self.callers.get(caller, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        top_callers = sorted(self.callers.items(), key=lambda item: item[1], reverse=True)[:3]
+        return {
+            'count': self.count,
+            'total_ms': round(self.total * 1000, 2),
+            'avg_ms': round(self.total * 1000 / self.count, 2) if self.count else 0.0,
+            'max_ms': round(self.max * 1000, 2),
+            'callers': [caller for caller, _ in top_callers]
+        }
+
+
+class QueryProfiler(monitoring.CommandListener):
+    IGNORED_COMMANDS = {'hello', 'ismaster', 'isMaster', 'ping', 'saslStart', 'saslContinue', 'endSessions'}
+    SKIPPED_FILES = ('database_manager.py', 'query_profiler.py', 'metrics_manager.py')
+
+    def __init__(self, enabled: bool = False, slow_ms: float = 100.0, max_shapes: int = 500):
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.max_shapes = max_shapes
+        self._pending: Dict[Tuple[int, object], Tuple[str, str, str, str]] = {}
+        self._stats: Dict[Tuple[str, str, str], QueryStats] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[dict]) -> 'QueryProfiler':
+        config = config or {}
+        return cls(
+            enabled=config.get('enabled', False),
+            slow_ms=float(config.get('slow_ms', 100)),
+            max_shapes=int(config.get('max_shapes', 500))
+        )
+
+    @staticmethod
+    def _filter(command_name: str, command: Dict[str, Any]) -> Any:
+        if command_name in ('find', 'count', 'distinct'):
+            return command.get('filter', command.get('query', {}))
+        if command_name == 'findAndModify':
+            return command.get('query', {})
+        if command_name == 'update':
+            return [update.get('q', {}) for update in command.get('updates', [])]
+        if command_name == 'delete':
+            return [delete.get('q', {}) for delete in command.get('deletes', [])]
+        if command_name == 'aggregate':
+            return [next(iter(stage), '') for stage in command.get('pipeline', [])]
+        return {}
+
+    def _caller(self) -> str:
+        frame = sys._getframe(2)
+        while frame:
+            filename = frame.f_code.co_filename
+            if filename.startswith(PROJECT_ROOT) and not filename.endswith(self.SKIPPED_FILES):
+                return f"{os.path.relpath(filename, PROJECT_ROOT)}:{frame.f_lineno} ({frame.f_code.co_name})"
+            frame = frame.f_back
+        return 'unknown'
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if not self.enabled or event.command_name in self.IGNORED_COMMANDS:
+            return
+        collection = event.command.get(event.command_name)
+        shape = query_shape(self._filter(event.command_name, event.command))
+        self._pending[(event.request_id, event.connection_id)] = (
+            collection if isinstance(collection, str) else '',
+            event.command_name,
+            json.dumps(shape, sort_keys=True, default=str),
+            self._caller()
+        )
+
+    def _finish(self, event) -> None:
+        pending = self._pending.pop((event.request_id, event.connection_id), None)
+        if pending is None:
+            return
+        collection, operation, shape, caller = pending
+        duration = event.duration_micros / 1_000_000
+        key = (collection, operation, shape)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self.max_shapes:
+                    del self._stats[min(self._stats, key=lambda existing: self._stats[existing].total)]
+                stats = self._stats[key] = QueryStats()
+            stats.add(duration, caller)
+        if duration * 1000 >= self.slow_ms:
+            logging.warning(
+                f"Slow query {duration * 1000:.1f}ms: {operation} {collection} {shape} from {caller}"
+            )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def report(self, top_n: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+        with self._lock:
+            entries = [
+                dict(stats.to_dict(), collection=collection, operation=operation, shape=shape)
+                for (collection, operation, shape), stats in self._stats.items()
+            ]
+        return {
+            'slowest': sorted(entries, key=lambda entry: entry['max_ms'], reverse=True)[:top_n],
+            'most_time': sorted(entries, key=lambda entry: entry['total_ms'], reverse=True)[:top_n],
+            'most_frequent': sorted(entries, key=lambda entry: entry['count'], reverse=True)[:top_n]
+        }
@@ -3,17 +3,16 @@ from typing import Dict, List, Set, Optional, Tuple
 from datetime import datetime
 import discord
 from managers.database_manager import DatabaseManager
-from managers.party_manager import PartyManager
-from utils.embed_builder import EmbedBuilder
 import random
 import string
 from bson import Timestamp  
-from managers.mute_manager import MuteManager
-import os
+from pymongo import errors
+from managers.game_id_allocator import GameIdAllocator
+from managers.metrics_manager import MetricsManager
 import time
 import logging
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from discord import app_commands
 from managers.workermanager import WorkerManager
 
@@ -24,22 +23,29 @@ except ImportError:
     WebSocketManager = None
 
 class QueueProcessor:
+    GAME_ID_ATTEMPTS = 5
+
     def __init__(self, bot):
         self.bot = bot
         self.db_manager = DatabaseManager()
-        self.party_manager = PartyManager(config_file='configs/config.yml', db_manager=self.db_manager)
-        self.embed_builder = EmbedBuilder()
-        self.mute_manager = MuteManager(self.bot)
+        self.party_manager = bot.services.party_manager
+        self.embed_builder = bot.services.embed_builder
+        self.mute_manager = bot.services.mute_manager
+        self.game_id_allocator = GameIdAllocator(self.db_manager)
         self.guild_id = int(self.bot.config['bot']['guildid'])
+        self.queue_registry = self.bot.queue_registry
         
         
         self.queues = {}  
         self.player_queue_map = {}  
+        self.queue_join_times = {}  
         self.queue_locks = {}  
         self.processing_flags = {}  
         self.player_locks = defaultdict(asyncio.Lock)  
         self.queue_tasks = {}  
         self.continuous_queue_tasks = {}  
+        self.game_creation_timings = deque(maxlen=100)  
+        self.metrics = MetricsManager()
         
         
         self._load_queue_processor_config()
@@ -53,6 +59,7 @@ class QueueProcessor:
         
         
         self._init_continuous_processing()
+        self.queue_registry.subscribe(self._on_queue_registry_change)
 
         logging.info(f"QueueProcessor initialized with high-capacity configuration and continuous processing. WebSocket enabled: {self.websocket_enabled}")
     
@@ -117,6 +124,7 @@ class QueueProcessor:
                 self.player_locks[player_id].release()
     async def process_queue_join(self, user_id: int, channel_id: str) -> None:
         try:
+            await self.party_manager.registry.wait_for_warp(str(user_id))
             
             if channel_id not in self.queue_locks:
                 self.queue_locks[channel_id] = asyncio.Lock()
@@ -136,7 +144,7 @@ class QueueProcessor:
                 
                 async with self.queue_locks[channel_id]:
                     
-                    queue_settings = self.db_manager.find_one('queues', {'channelid': str(channel_id)})
+                    queue_settings = self.queue_registry.get(channel_id)
                     if not queue_settings:
                         logging.warning(f"No queue settings found for channel {channel_id} in database")
                         return
@@ -180,22 +188,35 @@ class QueueProcessor:
                             return
                         
                         
-                        for member_id in present_members:
-                            if member_id not in self.player_queue_map:
-                                self.queues[channel_id]['players'].add(member_id)
-                                self.player_queue_map[member_id] = channel_id
+                        arrivals = [member_id for member_id in present_members if member_id not in self.player_queue_map]
+                        if not arrivals:
+                            logging.debug(f"Party of {user_id} is already queued in {channel_id}")
+                            return
+                        for member_id in arrivals:
+                            self.queues[channel_id]['players'].add(member_id)
+                            self.player_queue_map[member_id] = channel_id
+                            self.queue_join_times[member_id] = time.time()
                         
                         
+                        queued_members = [
+                            member_id for member_id in party_members
+                            if self.player_queue_map.get(member_id) == channel_id
+                        ]
+                        earlier = [p for p in self.queues[channel_id]['parties'] if party_members & set(p['members'])]
+                        self.queues[channel_id]['parties'] = [
+                            p for p in self.queues[channel_id]['parties'] if not party_members & set(p['members'])
+                        ]
                         self.queues[channel_id]['parties'].append({
-                            'members': list(present_members),
-                            'size': len(present_members),
-                            'join_time': time.time()
+                            'members': queued_members,
+                            'size': len(queued_members),
+                            'join_time': min([p['join_time'] for p in earlier], default=time.time())
                         })
-                        logging.debug(f"Added party with {len(present_members)} members to queue {channel_id}")
+                        logging.debug(f"Added party with {len(queued_members)} members to queue {channel_id}")
                     else:
                         
                         self.queues[channel_id]['players'].add(user_id)
                         self.player_queue_map[user_id] = channel_id
+                        self.queue_join_times[user_id] = time.time()
                         logging.debug(f"Added solo player {user_id} to queue {channel_id}")
                     
                     
@@ -235,6 +256,7 @@ class QueueProcessor:
                             if member_id_int in self.queues[channel_id]['players']:
                                 self.queues[channel_id]['players'].discard(member_id_int)
                                 self.player_queue_map.pop(member_id_int, None)
+                                self.queue_join_times.pop(member_id_int, None)
                         
                         
                         self.queues[channel_id]['parties'] = [
@@ -245,6 +267,7 @@ class QueueProcessor:
                         
                         self.queues[channel_id]['players'].discard(user_id)
                         self.player_queue_map.pop(user_id, None)
+                        self.queue_join_times.pop(user_id, None)
             
             
             if new_channel_id:
@@ -289,7 +312,12 @@ class QueueProcessor:
         player_count = len(queue['players'])
         
         
-        queue_settings = self.db_manager.find_one('queues', {'channelid': str(channel_id)})
+        queue_settings = self.queue_registry.get(channel_id)
+        if not queue_settings:
+            return False
+            
+        
+        return player_count >= queue_settings['maxplayers']
         
     async def check_player_online(self, ign: str) -> bool:
         if not self.websocket_enabled or not self.ws_manager:
@@ -317,11 +345,6 @@ class QueueProcessor:
         except Exception as e:
             logging.error(f"Error checking player online status: {e}", exc_info=True)
             return True  
-        if not queue_settings:
-            return False
-            
-        
-        return player_count >= queue_settings['maxplayers']
     
     def _create_batch(self, players: Set[int], parties: List[Set[int]], max_players: int) -> Tuple[Set[int], List[Set[int]]]:
         batch = set()
@@ -351,6 +374,14 @@ class QueueProcessor:
         try:
             logging.info(f"Starting game for batch of {len(batch)} players from queue {channel_id}")
             
+            stage_timings = {}
+            batch_started = stage_clock = time.perf_counter()
+            
+            def mark_stage(stage: str):
+                nonlocal stage_clock
+                now = time.perf_counter()
+                stage_timings[stage] = now - stage_clock
+                stage_clock = now
             
             parties = []
             processed_players = set()
@@ -370,87 +401,39 @@ class QueueProcessor:
                 return
             
             team1, team2 = teams
-              
-            def generate_random_game_id():
-                return ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
-                
             
-            game_id = generate_random_game_id()
-            while self.db_manager.find_one('games', {'gameid': game_id}):
-                
-                game_id = generate_random_game_id()
-                logging.debug(f"Generated new game ID due to collision: {game_id}")
+            mark_stage('teams')
             
+            game_id = await self._insert_game(team1, team2, queue_settings)
+            if not game_id:
+                logging.error(f"Failed to allocate a game ID for batch in queue {channel_id}")
+                return
+            mark_stage('allocate')
             
-            game_text_channel = await self.create_game_channels(game_id, team1, team2)
-            if not game_text_channel:
+            game_channels = await self.create_game_channels(game_id, team1, team2)
+            if not game_channels:
                 logging.error(f"Failed to create game channels for game {game_id}")
+                await asyncio.to_thread(self.db_manager.delete, 'games', {'gameid': game_id})
                 return
+            mark_stage('channels')
             
-            
-            game_channels = self.db_manager.find_one('gameschannels', {'textchannelid': str(game_text_channel.id)})
-            if game_channels:
-                await self.warp_players_to_channels(
-                    team1, team2, 
-                    game_channels['team1voicechannelid'], 
-                    game_channels['team2voicechannelid']
-                )
-              
-            team1_igns = await self.get_team_igns(team1)
-            team2_igns = await self.get_team_igns(team2)
+            game_text_channel, voice_team1, voice_team2 = game_channels
             
             
             gametype = 'casual' if queue_settings.get('iscasual') else 'ranked'
             
+            await asyncio.to_thread(
+                self._persist_game_start,
+                game_id, team1, team2, gametype,
+                game_text_channel.id, voice_team1.id, voice_team2.id
+            )
+            mark_stage('persist')
             
-            current_timestamp = Timestamp(int(time.time()), 1)
-                
-            game_data = {
-                'gameid': game_id,
-                'team1': [str(player_id) for player_id in team1],  
-                'team2': [str(player_id) for player_id in team2],  
-                'state': 'pending',
-                'gametype': queue_settings.get('gametype', 'unknown'),
-                'map': 'random',  
-                'date': current_timestamp,  
-                'start_time': current_timestamp,  
-                'end_time': current_timestamp  
-            }
-            self.db_manager.insert('games', game_data)
-            
-            
-            for player_id in team1 + team2:
-                try:
-                    recent_game_auto_id = self.db_manager.get_next_sequence('recentgames')
-                    self.db_manager.insert('recentgames', {
-                        'id': str(recent_game_auto_id),
-                        'discordid': str(player_id),
-                        'gameid': game_id,
-                        'result': 'pending',
-                        'state': 'pending',
-                        'ismvp': False,
-                        'gametype': gametype,
-                        'elochange': 0,
-                        'date': current_timestamp
-                    })
-                    
-                    
-                    self.db_manager.increment(
-                        'users', 
-                        {'discordid': str(player_id)}, 
-                        {'$inc': {'gamesplayed': 1}}
-                    )
-                except Exception as e:
-                    logging.error(f"Error adding recent game for player {player_id}: {e}")
-            
-            
-            if game_channels:
-                self.db_manager.insert('gameschannels', {
-                    'gameid': game_id,
-                    'textchannelid': str(game_text_channel.id),
-                    'team1voicechannelid': str(game_channels['team1voicechannelid']),
-                    'team2voicechannelid': str(game_channels['team2voicechannelid'])
-                })
+            await self.warp_players_to_channels(team1, team2, voice_team1.id, voice_team2.id)
+            mark_stage('warp')
+              
+            team1_igns = await self.get_team_igns(team1)
+            team2_igns = await self.get_team_igns(team2)
             
             
             try:
@@ -467,8 +450,21 @@ class QueueProcessor:
                 logging.error(f"Error sending game details: {e}")
                 
                 await self.send_party_invites(game_text_channel, team1_igns, team2_igns)
+            mark_stage('announce')
             
-            logging.info(f"Successfully created game {game_id} for queue {channel_id}")
+            total = time.perf_counter() - batch_started
+            for stage, duration in stage_timings.items():
+                self.metrics.game_stage.observe(duration, stage=stage)
+            self.metrics.game_stage.observe(total, stage='total')
+            self.game_creation_timings.append({
+                'gameid': game_id,
+                'queue': channel_id,
+                'players': len(batch),
+                'stages': stage_timings,
+                'total': total
+            })
+            stage_report = ', '.join(f"{stage}={duration * 1000:.0f}ms" for stage, duration in stage_timings.items())
+            logging.info(f"Successfully created game {game_id} for queue {channel_id} in {total * 1000:.0f}ms ({stage_report})")
         
         except Exception as e:
             logging.error(f"Error in _start_game_batch: {e}", exc_info=True)
@@ -479,6 +475,67 @@ class QueueProcessor:
                 self.players_in_game_creation.discard(player_id)
             self.release_player_locks(batch)
 
+    async def _insert_game(self, team1: List[int], team2: List[int], queue_settings: dict) -> Optional[str]:
+        for _ in range(self.GAME_ID_ATTEMPTS):
+            game_id = await self.game_id_allocator.next_id()
+            try:
+                await asyncio.to_thread(self._persist_game, game_id, team1, team2, queue_settings)
+                return game_id
+            except errors.DuplicateKeyError:
+                logging.warning(f"Game ID {game_id} is already in use, allocating another")
+        return None
+
+    def _persist_game(self, game_id: str, team1: List[int], team2: List[int], queue_settings: dict) -> None:
+        current_timestamp = Timestamp(int(time.time()), 1)
+        
+        game_data = {
+            'gameid': game_id,
+            'team1': [str(player_id) for player_id in team1],  
+            'team2': [str(player_id) for player_id in team2],  
+            'state': 'pending',
+            'gametype': queue_settings.get('gametype', 'unknown'),
+            'map': 'random',  
+            'date': current_timestamp,  
+            'start_time': current_timestamp,  
+            'end_time': current_timestamp  
+        }
+        self.db_manager.insert('games', game_data)
+
+    def _persist_game_start(self, game_id: str, team1: List[int], team2: List[int], gametype: str,
+                            text_channel_id: int, team1_voice_id: int, team2_voice_id: int) -> None:
+        players = [str(player_id) for player_id in team1 + team2]
+        current_timestamp = Timestamp(int(time.time()), 1)
+        
+        self.db_manager.insert('gameschannels', {
+            'gameid': game_id,
+            'textchannelid': str(text_channel_id),
+            'team1voicechannelid': str(team1_voice_id),
+            'team2voicechannelid': str(team2_voice_id)
+        })
+        
+        recent_game_ids = self.db_manager.reserve_sequence_block('recentgames', len(players))
+        self.db_manager.insert_many('recentgames', [
+            {
+                '_id': str(recent_game_id),
+                'id': str(recent_game_id),
+                'discordid': player_id,
+                'gameid': game_id,
+                'result': 'pending',
+                'state': 'pending',
+                'ismvp': False,
+                'gametype': gametype,
+                'elochange': 0,
+                'date': current_timestamp
+            }
+            for player_id, recent_game_id in zip(players, recent_game_ids)
+        ])
+        
+        self.db_manager.update_many(
+            'users',
+            {'discordid': {'$in': players}},
+            {'$inc': {'gamesplayed': 1}}
+        )
+
     async def move_players_to_voice_channels(self, team1: List[int], team2: List[int], game_text_channel: discord.TextChannel) -> None:
         pass  
 
@@ -566,7 +623,7 @@ class QueueProcessor:
             for player_id in team2:
                 moves.append({'player_id': player_id, 'channel_id': int(team2_channel_id)})
 
-            if hasattr(self, 'worker_manager') and self.worker_manager.enabled:
+            if self.worker_manager and self.worker_manager.available:
                 
                 await self.worker_manager.move_players(moves)
             else:
@@ -627,7 +684,7 @@ class QueueProcessor:
             print(f"Error creating fair teams: {e}")
             return None
 
-    async def create_game_channels(self, game_id: str, team1: List[int], team2: List[int]) -> Optional[discord.TextChannel]:
+    async def create_game_channels(self, game_id: str, team1: List[int], team2: List[int]) -> Optional[Tuple[discord.TextChannel, discord.VoiceChannel, discord.VoiceChannel]]:
         try:
             print(f"Creating game channels for game {game_id}")
 
@@ -644,13 +701,27 @@ class QueueProcessor:
                 print("Required categories not found")
                 return None
 
+            muted_ids = await self.mute_manager.get_muted_ids(team1 + team2)
+
             overwrites = {
-                guild.default_role: discord.PermissionOverwrite(view_channel=False)
+                guild.default_role: discord.PermissionOverwrite(view_channel=False, send_messages=False)
+            }
+            overwrites_team1 = {
+                guild.default_role: discord.PermissionOverwrite(view_channel=True, connect=False, speak=False)
             }
-            overwritesforvc = {
-                guild.default_role: discord.PermissionOverwrite(view_channel=True)
+            overwrites_team2 = {
+                guild.default_role: discord.PermissionOverwrite(view_channel=True, connect=False, speak=False)
             }
 
+            for team, team_overwrites in ((team1, overwrites_team1), (team2, overwrites_team2)):
+                for player_id in team:
+                    member = guild.get_member(player_id)
+                    if member:
+                        overwrites[member] = discord.PermissionOverwrite(view_channel=True, send_messages=True)
+                        team_overwrites[member] = discord.PermissionOverwrite(
+                            view_channel=True, connect=True, speak=str(player_id) not in muted_ids
+                        )
+
             text_channel_task = guild.create_text_channel(
                 f"GAME #{game_id}", 
                 category=games_category,
@@ -660,13 +731,13 @@ class QueueProcessor:
             voice_team1_task = guild.create_voice_channel(
                 f"GAME #{game_id} T-1", 
                 category=voice_category,
-                overwrites=overwritesforvc
+                overwrites=overwrites_team1
             )
 
             voice_team2_task = guild.create_voice_channel(
                 f"GAME #{game_id} T-2", 
                 category=voice_category,
-                overwrites=overwritesforvc
+                overwrites=overwrites_team2
             )
 
             text_channel, voice_team1, voice_team2 = await asyncio.gather(
@@ -675,36 +746,7 @@ class QueueProcessor:
 
             print(f"Channels created: Text - {text_channel.id}, Team1 Voice - {voice_team1.id}, Team2 Voice - {voice_team2.id}")
 
-            
-            await text_channel.set_permissions(guild.default_role, view_channel=False, send_messages=False)
-            
-            await voice_team1.set_permissions(guild.default_role, view_channel=True, connect=False, speak=False)
-            await voice_team2.set_permissions(guild.default_role, view_channel=True, connect=False, speak=False)
-
-            for player_id in team1:
-                member = guild.get_member(player_id)
-                if member:
-                    is_muted = await self.mute_manager.is_muted(player_id)
-                    await text_channel.set_permissions(member, view_channel=True, send_messages=True)
-                    await voice_team1.set_permissions(member, view_channel=True, connect=True, speak=not is_muted)
-
-            for player_id in team2:
-                member = guild.get_member(player_id)
-                if member:
-                    is_muted = await self.mute_manager.is_muted(player_id)
-                    await text_channel.set_permissions(member, view_channel=True, send_messages=True)
-                    await voice_team2.set_permissions(member, view_channel=True, connect=True, speak=not is_muted)
-
-            game_channels_id = self.db_manager.get_next_sequence('gameschannels')
-            self.db_manager.insert('gameschannels', {
-                '_id': str(game_channels_id),
-                'gameid': game_id,
-                'textchannelid': str(text_channel.id),
-                'team1voicechannelid': str(voice_team1.id),
-                'team2voicechannelid': str(voice_team2.id)
-            })
-
-            return text_channel
+            return text_channel, voice_team1, voice_team2
 
         except Exception as e:
             print(f"Error creating game channels: {e}")
@@ -769,22 +811,12 @@ class QueueProcessor:
 
     async def send_seasoninfo_embed(self, channel: discord.TextChannel) -> None:
         try:
-            config_path = 'configs/seasoninfo.yml'
-            
-            if not os.path.exists(config_path):
-                print(f"Season info file not found at {config_path}")
+            season_info = self.bot.settings_cache.season_info()
+            if not season_info:
+                print(f"Season info file not found at {self.bot.settings_cache.SEASON_INFO_PATH}")
                 return
             
-            with open(config_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            content = content.replace(':rbw_yes:', '✅')
-            content = content.replace(':rbw_maybe:', '⚠️')
-            content = content.replace(':rbw_no:', '❌')
-            
-            lines = content.strip().split('\n')
-            title = lines[0]
-            description = '\n'.join(lines[1:])
+            title, description = season_info
             
             embed = self.embed_builder.build_info(
                 title=title,
@@ -803,8 +835,9 @@ class QueueProcessor:
         try:
             
             await self.bot.wait_until_ready()
+            await self.game_id_allocator.prefetch()
               
-            queues = self.db_manager.find('queues', {})
+            queues = self.queue_registry.all()
             
             for queue in queues:
                 channel_id = queue['channelid']
@@ -828,6 +861,30 @@ class QueueProcessor:
         except Exception as e:
             logging.error(f"Error initializing continuous processing: {e}", exc_info=True)
     
+    def _on_queue_registry_change(self, event: str, channel_id: str, queue_settings: Optional[dict]):
+        if event == 'removed':
+            task = self.continuous_queue_tasks.pop(channel_id, None)
+            if task and not task.done():
+                task.cancel()
+            logging.info(f"Queue {channel_id} removed from registry, stopped continuous processing")
+            return
+        
+        if channel_id in self.queues:
+            self.queues[channel_id]['max_players'] = queue_settings['maxplayers']
+        else:
+            self.queues[channel_id] = {
+                'players': set(),
+                'max_players': queue_settings['maxplayers'],
+                'selected_map': None,
+                'parties': [],
+                'was_full': False,
+                'last_processed': 0,
+                'last_partial_check': 0
+            }
+        
+        if self.bot.is_ready():
+            asyncio.create_task(self.start_continuous_processing(channel_id))
+    
     async def start_continuous_processing(self, channel_id: str):
         if channel_id in self.continuous_queue_tasks and not self.continuous_queue_tasks[channel_id].done():
             
@@ -854,7 +911,7 @@ class QueueProcessor:
     async def process_queue(self, channel_id: str, allow_partial: bool = False):
         try:
             
-            queue_settings = self.db_manager.find_one('queues', {'channelid': str(channel_id)})
+            queue_settings = self.queue_registry.get(channel_id)
             if not queue_settings or channel_id not in self.queues:
                 return
             
@@ -922,9 +979,13 @@ class QueueProcessor:
                             self.players_in_game_creation.update(batch_list)
                             
                             
+                            dispatched_at = time.time()
                             for player_id in batch_list:
                                 queue['players'].discard(player_id)
                                 self.player_queue_map.pop(player_id, None)
+                                joined_at = self.queue_join_times.pop(player_id, None)
+                                if joined_at is not None:
+                                    self.metrics.queue_wait.observe(dispatched_at - joined_at, queue=channel_id)
                             
                             
                             asyncio.create_task(self._start_game_batch(
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from pymongo import errors
+
+from managers.database_manager import DatabaseManager
+
+
+class QueueRegistry:
+    def __init__(self, db_manager: DatabaseManager, poll_interval: float = 30.0):
+        self.db_manager = db_manager
+        self.poll_interval = poll_interval
+        self._by_channel: Dict[str, Dict[str, Any]] = {}
+        self._by_type: Dict[str, List[Dict[str, Any]]] = {'ranked': [], 'casual': []}
+        self._subscribers: List[Callable[[str, str, Optional[Dict[str, Any]]], None]] = []
+        self._watch_task = None
+        self._change_stream = None
+        self._loop = None
+
+    @staticmethod
+    def queue_type(queue: Dict[str, Any]) -> str:
+        return 'casual' if queue.get('iscasual', False) else 'ranked'
+
+    def load(self) -> None:
+        queues = self.db_manager.find('queues', {})
+        self._replace_all(queues)
+        logging.info(f"Queue registry loaded {len(self._by_channel)} queues")
+
+    def get(self, channel_id) -> Optional[Dict[str, Any]]:
+        return self._by_channel.get(str(channel_id))
+
+    def get_by_type(self, queue_type: str) -> List[Dict[str, Any]]:
+        queue_type = queue_type.lower()
+        if queue_type == 'any':
+            return self.all()
+        return list(self._by_type.get(queue_type, []))
+
+    def all(self) -> List[Dict[str, Any]]:
+        return list(self._by_channel.values())
+
+    def __contains__(self, channel_id) -> bool:
+        return str(channel_id) in self._by_channel
+
+    def subscribe(self, callback: Callable[[str, str, Optional[Dict[str, Any]]], None]) -> None:
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, str, Optional[Dict[str, Any]]], None]) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def add(self, document: Dict[str, Any]) -> None:
+        self.db_manager.insert('queues', document)
+        self._apply(document)
+
+    def remove(self, channel_id) -> bool:
+        deleted = self.db_manager.delete('queues', {'channelid': str(channel_id)})
+        self._discard(str(channel_id))
+        return deleted
+
+    def refresh(self) -> None:
+        queues = self.db_manager.find('queues', {})
+        self._replace_all(queues)
+
+    def _rebuild_type_index(self) -> None:
+        by_type = {'ranked': [], 'casual': []}
+        for queue in self._by_channel.values():
+            by_type[self.queue_type(queue)].append(queue)
+        self._by_type = by_type
+
+    def _replace_all(self, queues: List[Dict[str, Any]]) -> None:
+        incoming = {str(queue['channelid']): queue for queue in queues}
+        for channel_id in list(self._by_channel):
+            if channel_id not in incoming:
+                self._discard(channel_id)
+        for queue in incoming.values():
+            self._apply(queue)
+
+    def _apply(self, queue: Dict[str, Any]) -> None:
+        channel_id = str(queue['channelid'])
+        previous = self._by_channel.get(channel_id)
+        if previous == queue:
+            return
+        self._by_channel[channel_id] = queue
+        self._rebuild_type_index()
+        self._notify('added' if previous is None else 'updated', channel_id, queue)
+
+    def _discard(self, channel_id: str) -> None:
+        if self._by_channel.pop(channel_id, None) is None:
+            return
+        self._rebuild_type_index()
+        self._notify('removed', channel_id, None)
+
+    def _notify(self, event: str, channel_id: str, queue: Optional[Dict[str, Any]]) -> None:
+        for callback in list(self._subscribers):
+            try:
+                callback(event, channel_id, queue)
+            except Exception as e:
+                logging.error(f"Queue registry subscriber failed on {event} for {channel_id}: {e}")
+
+    async def start_watching(self) -> None:
+        if self._watch_task is None or self._watch_task.done():
+            self._loop = asyncio.get_running_loop()
+            self._watch_task = asyncio.create_task(self._watch_loop())
+
+    async def stop_watching(self) -> None:
+        if self._change_stream is not None:
+            try:
+                self._change_stream.close()
+            except Exception:
+                pass
+        if self._watch_task:
+            self._watch_task.cancel()
+            self._watch_task = None
+
+    async def _watch_loop(self) -> None:
+        try:
+            await asyncio.to_thread(self._consume_change_stream)
+        except errors.OperationFailure as e:
+            logging.info(f"Queue change stream unavailable ({e}), polling queues every {self.poll_interval}s")
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            logging.warning(f"Queue change stream stopped: {e}, falling back to polling")
+
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                self.refresh()
+            except Exception as e:
+                logging.error(f"Error refreshing queue registry: {e}")
+
+    def _consume_change_stream(self) -> None:
+        with self.db_manager.db['queues'].watch(full_document='updateLookup') as stream:
+            self._change_stream = stream
+            for change in stream:
+                self._loop.call_soon_threadsafe(self._handle_change, change)
+
+    def _handle_change(self, change: Dict[str, Any]) -> None:
+        operation = change.get('operationType')
+        if operation in ('insert', 'update', 'replace') and change.get('fullDocument'):
+            self._apply(change['fullDocument'])
+        else:
+            self.refresh()
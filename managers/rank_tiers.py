@@ -0,0 +1,93 @@
+import bisect
+import logging
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from managers.database_manager import DatabaseManager
+
+
+def extract_role_id(raw_id):
+    if isinstance(raw_id, int):
+        return raw_id
+    if isinstance(raw_id, str):
+        match = re.match(r'<@&(\d+)>', raw_id)
+        if match:
+            return int(match.group(1))
+        try:
+            return int(raw_id)
+        except Exception:
+            pass
+    raise ValueError(f"Invalid roleid: {raw_id}")
+
+
+class RankTiers:
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, db_manager: Optional[DatabaseManager] = None):
+        if cls._instance is None:
+            cls._instance = super(RankTiers, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        if self._initialized:
+            return
+        self.db_manager = db_manager or DatabaseManager()
+        self._tiers: List[Dict[str, Any]] = []
+        self._min_elos: List[int] = []
+        self._role_ids: List[Optional[int]] = []
+        self._loaded = False
+        self._initialized = True
+
+    def load(self) -> None:
+        with self._lock:
+            tiers = sorted(self.db_manager.find('elos', {}), key=lambda tier: tier.get('minelo', 0))
+            role_ids = []
+            for tier in tiers:
+                try:
+                    role_ids.append(extract_role_id(tier['roleid']))
+                except (KeyError, ValueError) as e:
+                    logging.warning(f"Skipping role for rank tier {tier.get('rankname')}: {e}")
+                    role_ids.append(None)
+            self._tiers = tiers
+            self._min_elos = [tier.get('minelo', 0) for tier in tiers]
+            self._role_ids = role_ids
+            self._loaded = True
+        logging.info(f"Rank tiers loaded {len(tiers)} tiers")
+
+    def invalidate(self) -> None:
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def _index_for(self, elo) -> Optional[int]:
+        self._ensure_loaded()
+        index = bisect.bisect_right(self._min_elos, elo) - 1
+        if index < 0 or elo > self._tiers[index].get('maxelo', 0):
+            return None
+        return index
+
+    def get_tier(self, elo) -> Optional[Dict[str, Any]]:
+        index = self._index_for(elo)
+        return self._tiers[index] if index is not None else None
+
+    def get_role_id(self, elo) -> Optional[int]:
+        index = self._index_for(elo)
+        return self._role_ids[index] if index is not None else None
+
+    def next_tier(self, elo) -> Optional[Dict[str, Any]]:
+        self._ensure_loaded()
+        index = bisect.bisect_right(self._min_elos, elo)
+        return self._tiers[index] if index < len(self._tiers) else None
+
+    def role_ids(self) -> List[int]:
+        self._ensure_loaded()
+        return [role_id for role_id in self._role_ids if role_id is not None]
+
+    def all(self) -> List[Dict[str, Any]]:
+        self._ensure_loaded()
+        return list(self._tiers)
@@ -5,8 +5,7 @@ from datetime import datetime, timedelta
 from bson import Timestamp
 import random
 import logging
-import os
-import yaml
+from managers.config_manager import ConfigManager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,7 +22,7 @@ class ScreenshareManager:
         self._lock = asyncio.Lock()
         
         
-        self.config = self.load_config()
+        self.config_manager = ConfigManager()
         self.websocket_enabled = self.config.get('websocket', {}).get('enabled', False)
         self.ws_manager = getattr(bot, 'websocket_manager', None) if self.websocket_enabled else None
         
@@ -32,14 +31,9 @@ class ScreenshareManager:
         
         logger.info(f'ScreenshareManager initialized (WebSocket enabled: {self.websocket_enabled})')
         
-    def load_config(self) -> Dict[str, Any]:
-        config_path = os.path.join('configs', 'config.yml')
-        try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
-        except Exception as e:
-            logger.error(f"Failed to load configuration: {e}")
-            return {}
+    @property
+    def config(self):
+        return self.config_manager.data
 
     def _load_active_screenshares(self) -> None:
         try:
@@ -0,0 +1,66 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Set
+
+from managers.mute_manager import MuteManager
+from managers.party_manager import PartyManager
+from managers.permission_manager import PermissionManager
+from utils.embed_builder import EmbedBuilder
+from utils.error_handler import ErrorHandler
+
+
+class ServiceContainer:
+    def __init__(self, bot):
+        self.bot = bot
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._reloadable: Set[str] = set()
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+        self.register('embed_builder', EmbedBuilder)
+        self.register('permission_manager', PermissionManager)
+        self.register('error_handler', lambda: ErrorHandler(self.bot))
+        self.register(
+            'party_manager',
+            lambda: PartyManager(config_file='configs/config.yml', db_manager=self.bot.database_manager),
+            reloadable=False
+        )
+        self.register('mute_manager', lambda: MuteManager(self.bot), reloadable=False)
+
+    def register(self, name: str, factory: Callable[[], Any], reloadable: bool = True) -> None:
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+            if reloadable:
+                self._reloadable.add(name)
+            else:
+                self._reloadable.discard(name)
+
+    def get(self, name: str) -> Any:
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                factory = self._factories.get(name)
+                if factory is None:
+                    raise KeyError(f"No service registered as {name}")
+                instance = self._instances[name] = factory()
+            return instance
+
+    def set(self, name: str, instance: Any) -> None:
+        with self._lock:
+            self._instances[name] = instance
+
+    def reset(self, name: Optional[str] = None) -> None:
+        with self._lock:
+            names = [name] if name else list(self._reloadable)
+            for service in names:
+                self._instances.pop(service, None)
+        logging.info(f"Reset services: {', '.join(sorted(names))}")
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_') or name not in self._factories:
+            raise AttributeError(f"No service registered as {name}")
+        return self.get(name)
@@ -0,0 +1,108 @@
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from managers.database_manager import DatabaseManager
+
+
+class CachedSetting(NamedTuple):
+    value: Any
+    version: int
+    loaded_at: float = 0.0
+
+
+class SettingsCache:
+    SEASON_INFO_PATH = os.path.join('configs', 'seasoninfo.yml')
+    TTLS = {
+        'booster': 60.0,
+        'queuestats': 60.0
+    }
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        self._loaders: Dict[str, Callable[[], Any]] = {
+            'booster': self._load_booster,
+            'queuestats': self._load_queue_stats,
+            'seasoninfo': self._load_season_info
+        }
+        self._settings: Dict[str, CachedSetting] = {}
+
+    def load(self) -> None:
+        for key in self._loaders:
+            self.refresh(key)
+        logging.info(f"Settings cache loaded {', '.join(self._settings)}")
+
+    def refresh(self, key: str) -> CachedSetting:
+        value = self._loaders[key]()
+        previous = self._settings.get(key)
+        if previous is None:
+            version = 1
+        else:
+            version = previous.version if previous.value == value else previous.version + 1
+        setting = CachedSetting(value, version, time.monotonic())
+        self._settings[key] = setting
+        return setting
+
+    def get(self, key: str) -> CachedSetting:
+        setting = self._settings.get(key)
+        ttl = self.TTLS.get(key)
+        if setting is None or (ttl is not None and time.monotonic() - setting.loaded_at > ttl):
+            setting = self.refresh(key)
+        return setting
+
+    def version(self, key: str) -> int:
+        return self.get(key).version
+
+    def _load_booster(self) -> float:
+        booster_doc = self.db_manager.find_one('booster', {})
+        if not booster_doc:
+            return 1.0
+        try:
+            return float(booster_doc.get('multiplier', '1'))
+        except (ValueError, TypeError) as e:
+            logging.error(f"Invalid booster multiplier {booster_doc.get('multiplier')}: {e}")
+            return 1.0
+
+    def _load_queue_stats(self) -> Dict[str, bool]:
+        return {
+            doc['queuetype']: doc.get('stats', True)
+            for doc in self.db_manager.find('queuestats', {})
+            if 'queuetype' in doc
+        }
+
+    def _load_season_info(self) -> Optional[Tuple[str, str]]:
+        if not os.path.exists(self.SEASON_INFO_PATH):
+            return None
+        with open(self.SEASON_INFO_PATH, 'r', encoding='utf-8') as file:
+            content = file.read()
+
+        content = content.replace(':rbw_yes:', '✅')
+        content = content.replace(':rbw_maybe:', '⚠️')
+        content = content.replace(':rbw_no:', '❌')
+
+        lines = content.strip().split('\n')
+        return lines[0], '\n'.join(lines[1:])
+
+    def booster_multiplier(self) -> float:
+        return self.get('booster').value
+
+    def set_booster(self, multiplier: str) -> bool:
+        existing_booster = self.db_manager.find_one('booster', {})
+        if existing_booster:
+            success = self.db_manager.update_one(
+                'booster',
+                {'_id': existing_booster['_id']},
+                {'$set': {'multiplier': multiplier}}
+            )
+        else:
+            self.db_manager.insert('booster', {'multiplier': multiplier})
+            success = True
+        self.refresh('booster')
+        return success
+
+    def queue_stats_enabled(self, queuetype: str) -> bool:
+        return self.get('queuestats').value.get(queuetype, True)
+
+    def season_info(self) -> Optional[Tuple[str, str]]:
+        return self.get('seasoninfo').value
@@ -4,16 +4,17 @@ import discord
 from datetime import datetime
 from managers.database_manager import DatabaseManager
 from managers.ban_manager import BanManager
-import asyncio
 from bson.timestamp import Timestamp
 
+STRIKE_EXPIRY_SECONDS = 30 * 24 * 60 * 60
+
 class StrikesManager:
     def __init__(self, bot, config_path: str = 'configs/config.yml'):
         self.bot = bot
         self.db_manager = DatabaseManager()
         self.ban_manager = BanManager(bot)
         self.strikes_config = self.load_strikes_config(config_path)
-        self.auto_remove_task = None
+        self.auto_remove_enabled = False
         self.embed_builder = bot.embed_builder
         self.punishment_channel_id = int(bot.config['channels']['punishments'])
 
@@ -79,6 +80,7 @@ class StrikesManager:
                 'date': Timestamp(int(datetime.now().timestamp()), 1)
             }
             self.db_manager.insert('strikes', strike_data)
+            self.bot.expiry_manager.schedule('strike', str(discord_id), update_data['latest_strike_date'].time + STRIKE_EXPIRY_SECONDS)
 
             
             if action and action != 'warn':
@@ -103,58 +105,58 @@ class StrikesManager:
             return False
 
     async def start_auto_remove_strikes(self):
-        if self.auto_remove_task is None:
-            self.auto_remove_task = asyncio.create_task(self._auto_remove_strikes_loop())
+        if not self.auto_remove_enabled:
+            expiry_manager = self.bot.expiry_manager
+            expiry_manager.register('strike', self._expire_strikes)
+
+            users_with_strikes = self.db_manager.find('users', {'strikes_count': {'$gt': 0}})
+            for user in users_with_strikes:
+                if 'latest_strike_date' in user:
+                    expiry_manager.schedule('strike', str(user['discordid']), user['latest_strike_date'].time + STRIKE_EXPIRY_SECONDS)
+
+            await expiry_manager.start()
+            self.auto_remove_enabled = True
 
     async def start_strikes_checker(self):
         await self.start_auto_remove_strikes()
 
     async def stop_auto_remove_strikes(self):
-        if self.auto_remove_task:
-            self.auto_remove_task.cancel()
-            self.auto_remove_task = None
-
-    async def _auto_remove_strikes_loop(self):
-        while True:
-            try:
-                current_time = Timestamp(int(datetime.now().timestamp()), 1)
-                thirty_days_ago = Timestamp(int(datetime.now().timestamp() - (30 * 24 * 60 * 60)), 1)
-
-                
-                users_to_update = self.db_manager.find('users', {
-                    'strikes_count': {'$gt': 0},
-                    'latest_strike_date': {'$lt': thirty_days_ago}
-                })
-
-                for user in users_to_update:
-                    
-                    update_data = {
-                        'strikes_count': 0,
-                        'latest_strike_date': Timestamp(0, 1),
-                        'latest_strike_reason': '',
-                        'latest_strike_staff': ''
-                    }
-                    self.db_manager.update_one('users', {'discordid': user['discordid']}, {'$set': update_data})
-                    print(f"Removed strikes for user {user['discordid']}")
-
-                    
-                    self.db_manager.update_one(
-                        'strikes',
-                        {'discordid': str(user['discordid']), 'reason': user['latest_strike_reason']},
-                        {
-                            '$set': {
-                                'removed': True,
-                                'removed_reason': 'Strike expired after 30 days',
-                                'removed_by': 'System',
-                                'removed_date': Timestamp(int(datetime.now().timestamp()), 1)
-                            }
-                        }
-                    )
-
-                await asyncio.sleep(1)
-            except Exception as e:
-                print(f"Error in auto remove strikes loop: {e}")
-                await asyncio.sleep(1)
+        if self.auto_remove_enabled:
+            self.bot.expiry_manager.unregister('strike')
+            self.auto_remove_enabled = False
+
+    async def _expire_strikes(self, discord_id: str):
+        user = self.db_manager.find_one('users', {'discordid': str(discord_id)})
+        if not user or user.get('strikes_count', 0) <= 0 or 'latest_strike_date' not in user:
+            return
+
+        expires_at = user['latest_strike_date'].time + STRIKE_EXPIRY_SECONDS
+        if expires_at > int(datetime.now().timestamp()):
+            self.bot.expiry_manager.schedule('strike', str(discord_id), expires_at)
+            return
+
+        update_data = {
+            'strikes_count': 0,
+            'latest_strike_date': Timestamp(0, 1),
+            'latest_strike_reason': '',
+            'latest_strike_staff': ''
+        }
+        self.db_manager.update_one('users', {'discordid': user['discordid']}, {'$set': update_data})
+        print(f"Removed strikes for user {user['discordid']}")
+
+        
+        self.db_manager.update_one(
+            'strikes',
+            {'discordid': str(user['discordid']), 'reason': user['latest_strike_reason']},
+            {
+                '$set': {
+                    'removed': True,
+                    'removed_reason': 'Strike expired after 30 days',
+                    'removed_by': 'System',
+                    'removed_date': Timestamp(int(datetime.now().timestamp()), 1)
+                }
+            }
+        )
 
     def close(self):
         self.db_manager.close()
@@ -95,7 +95,7 @@ class QueueHandler:
             queues_data = {}
             
             
-            queue_configs = self.db_manager.find('queues', {})
+            queue_configs = self.bot.queue_registry.all()
             
             for queue_config in queue_configs:
                 channel_id = queue_config['channelid']
@@ -183,7 +183,7 @@ class QueueHandler:
             self.logger.info(f"Processing queue request from {ign} for queue type {queue_type}")
             
             
-            user_data = self.db_manager.find_one('users', {'ign': ign})
+            user_data = self.bot.ign_resolver.find_user(ign)
             if not user_data:
                 await self._send_queue_error(websocket, f"Player {ign} not found in database")
                 return
@@ -226,21 +226,13 @@ class QueueHandler:
             player_elo = user_data.get('elo', 1000)
             
             
-            queue_configs = self.db_manager.find('queues', {})
+            queue_configs = self.bot.queue_registry.get_by_type(queue_type)
             
             suitable_queues = []
             
             for queue_config in queue_configs:
                 
                 is_casual = queue_config.get('iscasual', False)
-                queue_matches_type = (
-                    (queue_type.lower() == 'casual' and is_casual) or
-                    (queue_type.lower() == 'ranked' and not is_casual) or
-                    queue_type.lower() == 'any'
-                )
-                
-                if not queue_matches_type:
-                    continue
                 
                 
                 min_elo = queue_config.get('minelo', 0)
@@ -290,7 +282,7 @@ class QueueHandler:
                         }
             
             
-            queue_config = self.db_manager.find_one('queues', {'channelid': channel_id})
+            queue_config = self.bot.queue_registry.get(channel_id)
             if not queue_config:
                 return {
                     'valid': False,
@@ -4,7 +4,6 @@ import logging
 from typing import Dict, Any, Optional, List
 from ..models.messages import MessageType
 from ..utils.error_handler import WebSocketErrorHandler
-from managers.database_manager import DatabaseManager
 
 
 class ScoringHandler:
@@ -151,23 +150,16 @@ class ScoringHandler:
             if not igns:
                 return []
             
-            db_manager = DatabaseManager()
             discord_ids = []
-            
-            try:
-                for ign in igns:
-                    
-                    user = db_manager.find_one('users', {'ign': ign})
-                    if user and 'discordid' in user:
-                        discord_ids.append(user['discordid'])
-                    else:
-                        self.logger.warning(f"Could not find Discord ID for IGN: {ign}")
-                
-                self.logger.debug(f"Converted {len(igns)} IGNs to {len(discord_ids)} Discord IDs")
-                return discord_ids
-                
-            finally:
-                db_manager.close()
+            for ign in igns:
+                discord_id = self.bot.ign_resolver.get_discord_id(ign)
+                if discord_id:
+                    discord_ids.append(discord_id)
+                else:
+                    self.logger.warning(f"Could not find Discord ID for IGN: {ign}")
+            
+            self.logger.debug(f"Converted {len(igns)} IGNs to {len(discord_ids)} Discord IDs")
+            return discord_ids
                 
         except Exception as e:
             self.logger.error(f"Error converting IGNs to Discord IDs: {e}")
@@ -122,10 +122,8 @@ class ScreenshareHandler:
     
     async def _get_discord_id_from_ign(self, ign: str) -> Optional[str]:
         try:
-            user_data = self.bot.database_manager.find_one('users', {'ign': ign})
-            if user_data and 'discordid' in user_data:
-                return str(user_data['discordid'])
-            return None
+            discord_id = self.bot.ign_resolver.get_discord_id(ign)
+            return str(discord_id) if discord_id else None
         except Exception as e:
             self.logger.error(f"Error looking up Discord ID for IGN {ign}: {e}")
             return None
@@ -148,7 +148,7 @@ class VoiceHandler:
         try:
             
             try:
-                requester_data = self.db_manager.find_one('users', {'ign': {'$regex': f'^{requester_ign}$', '$options': 'i'}})
+                requester_data = self.bot.ign_resolver.find_user(requester_ign)
             except Exception as db_error:
                 await self.ws_manager.error_handler.handle_database_error(
                     f"lookup requester {requester_ign}", 
@@ -168,7 +168,7 @@ class VoiceHandler:
             
             
             try:
-                target_data = self.db_manager.find_one('users', {'ign': {'$regex': f'^{target_ign}$', '$options': 'i'}})
+                target_data = self.bot.ign_resolver.find_user(target_ign)
             except Exception as db_error:
                 await self.ws_manager.error_handler.handle_database_error(
                     f"lookup target {target_ign}", 
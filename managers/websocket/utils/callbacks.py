@@ -5,6 +5,7 @@ import time
 from typing import Dict, Any, Optional, Callable, Awaitable
 from dataclasses import dataclass
 import logging
+from managers.metrics_manager import MetricsManager
 
 logger = logging.getLogger(__name__)
 
@@ -219,10 +220,12 @@ class RequestResponseHandler:
         
         try:
             
+            started = time.perf_counter()
             await send_func(request_id, message_with_id)
             
             
             result = await future
+            MetricsManager().ws_roundtrip.observe(time.perf_counter() - started, type=message_type)
             return result
             
         except Exception as e:
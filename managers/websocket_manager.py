@@ -8,6 +8,7 @@ from .websocket.utils.error_handler import WebSocketErrorHandler, MessageValidat
 from .websocket.utils.callbacks import CallbackManager, RequestResponseHandler
 from .websocket.handlers.player_handler import PlayerHandler
 from .api_manager import APIManager
+from .metrics_manager import MetricsManager
 
 
 class WebSocketManager:
@@ -26,6 +27,8 @@ class WebSocketManager:
         self.timeout = websocket_config.get('timeout', 60)
         self.max_retry_attempts = websocket_config.get('max_retry_attempts', 3)
         self.queue_broadcast_interval = websocket_config.get('queue_broadcast_interval', 1.0)
+        self.metrics_enabled = websocket_config.get('metrics_enabled', True)
+        self.metrics_path = websocket_config.get('metrics_path', '/metrics')
         
         
         self.clients: Set[web.WebSocketResponse] = set()
@@ -110,6 +113,17 @@ class WebSocketManager:
             
             self.app.router.add_get(self.path, websocket_handler)
             
+            if self.metrics_enabled:
+                async def metrics_handler(request):
+                    return web.Response(
+                        text=MetricsManager().render(),
+                        content_type='text/plain',
+                        charset='utf-8',
+                        headers={'X-Content-Type-Options': 'nosniff'}
+                    )
+                
+                self.app.router.add_get(self.metrics_path, metrics_handler)
+            
             await self.callback_manager.start()
             
             self._connection_health_task = asyncio.create_task(self._monitor_connection_health())
@@ -126,6 +140,8 @@ class WebSocketManager:
             self.logger.info(f"Combined server started successfully on {self.host}:{self.port}")
             self.logger.info(f"WebSocket: ws://{self.host}:{self.port}{self.path}")
             self.logger.info(f"API: http://{self.host}:{self.port}/rbw/api")
+            if self.metrics_enabled:
+                self.logger.info(f"Metrics: http://{self.host}:{self.port}{self.metrics_path}")
             
         except Exception as e:
             await self.error_handler.handle_connection_error(None, e)
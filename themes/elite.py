@@ -3,7 +3,7 @@ import requests
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
 from typing import Dict, Any, List, Tuple, Optional
-import yaml
+from managers.config_manager import ConfigManager
 import math
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
@@ -35,17 +35,9 @@ class EliteTheme:
         fonts_folder = os.path.join("asserts", "fonts")
         theme_image_path = os.path.join(themes_folder, "elite.png")
 
-        config_path = os.path.join("configs", "config.yml")
-        server_name = "ZeroCode"  
-        invite_link = "discord.gg/zerocode"  
-        
-        try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                server_name = config.get('server', {}).get('servername', server_name)
-                invite_link = config.get('server', {}).get('invitelink', invite_link)
-        except Exception as e:
-            print(f"Error loading config.yml: {e}")
+        server_config = ConfigManager().section('server')
+        server_name = server_config.get('servername', "ZeroCode")
+        invite_link = server_config.get('invitelink', "discord.gg/zerocode")
         image = Image.open(theme_image_path).convert("RGBA")
         draw = ImageDraw.Draw(image)
         
@@ -126,21 +118,15 @@ class EliteTheme:
         arrow_y = 315 + 10
 
         current_elo = player_data.get('elo', 0)
-        from managers.database_manager import DatabaseManager
-        db_manager = DatabaseManager()
+        from managers.rank_tiers import RankTiers
+        rank_tiers = RankTiers()
         
-        all_ranks = list(db_manager.db['elos'].find().sort([('minelo', 1)]))
-        
-        next_rank = None
-        for rank in all_ranks:
-            if rank['minelo'] > current_elo:
-                next_rank = rank
-                break
+        next_rank = rank_tiers.next_tier(current_elo)
         
         if next_rank:
             elo_needed = next_rank['minelo'] - current_elo
             win_elo = 0
-            current_rank = db_manager.find_one('elos', {'minelo': {'$lte': current_elo}, 'maxelo': {'$gte': current_elo}})
+            current_rank = rank_tiers.get_tier(current_elo)
             if current_rank:
                 win_elo = current_rank.get('winelo', 25)  
             
@@ -0,0 +1,357 @@
+import argparse
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import managers.queue_processor as queue_processor_module
+from managers.config_manager import ConfigManager, thaw
+from managers.party_registry import PartyRegistry
+from managers.queue_processor import QueueProcessor
+from managers.service_container import ServiceContainer
+from tools import memory_db
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self) -> float:
+        return self.now
+
+    @staticmethod
+    def perf_counter() -> float:
+        return time.perf_counter()
+
+
+class SimMember:
+    def __init__(self, member_id: int):
+        self.id = member_id
+        self.mention = f'<@{member_id}>'
+
+
+class SimVoiceChannel:
+    def __init__(self, channel_id: int):
+        self.id = channel_id
+        self.mention = f'<#{channel_id}>'
+        self.members: List[SimMember] = []
+
+    def join(self, member_ids: List[int]) -> None:
+        self.members.extend(SimMember(member_id) for member_id in member_ids)
+
+    def leave(self, member_ids: List[int]) -> None:
+        gone = set(member_ids)
+        self.members = [member for member in self.members if member.id not in gone]
+
+
+class SimQueueRegistry:
+    def __init__(self, queues: Dict[int, Dict[str, Any]]):
+        self._queues = queues
+
+    def get(self, channel_id) -> Optional[Dict[str, Any]]:
+        return self._queues.get(int(channel_id))
+
+    def all(self) -> List[Dict[str, Any]]:
+        return list(self._queues.values())
+
+    def subscribe(self, callback: Callable) -> None:
+        return
+
+
+class SimBot:
+    def __init__(self, config: dict, database_manager, queue_registry: SimQueueRegistry, channels: Dict[int, SimVoiceChannel]):
+        self.config = config
+        self.database_manager = database_manager
+        self.queue_registry = queue_registry
+        self.services = ServiceContainer(self)
+        self.embed_builder = self.services.embed_builder
+        self.logger = logging.getLogger('matchmaking_sim')
+        self.worker_manager = None
+        self.websocket_manager = None
+        self._channels = channels
+
+    def is_ready(self) -> bool:
+        return True
+
+    async def wait_until_ready(self) -> None:
+        return
+
+    def get_channel(self, channel_id):
+        return self._channels.get(int(channel_id))
+
+    def get_guild(self, guild_id):
+        return None
+
+
+class SimQueueProcessor(QueueProcessor):
+    def __init__(self, bot: SimBot, on_match: Callable[[int, List[int], List[int], List[int]], None]):
+        self.on_match = on_match
+        super().__init__(bot)
+
+    def _init_continuous_processing(self):
+        return
+
+    async def start_continuous_processing(self, channel_id: str):
+        return
+
+    async def _start_game_batch(self, channel_id: str, batch: List[int], queue_settings: dict):
+        try:
+            parties = []
+            processed_players = set()
+            for player_id in batch:
+                if player_id not in processed_players:
+                    party = self.party_manager.get_party_by_member(str(player_id))
+                    if party:
+                        party_members = set(int(member_id) for member_id in party['members']) & set(batch)
+                        if party_members:
+                            parties.append(party_members)
+                            processed_players.update(party_members)
+
+            teams = self.create_fair_teams(batch, parties)
+            if teams:
+                self.on_match(channel_id, batch, teams[0], teams[1])
+        finally:
+            for player_id in batch:
+                self.players_in_game_creation.discard(player_id)
+            self.release_player_locks(batch)
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class MatchmakingSimulation:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.clock = VirtualClock()
+        self.events: List[tuple] = []
+        self.sequence = itertools.count()
+        self.player_ids = itertools.count(10_000_000)
+        self.party_ids = itertools.count(1)
+
+        self.elo: Dict[int, int] = {}
+        self.joined_at: Dict[int, float] = {}
+        self.player_party: Dict[int, List[int]] = {}
+        self.waits: List[float] = []
+        self.elo_gaps: List[float] = []
+        self.games = 0
+        self.arrivals = 0
+        self.leaves = 0
+
+        self.queue_ids = [900_000_000 + index for index in range(args.queues)]
+        self.channels = {queue_id: SimVoiceChannel(queue_id) for queue_id in self.queue_ids}
+        self.queues = {
+            queue_id: {
+                'channelid': queue_id,
+                'maxplayers': args.max_players,
+                'minelo': 0,
+                'maxelo': 9999,
+                'iscasual': False
+            }
+            for queue_id in self.queue_ids
+        }
+
+    def _config(self) -> dict:
+        config = thaw(ConfigManager().data)
+        config['websocket'] = {'enabled': False}
+        config['queue_processor'] = dict(
+            config.get('queue_processor', {}),
+            continuous_check_interval=self.args.check_interval,
+            partial_batch_wait_time=self.args.partial_wait,
+            min_players_for_partial_game=self.args.min_partial
+        )
+        return config
+
+    def schedule(self, at: float, kind: str, *payload) -> None:
+        heapq.heappush(self.events, (at, next(self.sequence), kind, payload))
+
+    def _new_player(self) -> int:
+        player_id = next(self.player_ids)
+        self.elo[player_id] = max(0, int(self.random.gauss(self.args.elo_mean, self.args.elo_stddev)))
+        return player_id
+
+    def _on_match(self, channel_id, batch: List[int], team1: List[int], team2: List[int]) -> None:
+        self.games += 1
+        for player_id in batch:
+            joined_at = self.joined_at.pop(player_id, None)
+            if joined_at is not None:
+                self.waits.append(self.clock.now - joined_at)
+        self.channels[int(channel_id)].leave(batch)
+        if team1 and team2:
+            team1_elo = sum(self.elo[player_id] for player_id in team1) / len(team1)
+            team2_elo = sum(self.elo[player_id] for player_id in team2) / len(team2)
+            self.elo_gaps.append(abs(team1_elo - team2_elo))
+
+    async def _drain(self) -> None:
+        current = asyncio.current_task()
+        while True:
+            pending = [task for task in asyncio.all_tasks() if task is not current and not task.done()]
+            if not pending:
+                return
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _schedule_leave(self, player_id: int, queue_id: int) -> None:
+        if self.random.random() < self.args.leave_fraction:
+            self.schedule(self.clock.now + self.random.expovariate(1 / self.args.patience), 'leave', player_id, queue_id)
+
+    async def _arrive(self, queue_id: int, members: List[int]) -> None:
+        self.arrivals += len(members)
+        for member_id in members:
+            self.joined_at[member_id] = self.clock.now
+        self.channels[queue_id].join(members)
+        for member_id in members:
+            await self.processor.process_queue_join(member_id, queue_id)
+        await self._drain()
+        self._schedule_leave(members[0], queue_id)
+
+    async def _solo(self, queue_id: int) -> None:
+        await self._arrive(queue_id, [self._new_player()])
+        self.schedule(self.clock.now + self.random.expovariate(self.args.solo_rate / 60), 'solo', queue_id)
+
+    async def _party(self, queue_id: int) -> None:
+        size = self.random.randint(2, min(self.args.party_size_max, self.args.max_players // 2))
+        members = [self._new_player() for _ in range(size)]
+        party = {
+            'party_name': f'sim-party-{next(self.party_ids)}',
+            'leader': str(members[0]),
+            'members': [str(member_id) for member_id in members],
+            'elo': sum(self.elo[member_id] for member_id in members),
+            'is_private': True
+        }
+        self.database_manager.insert('parties', party)
+        self.registry.put(party)
+        for member_id in members:
+            self.player_party[member_id] = members
+        await self._arrive(queue_id, members)
+        self.schedule(self.clock.now + self.random.expovariate(self.args.party_rate / 60), 'party', queue_id)
+
+    async def _leave(self, player_id: int, queue_id: int) -> None:
+        if player_id not in self.processor.player_queue_map:
+            return
+        members = self.player_party.get(player_id, [player_id])
+        await self.processor.process_queue_leave(player_id, queue_id)
+        await self._drain()
+        for member_id in members:
+            if member_id not in self.processor.player_queue_map and self.joined_at.pop(member_id, None) is not None:
+                self.leaves += 1
+        self.channels[queue_id].leave(members)
+
+    async def _tick(self, queue_id: int) -> None:
+        await self.processor.process_queue(queue_id, allow_partial=True)
+        await self._drain()
+        self.schedule(self.clock.now + self.args.check_interval, 'tick', queue_id)
+
+    async def run(self) -> Dict[str, Any]:
+        self.database_manager = memory_db.install()
+        self.registry = PartyRegistry(self.database_manager)
+        bot = SimBot(self._config(), self.database_manager, SimQueueRegistry(self.queues), self.channels)
+        self.processor = SimQueueProcessor(bot, self._on_match)
+        for queue_id in self.queue_ids:
+            self.processor.queues[queue_id] = {
+                'players': set(),
+                'max_players': self.args.max_players,
+                'parties': [],
+                'was_full': False,
+                'last_processed': 0,
+                'last_partial_check': 0
+            }
+            if self.args.solo_rate > 0:
+                self.schedule(self.random.expovariate(self.args.solo_rate / 60), 'solo', queue_id)
+            if self.args.party_rate > 0:
+                self.schedule(self.random.expovariate(self.args.party_rate / 60), 'party', queue_id)
+            self.schedule(self.args.check_interval, 'tick', queue_id)
+
+        handlers = {'solo': self._solo, 'party': self._party, 'leave': self._leave, 'tick': self._tick}
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        while self.events and self.events[0][0] <= self.args.duration:
+            at, _, kind, payload = heapq.heappop(self.events)
+            self.clock.now = at
+            await handlers[kind](*payload)
+        wall = time.perf_counter() - wall_started
+        cpu = time.process_time() - cpu_started
+
+        return {
+            'simulated_seconds': self.args.duration,
+            'queues': self.args.queues,
+            'arrivals': self.arrivals,
+            'leaves': self.leaves,
+            'games': self.games,
+            'still_queued': len(self.processor.player_queue_map),
+            'games_per_simulated_hour': round(self.games * 3600 / self.args.duration, 2),
+            'games_per_second': round(self.games / wall, 2) if wall else 0.0,
+            'wait_p50_seconds': round(percentile(self.waits, 50), 2),
+            'wait_p99_seconds': round(percentile(self.waits, 99), 2),
+            'elo_gap_mean': round(sum(self.elo_gaps) / len(self.elo_gaps), 2) if self.elo_gaps else 0.0,
+            'elo_gap_p99': round(percentile(self.elo_gaps, 99), 2),
+            'cpu_ms_per_game': round(cpu * 1000 / self.games, 3) if self.games else 0.0,
+            'wall_seconds': round(wall, 3)
+        }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Replay synthetic queue traffic through QueueProcessor offline.')
+    parser.add_argument('--duration', type=float, default=3600, help='Simulated seconds to run')
+    parser.add_argument('--queues', type=int, default=4, help='Number of queue channels')
+    parser.add_argument('--max-players', type=int, default=8, help='Players per game')
+    parser.add_argument('--solo-rate', type=float, default=6.0, help='Solo joins per queue per minute (Poisson)')
+    parser.add_argument('--party-rate', type=float, default=1.0, help='Party joins per queue per minute (Poisson)')
+    parser.add_argument('--party-size-max', type=int, default=4, help='Largest party size generated')
+    parser.add_argument('--leave-fraction', type=float, default=0.1, help='Fraction of arrivals that leave before matching')
+    parser.add_argument('--patience', type=float, default=120.0, help='Mean seconds before a leaving arrival leaves')
+    parser.add_argument('--elo-mean', type=float, default=1000.0)
+    parser.add_argument('--elo-stddev', type=float, default=300.0)
+    parser.add_argument('--check-interval', type=float, default=5.0, help='queue_processor.continuous_check_interval')
+    parser.add_argument('--partial-wait', type=float, default=60.0, help='queue_processor.partial_batch_wait_time')
+    parser.add_argument('--min-partial', type=int, default=4, help='queue_processor.min_players_for_partial_game')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    parser.add_argument('--max-wait-p99', type=float, help='Exit non-zero if p99 wait exceeds this many seconds')
+    parser.add_argument('--max-elo-gap', type=float, help='Exit non-zero if the mean team elo gap exceeds this')
+    parser.add_argument('--verbose', action='store_true')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    random.seed(args.seed)
+
+    clock = VirtualClock()
+    original_time = queue_processor_module.time
+    queue_processor_module.time = clock
+    try:
+        simulation = MatchmakingSimulation(args)
+        simulation.clock = clock
+        report = asyncio.run(simulation.run())
+    finally:
+        queue_processor_module.time = original_time
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key, value in report.items():
+            print(f"{key:>26}: {value}")
+
+    failures = []
+    if args.max_wait_p99 is not None and report['wait_p99_seconds'] > args.max_wait_p99:
+        failures.append(f"p99 wait {report['wait_p99_seconds']}s > {args.max_wait_p99}s")
+    if args.max_elo_gap is not None and report['elo_gap_mean'] > args.max_elo_gap:
+        failures.append(f"mean elo gap {report['elo_gap_mean']} > {args.max_elo_gap}")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,408 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from bson import Timestamp, json_util
+
+from actions.scoring import scoring
+from actions.voiding import void
+from managers.config_manager import ConfigManager, thaw
+from managers.database_manager import DatabaseManager
+from managers.job_queue import JobQueue
+from managers.metrics_manager import MetricsManager
+from managers.query_profiler import QueryProfiler
+from managers.rank_tiers import RankTiers
+from managers.service_container import ServiceContainer
+from managers.settings_cache import SettingsCache
+from tools import memory_db
+
+
+REPLAYED_STATES = ('scored', 'voided')
+INDEXES = (
+    ('games', 'gameid'),
+    ('gameschannels', 'gameid'),
+    ('recentgames', 'gameid'),
+    ('users', 'discordid'),
+    ('settings', 'discordid')
+)
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def load_collection(path: str) -> List[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8') as file:
+        content = file.read().strip()
+    if not content:
+        return []
+    if content.startswith('['):
+        return json_util.loads(content)
+    return [json_util.loads(line) for line in content.splitlines() if line.strip()]
+
+
+def load_dump(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    dump = {}
+    for filename in sorted(os.listdir(path)):
+        name, extension = os.path.splitext(filename)
+        if extension in ('.json', '.jsonl'):
+            dump[name] = load_collection(os.path.join(path, filename))
+    return dump
+
+
+def _seconds(value: Any) -> Optional[float]:
+    if isinstance(value, Timestamp):
+        return float(value.time)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def _order_key(game: Dict[str, Any]) -> Tuple[float, Any]:
+    started = _seconds(game.get('date') or game.get('start_time')) or 0.0
+    gameid = str(game.get('gameid', ''))
+    return started, (0, int(gameid)) if gameid.isdigit() else (1, gameid)
+
+
+def replay_events(games: List[Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+    events = []
+    for game in games:
+        started, tiebreak = _order_key(game)
+        events.append(((started, 1, tiebreak), 'score', game))
+        if game.get('state') == 'voided':
+            voided_at = max(started, _seconds(game.get('end_time')) or started)
+            events.append(((voided_at, 0, tiebreak), 'void', game))
+    events.sort(key=lambda event: event[0])
+    return [(kind, game) for _, kind, game in events]
+
+
+def winning_team_number(game: Dict[str, Any], recent: List[Dict[str, Any]]) -> Optional[int]:
+    winners = game.get('winningteam')
+    if winners:
+        if list(winners) == list(game.get('team1', [])):
+            return 1
+        if list(winners) == list(game.get('team2', [])):
+            return 2
+    team1 = {str(player_id) for player_id in game.get('team1', [])}
+    for entry in recent:
+        if entry.get('result') == 'win':
+            return 1 if str(entry.get('discordid')) in team1 else 2
+    return None
+
+
+def player_stats(recent: List[Dict[str, Any]], igns: Dict[str, str]) -> Optional[Dict[str, Dict[str, Any]]]:
+    stats = {}
+    for entry in recent:
+        ign = igns.get(str(entry.get('discordid')))
+        if ign and 'kills' in entry and entry.get('result') != 'voided':
+            stats[ign] = {
+                'kills': int(entry.get('kills') or 0),
+                'deaths': int(entry.get('deaths') or 0),
+                'bedbroke': bool(entry.get('bedbroke', False)),
+                'finalkills': int(entry.get('finalkills') or 0),
+                'diamonds': int(entry.get('diamonds') or 0),
+                'irons': int(entry.get('irons') or 0),
+                'gold': int(entry.get('gold') or 0),
+                'emeralds': int(entry.get('emeralds') or 0),
+                'blocksplaced': int(entry.get('blocksplaced') or 0)
+            }
+    return stats or None
+
+
+class LocalMongoDatabaseManager(DatabaseManager):
+    def __init__(self, uri: Optional[str] = None, db_name: Optional[str] = None):
+        if getattr(self, 'db', None) is not None:
+            return
+        from pymongo import MongoClient
+        self.config = {}
+        self.profiler = QueryProfiler()
+        self.client = MongoClient(uri, event_listeners=[MetricsManager().mongo_listener, self.profiler])
+        self.client.admin.command('ping')
+        self.db_name = db_name
+        self.db = self.client[db_name]
+        self._is_connected = True
+
+    def ensure_connection(self):
+        return
+
+    def close(self) -> None:
+        return
+
+    def shutdown(self) -> None:
+        self.client.close()
+
+
+def install_local_mongo(uri: str, db_name: str) -> LocalMongoDatabaseManager:
+    manager = object.__new__(LocalMongoDatabaseManager)
+    manager.__init__(uri, db_name)
+    DatabaseManager._instance = manager
+    DatabaseManager._initialized = True
+    return manager
+
+
+class ReplayBot:
+    def __init__(self, config: dict, database_manager):
+        self.config = config
+        self.database_manager = database_manager
+        self.logger = logging.getLogger('scoring_replay')
+        self.settings_cache = SettingsCache(database_manager)
+        self.job_queue = JobQueue(self, database_manager)
+        self.services = ServiceContainer(self)
+        self.worker_manager = None
+        self.websocket_manager = None
+
+    def get_channel(self, channel_id):
+        return None
+
+    def get_guild(self, guild_id):
+        return None
+
+
+class ScoringReplay:
+    def __init__(self, args: argparse.Namespace, dump: Dict[str, List[Dict[str, Any]]]):
+        self.args = args
+        self.dump = dump
+        self.games: List[Dict[str, Any]] = []
+        self.recent_by_game: Dict[str, List[Dict[str, Any]]] = {}
+        self.expected: Dict[Tuple[Any, str], Dict[str, Any]] = {}
+        self.recorded_elo: Dict[str, int] = {}
+        self.mismatches: List[Dict[str, Any]] = []
+        self.unverifiable: Set[Tuple[Any, str]] = set()
+        self.tainted: Set[str] = set()
+        self.awaiting_void: Dict[str, Set[str]] = {}
+        self.replayed_voids: Set[str] = set()
+        self.durations: List[float] = []
+        self.skipped = 0
+
+    def _select_games(self) -> None:
+        for entry in self.dump.get('recentgames', []):
+            self.recent_by_game.setdefault(str(entry.get('gameid')), []).append(entry)
+        games = sorted(
+            (game for game in self.dump.get('games', []) if game.get('state') in REPLAYED_STATES),
+            key=_order_key
+        )
+        if self.args.limit:
+            games = games[:self.args.limit]
+        for game in games:
+            recent = self.recent_by_game.get(str(game['gameid']), [])
+            if not recent or winning_team_number(game, recent) is None:
+                self.skipped += 1
+                continue
+            self.games.append(game)
+            for entry in recent:
+                self.expected[(game['gameid'], str(entry.get('discordid')))] = {
+                    'elochange': entry.get('elochange', 0),
+                    'result': entry.get('result'),
+                    'ismvp': bool(entry.get('ismvp', False))
+                }
+
+    def _seed(self, db) -> None:
+        for name, documents in self.dump.items():
+            db[name].drop()
+            if documents:
+                db[name].insert_many(documents)
+        db['jobs'].drop()
+        for name, field in INDEXES:
+            db[name].create_index(field)
+
+        channels = {str(doc.get('gameid')) for doc in self.dump.get('gameschannels', [])}
+        rewind: Dict[str, int] = {}
+        for (gameid, discordid), expected in self.expected.items():
+            rewind[discordid] = rewind.get(discordid, 0) + int(expected['elochange'] or 0)
+        for user in self.dump.get('users', []):
+            discordid = str(user.get('discordid'))
+            self.recorded_elo[discordid] = user.get('elo', 0)
+            if discordid in rewind:
+                db['users'].update_one(
+                    {'discordid': discordid},
+                    {'$set': {'elo': user.get('elo', 0) - rewind[discordid]}}
+                )
+
+        for game in self.games:
+            gameid = game['gameid']
+            db['games'].update_one(
+                {'gameid': gameid},
+                {'$set': {'state': 'pending'}, '$unset': {'winningteam': '', 'loosingteam': '', 'mvps': '', 'bedbreakers': ''}}
+            )
+            db['recentgames'].update_many(
+                {'gameid': gameid},
+                {'$set': {'result': 'pending', 'state': 'pending', 'ismvp': False, 'elochange': 0}}
+            )
+            if str(gameid) not in channels:
+                db['gameschannels'].insert_one({'gameid': gameid, 'textchannelid': '0'})
+
+    async def _replay_game(self, bot: ReplayBot, game: Dict[str, Any], igns: Dict[str, str]) -> None:
+        gameid = game['gameid']
+        recent = self.recent_by_game[str(gameid)]
+        winner = winning_team_number(game, recent)
+        mvp_ids = list(game.get('mvps') or []) or list(game.get('voided_mvps') or []) or [
+            str(entry.get('discordid')) for entry in recent if entry.get('ismvp')
+        ]
+        bedbreaker_ids = list(game.get('bedbreakers', [])) or [
+            str(entry.get('discordid')) for entry in recent if entry.get('bedbroke')
+        ]
+        started = time.perf_counter()
+        await scoring(
+            bot=bot,
+            gameid=gameid,
+            winningteamnumber=winner,
+            mvp_ids=mvp_ids,
+            bedbreaker_ids=bedbreaker_ids,
+            player_stats=player_stats(recent, igns),
+            iscasual=game.get('gametype') == 'casual'
+        )
+        self.durations.append(time.perf_counter() - started)
+
+    def _track_unknown_mvps(self, kind: str, game: Dict[str, Any]) -> None:
+        gameid = str(game['gameid'])
+        if kind == 'void':
+            self.awaiting_void.pop(gameid, None)
+            self.replayed_voids.add(gameid)
+            return
+        players = {str(entry.get('discordid')) for entry in self.recent_by_game[gameid]}
+        waiting = set().union(*self.awaiting_void.values()) if self.awaiting_void else set()
+        for discordid in players & (waiting | self.tainted):
+            self.tainted.add(discordid)
+            self.unverifiable.add((game['gameid'], discordid))
+        if game.get('state') == 'voided' and 'voided_mvps' not in game and gameid not in self.replayed_voids:
+            self.awaiting_void[gameid] = players
+
+    def _verify(self, db) -> None:
+        for (gameid, discordid), expected in self.expected.items():
+            if (gameid, discordid) in self.unverifiable:
+                continue
+            entry = db['recentgames'].find_one({'gameid': gameid, 'discordid': discordid}) or {}
+            actual = {
+                'elochange': entry.get('elochange', 0),
+                'result': entry.get('result'),
+                'ismvp': bool(entry.get('ismvp', False))
+            }
+            if actual != expected:
+                self.mismatches.append({'gameid': gameid, 'discordid': discordid, 'expected': expected, 'actual': actual})
+
+    async def run(self, manager) -> Dict[str, Any]:
+        self._select_games()
+        db = manager.db
+        self._seed(db)
+        if self.args.booster is not None:
+            db['booster'].drop()
+            db['booster'].insert_one({'multiplier': str(self.args.booster)})
+
+        RankTiers(manager).load()
+        bot = ReplayBot(thaw(ConfigManager().data), manager)
+        bot.settings_cache.load()
+        igns = {str(user.get('discordid')): user.get('ign') for user in self.dump.get('users', []) if user.get('ign')}
+
+        output = None if self.args.verbose else io.StringIO()
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        with contextlib.redirect_stdout(output) if output else contextlib.nullcontext():
+            for kind, game in replay_events(self.games):
+                self._track_unknown_mvps(kind, game)
+                if kind == 'void':
+                    await void(bot=bot, gameid=game['gameid'], staffid=None)
+                else:
+                    await self._replay_game(bot, game, igns)
+        wall = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+
+        self._verify(db)
+        elo_drift = sum(
+            1 for user in db['users'].find({})
+            if str(user.get('discordid')) in self.recorded_elo
+            and str(user.get('discordid')) not in self.tainted
+            and user.get('elo', 0) != self.recorded_elo[str(user.get('discordid'))]
+        )
+        return {
+            'games_replayed': len(self.games),
+            'games_skipped': self.skipped,
+            'players_checked': len(self.expected),
+            'unverifiable': len(self.unverifiable),
+            'mismatches': len(self.mismatches),
+            'final_elo_drift': elo_drift,
+            'games_per_second': round(len(self.games) / wall, 2) if wall else 0.0,
+            'scoring_p50_ms': round(percentile(self.durations, 50) * 1000, 3),
+            'scoring_p99_ms': round(percentile(self.durations, 99) * 1000, 3),
+            'cpu_ms_per_game': round(cpu * 1000 / len(self.games), 3) if self.games else 0.0,
+            'jobs_enqueued': db['jobs'].count_documents({}),
+            'wall_seconds': round(wall, 3),
+            'first_mismatches': self.mismatches[:self.args.show_mismatches]
+        }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Re-score dumped games through the production scoring code.')
+    parser.add_argument('dump', help='Directory of <collection>.json exports (games, recentgames, users, elos, ...)')
+    parser.add_argument('--mongo-uri', help='Replay against a local MongoDB instead of the in-memory database')
+    parser.add_argument('--mongo-db', default='rbw_replay', help='Scratch database used with --mongo-uri (dropped per collection)')
+    parser.add_argument('--limit', type=int, help='Replay only the first N games')
+    parser.add_argument('--booster', type=float, help='Booster multiplier to apply instead of the dumped booster document')
+    parser.add_argument('--show-mismatches', type=int, default=10, help='Mismatches to include in the report')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    parser.add_argument('--max-mismatches', type=int, help='Exit non-zero if more player results than this differ')
+    parser.add_argument('--min-games-per-second', type=float, help='Exit non-zero if throughput falls below this')
+    parser.add_argument('--verbose', action='store_true', help='Show output from the scoring code')
+    args = parser.parse_args(argv)
+    if not os.path.isdir(args.dump):
+        parser.error(f'{args.dump} is not a directory')
+    if args.mongo_uri and args.mongo_db == ConfigManager().get('database', 'db_name'):
+        parser.error('--mongo-db must not be the configured production database')
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    dump = load_dump(args.dump)
+    missing = [name for name in ('games', 'recentgames', 'users', 'elos') if name not in dump]
+    if missing:
+        print(f"FAIL: dump is missing {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    if args.mongo_uri:
+        manager = install_local_mongo(args.mongo_uri, args.mongo_db)
+    else:
+        manager = memory_db.install(thaw(ConfigManager().data))
+    try:
+        report = asyncio.run(ScoringReplay(args, dump).run(manager))
+    finally:
+        if args.mongo_uri:
+            manager.shutdown()
+
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        for key, value in report.items():
+            if key != 'first_mismatches':
+                print(f"{key:>20}: {value}")
+        for mismatch in report['first_mismatches']:
+            print(f"  game {mismatch['gameid']} player {mismatch['discordid']}: "
+                  f"expected {mismatch['expected']} got {mismatch['actual']}")
+
+    failures = []
+    if args.max_mismatches is not None and report['mismatches'] > args.max_mismatches:
+        failures.append(f"{report['mismatches']} mismatches > {args.max_mismatches}")
+    if args.min_games_per_second is not None and report['games_per_second'] < args.min_games_per_second:
+        failures.append(f"{report['games_per_second']} games/s < {args.min_games_per_second}")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,386 @@
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from managers.config_manager import ConfigManager
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def read_rss_mb(pid: int) -> Optional[float]:
+    try:
+        with open(f'/proc/{pid}/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+class LoadStats:
+    def __init__(self):
+        self.sent = Counter()
+        self.received = Counter()
+        self.latencies: Dict[str, List[float]] = {}
+        self.server_requests = Counter()
+        self.server_replies = Counter()
+        self.send_errors = 0
+        self.disconnects = 0
+        self.late = 0
+        self.dropped = Counter()
+        self.memory: List[Tuple[float, float]] = []
+
+    def observe(self, kind: str, latency: float) -> None:
+        self.latencies.setdefault(kind, []).append(latency)
+
+
+class PluginClient:
+    def __init__(self, index: int, simulation: 'LoadTest', responder: bool):
+        self.index = index
+        self.simulation = simulation
+        self.responder = responder
+        self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self.pending: Dict[str, Tuple[str, float]] = {}
+        self._reader: Optional[asyncio.Task] = None
+        self._replies: set = set()
+
+    @property
+    def connected(self) -> bool:
+        return self.ws is not None and not self.ws.closed
+
+    async def connect(self, session: aiohttp.ClientSession) -> None:
+        self.ws = await session.ws_connect(self.simulation.args.url, heartbeat=None, max_msg_size=0)
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def close(self) -> None:
+        if self.ws is not None:
+            await self.ws.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+        for task in list(self._replies):
+            task.cancel()
+
+    async def send(self, kind: str, message: Dict[str, Any]) -> None:
+        stats = self.simulation.stats
+        if not self.connected:
+            stats.send_errors += 1
+            return
+        barrier_id = f'lt-{self.index}-{next(self.simulation.ids)}'
+        self.pending[barrier_id] = (kind, time.perf_counter())
+        try:
+            if kind != 'ping':
+                await self.ws.send_str(json.dumps(message))
+            await self.ws.send_str(json.dumps({'type': 'ping', 'request_id': barrier_id}))
+        except Exception:
+            self.pending.pop(barrier_id, None)
+            stats.send_errors += 1
+            return
+        stats.sent[kind] += 1
+
+    async def _read_loop(self) -> None:
+        stats = self.simulation.stats
+        try:
+            async for msg in self.ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                try:
+                    message = json.loads(msg.data)
+                except json.JSONDecodeError:
+                    stats.received['invalid_json'] += 1
+                    continue
+                message_type = message.get('type', 'unknown')
+                stats.received[message_type] += 1
+                request_id = message.get('request_id')
+                if message_type == 'pong' and request_id in self.pending:
+                    kind, started = self.pending.pop(request_id)
+                    latency = time.perf_counter() - started
+                    if latency > self.simulation.args.reply_timeout:
+                        stats.late += 1
+                    stats.observe(kind, latency)
+                elif request_id and message_type in self.simulation.SERVER_REQUESTS:
+                    stats.server_requests[message_type] += 1
+                    if self.responder:
+                        task = asyncio.create_task(self._answer(message))
+                        self._replies.add(task)
+                        task.add_done_callback(self._replies.discard)
+        except Exception as e:
+            logging.debug(f"Client {self.index} read loop ended: {e}")
+        finally:
+            if not self.simulation.stopping:
+                stats.disconnects += 1
+
+    async def _answer(self, message: Dict[str, Any]) -> None:
+        args = self.simulation.args
+        rng = self.simulation.random
+        if rng.random() < args.reply_drop:
+            return
+        await asyncio.sleep(max(0.0, rng.gauss(args.reply_latency, args.reply_jitter)) / 1000)
+        message_type = message['type']
+        reply: Dict[str, Any] = {'request_id': message['request_id']}
+        if message_type == 'CHECK_PLAYER':
+            reply.update(type='PLAYER_STATUS', ign=message.get('ign'), online=rng.random() < args.online_fraction)
+        elif message_type == 'WARP_PLAYERS':
+            reply.update(type='WARP_SUCCESS', game_id=message.get('game_id'))
+        else:
+            reply.update(
+                type='CALL_SUCCESS',
+                requester_ign=message.get('requester_ign'),
+                target_ign=message.get('target_ign')
+            )
+        try:
+            await self.ws.send_str(json.dumps(reply))
+            self.simulation.stats.server_replies[message_type] += 1
+        except Exception:
+            self.simulation.stats.send_errors += 1
+
+
+class LoadTest:
+    SERVER_REQUESTS = {'CHECK_PLAYER', 'WARP_PLAYERS', 'CALL_CMD'}
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.stats = LoadStats()
+        self.ids = itertools.count(1)
+        self.clients: List[PluginClient] = []
+        self.stopping = False
+        self.igns = self._load_igns()
+
+    def _load_igns(self) -> List[str]:
+        if self.args.ign_file:
+            with open(self.args.ign_file) as ign_file:
+                igns = [line.strip() for line in ign_file if line.strip()]
+            if igns:
+                return igns
+        return [f'LoadTest{index}' for index in range(self.args.players)]
+
+    def _scoring_message(self) -> Dict[str, Any]:
+        rng = self.random
+        players = rng.sample(self.igns, min(len(self.igns), 8))
+        game_id = str(rng.choice(self.args.game_ids)) if self.args.game_ids else str(rng.randint(1, 100000))
+        return {
+            'type': 'SCORING',
+            'gameid': game_id,
+            'winningTeamNumber': rng.randint(1, 2),
+            'mvps': players[:1],
+            'bedsbroken': players[:2],
+            'players': {
+                ign: {
+                    'kills': rng.randint(0, 15), 'deaths': rng.randint(0, 10), 'bedbroken': index < 2,
+                    'finalkills': rng.randint(0, 4), 'diamonds': rng.randint(0, 20), 'irons': rng.randint(0, 300),
+                    'gold': rng.randint(0, 100), 'emeralds': rng.randint(0, 10), 'blocksplaced': rng.randint(0, 500)
+                }
+                for index, ign in enumerate(players)
+            }
+        }
+
+    def _build(self, kind: str) -> Dict[str, Any]:
+        if kind == 'scoring':
+            return self._scoring_message()
+        if kind == 'queue':
+            return {'type': 'QUEUEFROMINGAME', 'ign': self.random.choice(self.igns), 'queue_type': self.args.queue_type}
+        if kind == 'call':
+            requester, target = self.random.sample(self.igns, 2) if len(self.igns) > 1 else (self.igns[0],) * 2
+            return {'type': 'CALL_CMD', 'requester_ign': requester, 'target_ign': target}
+        return {'type': 'ping'}
+
+    async def _generate(self, kind: str, rate: float, deadline: float) -> None:
+        if rate <= 0:
+            return
+        tasks = set()
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.random.expovariate(rate))
+            if loop.time() >= deadline:
+                break
+            live = [client for client in self.clients if client.connected]
+            if not live:
+                self.stats.send_errors += 1
+                continue
+            task = asyncio.create_task(self.random.choice(live).send(kind, self._build(kind)))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _sample_memory(self, started: float) -> None:
+        if not self.args.server_pid:
+            return
+        while True:
+            rss = read_rss_mb(self.args.server_pid)
+            if rss is not None:
+                self.stats.memory.append((time.perf_counter() - started, rss))
+            await asyncio.sleep(self.args.memory_interval)
+
+    async def run(self) -> Dict[str, Any]:
+        args = self.args
+        connector = aiohttp.TCPConnector(limit=0)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            self.clients = [PluginClient(index, self, index < args.responders) for index in range(args.clients)]
+            results = await asyncio.gather(*(client.connect(session) for client in self.clients), return_exceptions=True)
+            failed = [result for result in results if isinstance(result, Exception)]
+            if failed:
+                logging.warning(f"{len(failed)} of {len(self.clients)} clients failed to connect: {failed[0]}")
+            if len(failed) == len(self.clients):
+                raise ConnectionError(f"Could not connect to {args.url}: {failed[0]}")
+
+            started = time.perf_counter()
+            cpu_started = time.process_time()
+            memory_task = asyncio.create_task(self._sample_memory(started))
+            deadline = asyncio.get_running_loop().time() + args.duration
+            await asyncio.gather(
+                self._generate('scoring', args.scoring_rate, deadline),
+                self._generate('queue', args.queue_rate, deadline),
+                self._generate('call', args.call_rate, deadline),
+                self._generate('ping', args.ping_rate, deadline)
+            )
+
+            drain_deadline = time.perf_counter() + args.reply_timeout
+            while any(client.pending for client in self.clients) and time.perf_counter() < drain_deadline:
+                await asyncio.sleep(0.05)
+            wall = time.perf_counter() - started
+            cpu = time.process_time() - cpu_started
+
+            memory_task.cancel()
+            await asyncio.gather(memory_task, return_exceptions=True)
+            for client in self.clients:
+                for kind, _ in client.pending.values():
+                    self.stats.dropped[kind] += 1
+            self.stopping = True
+            await asyncio.gather(*(client.close() for client in self.clients), return_exceptions=True)
+
+        return self.report(wall, cpu, len(failed))
+
+    def report(self, wall: float, cpu: float, connect_failures: int) -> Dict[str, Any]:
+        stats = self.stats
+        all_latencies = [latency for latencies in stats.latencies.values() for latency in latencies]
+        completed = len(all_latencies)
+        report: Dict[str, Any] = {
+            'clients': self.args.clients,
+            'connect_failures': connect_failures,
+            'disconnects': stats.disconnects,
+            'sent': sum(stats.sent.values()),
+            'completed': completed,
+            'dropped': sum(stats.dropped.values()),
+            'late': stats.late,
+            'send_errors': stats.send_errors,
+            'throughput_per_second': round(completed / wall, 2) if wall else 0.0,
+            'latency_p50_ms': round(percentile(all_latencies, 50) * 1000, 2),
+            'latency_p99_ms': round(percentile(all_latencies, 99) * 1000, 2),
+            'latency_max_ms': round(max(all_latencies, default=0.0) * 1000, 2),
+            'by_type': {
+                kind: {
+                    'sent': stats.sent[kind],
+                    'completed': len(stats.latencies.get(kind, [])),
+                    'dropped': stats.dropped[kind],
+                    'p50_ms': round(percentile(stats.latencies.get(kind, []), 50) * 1000, 2),
+                    'p99_ms': round(percentile(stats.latencies.get(kind, []), 99) * 1000, 2)
+                }
+                for kind in sorted(stats.sent)
+            },
+            'received': dict(stats.received),
+            'server_requests': dict(stats.server_requests),
+            'server_replies': dict(stats.server_replies),
+            'client_cpu_seconds': round(cpu, 3),
+            'wall_seconds': round(wall, 3)
+        }
+        if stats.memory:
+            first, peak, last = stats.memory[0][1], max(rss for _, rss in stats.memory), stats.memory[-1][1]
+            report.update(
+                server_rss_start_mb=round(first, 1),
+                server_rss_peak_mb=round(peak, 1),
+                server_rss_end_mb=round(last, 1),
+                server_rss_growth_mb=round(last - first, 1)
+            )
+        return report
+
+
+def default_url() -> str:
+    config = ConfigManager().section('websocket')
+    host = config.get('host', 'localhost')
+    if host in ('0.0.0.0', '::', ''):
+        host = 'localhost'
+    return f"ws://{host}:{config.get('port', 8080)}{config.get('path', '/rbw/websocket')}"
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Load-test the bot WebSocket endpoint with simulated plugin clients.')
+    parser.add_argument('--url', help='WebSocket URL (defaults to the websocket section of configs/config.yml)')
+    parser.add_argument('--clients', type=int, default=10, help='Number of simulated plugin connections')
+    parser.add_argument('--responders', type=int, default=1, help='Clients that answer server requests')
+    parser.add_argument('--duration', type=float, default=60.0, help='Seconds to generate traffic')
+    parser.add_argument('--scoring-rate', type=float, default=1.0, help='SCORING messages per second (Poisson)')
+    parser.add_argument('--queue-rate', type=float, default=5.0, help='QUEUEFROMINGAME messages per second (Poisson)')
+    parser.add_argument('--call-rate', type=float, default=2.0, help='CALL_CMD messages per second (Poisson)')
+    parser.add_argument('--ping-rate', type=float, default=10.0, help='Bare pings per second (Poisson)')
+    parser.add_argument('--queue-type', default='4v4', help='queue_type sent with QUEUEFROMINGAME')
+    parser.add_argument('--players', type=int, default=200, help='Synthetic IGNs to generate when --ign-file is not given')
+    parser.add_argument('--ign-file', help='File with one registered IGN per line')
+    parser.add_argument('--game-ids', nargs='*', help='Game ids to use in SCORING messages')
+    parser.add_argument('--reply-latency', type=float, default=50.0, help='Mean milliseconds before answering server requests')
+    parser.add_argument('--reply-jitter', type=float, default=20.0, help='Standard deviation of the reply latency in ms')
+    parser.add_argument('--reply-drop', type=float, default=0.0, help='Fraction of server requests left unanswered')
+    parser.add_argument('--online-fraction', type=float, default=1.0, help='Fraction of CHECK_PLAYER replies reporting online')
+    parser.add_argument('--reply-timeout', type=float, default=10.0, help='Seconds before an unanswered message counts as dropped')
+    parser.add_argument('--server-pid', type=int, help='Bot process id to sample resident memory from /proc')
+    parser.add_argument('--memory-interval', type=float, default=1.0, help='Seconds between memory samples')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    parser.add_argument('--max-p99-ms', type=float, help='Exit non-zero if p99 latency exceeds this many ms')
+    parser.add_argument('--max-dropped', type=int, help='Exit non-zero if more messages than this are dropped')
+    parser.add_argument('--max-memory-growth', type=float, help='Exit non-zero if server RSS grows by more MB than this')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args(argv)
+    if args.server_pid and not os.path.exists(f'/proc/{args.server_pid}'):
+        parser.error(f'--server-pid {args.server_pid} is not a running process')
+    args.url = args.url or default_url()
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+
+    try:
+        report = asyncio.run(LoadTest(args).run())
+    except ConnectionError as e:
+        print(f"FAIL: {e}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key, value in report.items():
+            print(f"{key:>26}: {value}")
+
+    failures = []
+    if args.max_p99_ms is not None and report['latency_p99_ms'] > args.max_p99_ms:
+        failures.append(f"p99 latency {report['latency_p99_ms']}ms > {args.max_p99_ms}ms")
+    if args.max_dropped is not None and report['dropped'] > args.max_dropped:
+        failures.append(f"{report['dropped']} dropped messages > {args.max_dropped}")
+    if args.max_memory_growth is not None and report.get('server_rss_growth_mb', 0.0) > args.max_memory_growth:
+        failures.append(f"server RSS grew {report['server_rss_growth_mb']}MB > {args.max_memory_growth}MB")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
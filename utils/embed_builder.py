@@ -1,7 +1,6 @@
 import discord
 from typing import Optional
-import yaml
-import os
+from managers.config_manager import ConfigManager
 
 class EmbedBuilder:
     def __init__(self):
@@ -25,11 +24,8 @@ class EmbedBuilder:
         self.server_name = self.load_server_name()
 
     def load_server_name(self) -> str:
-        config_path = os.path.join('configs', 'config.yml')
         try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                return config.get('server', {}).get('servername', 'Ranked Bedwars')
+            return ConfigManager().section('server').get('servername', 'Ranked Bedwars')
         except Exception as e:
             print(f"Failed to load server name: {e}")
             return "Ranked Bedwars"
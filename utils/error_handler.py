@@ -3,12 +3,11 @@ from discord.ext import commands
 from typing import Optional, Union
 import traceback
 import sys
-from managers.permission_manager import PermissionManager
 
 class ErrorHandler(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.permission_manager = PermissionManager()  
+        self.permission_manager = bot.services.permission_manager  
 
     async def handle_error(self, error: Exception, context: str = '') -> None:
         error_trace = ''.join(traceback.format_exception(type(error), error, error.__traceback__))
@@ -0,0 +1,27 @@
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupTimer:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def report(self) -> str:
+        width = max([len(name) for name, _ in self.phases] + [5])
+        lines = ['Startup timing:']
+        lines.extend(f"  {name:<{width}} {duration * 1000:>9.1f}ms" for name, duration in self.phases)
+        lines.append(f"  {'total':<{width}} {self.elapsed() * 1000:>9.1f}ms")
+        return '\n'.join(lines)